@@ -55,16 +55,31 @@ Now wat?
 After installing ceg you can either do ``ceg --help`` in your terminal, check out projects README or refer to api documentation.
 
 **Note:**
-Please only refer to submodule named `api` as other files contain reference to main implementation of ceg and such
+Please only refer to submodules named `api` and `async_api`(asyncio flavour of the api) as other files contain reference to main implementation of ceg and such
 may contain ambiguous documentation which may or maynot be clear unless codebase is understood.
 
 """
 
+from typing import Any
 from .misc import UtilInfo
-from .api import CegApi
+
+__all__ = ("CegApi", "AsyncCegApi", "UtilInfo")
 
 
 __author__ = "Justaus3r"
 __email__ = "x-neron@pm.me"
 __version__ = UtilInfo.VERSION
 __description__ = UtilInfo.DESCRIPTION
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the apis,so that `import ceg`(and the cli) doesn't pay for requests/rich/aiohttp."""
+    if name == "CegApi":
+        from .api import CegApi
+
+        return CegApi
+    if name == "AsyncCegApi":
+        from .async_api import AsyncCegApi
+
+        return AsyncCegApi
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,86 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Multi-account backup sources """
+
+import re
+from .exceptions import CegExceptions
+from typing import List, Dict, Iterable, Optional
+
+__all__ = ("load_accounts",)
+
+USERNAME_PATTERN: "re.Pattern[str]" = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?$")
+
+
+def load_accounts(specs: Iterable[str]) -> List[Dict[str, Optional[str]]]:
+    """Load the accounts to back up.
+
+    Every spec can either be:
+    - a github username(optionally prefixed with `user:`),whose public gists are backed up
+      using the shared secret key(if any).
+    - `token:<secret key>`,all the gists of whose owner are backed up.
+    - `@<path>`,a file containing one of the above per line(blank lines and `#` comments are skipped),
+      which keeps the secret keys out of the process list.
+
+    Args:
+        specs: account specs.
+
+    Returns:
+        A list of accounts without duplicates,each containing the `label`(username,or `token#<n>` so
+        that secret keys never end up in logs),`user` and `secret_key` keys.
+    """
+    accounts: List[Dict[str, Optional[str]]] = []
+    seen_accounts: set = set()
+    for spec in _expand_specs(specs):
+        if spec.startswith("token:"):
+            secret_key: str = spec[len("token:") :].strip()
+            if not secret_key:
+                raise CegExceptions.BadManifest("Expected a secret key after `token:`!")
+            if ("token", secret_key) in seen_accounts:
+                continue
+            seen_accounts.add(("token", secret_key))
+            accounts.append(
+                {"label": f"token#{len(accounts)}", "user": None, "secret_key": secret_key}
+            )
+            continue
+        user_name: str = spec[len("user:") :] if spec.startswith("user:") else spec
+        if not USERNAME_PATTERN.match(user_name):
+            raise CegExceptions.BadManifest(f"'{user_name}' is not a valid github username!")
+        # usernames are case insensitive
+        if ("user", user_name.lower()) in seen_accounts:
+            continue
+        seen_accounts.add(("user", user_name.lower()))
+        accounts.append({"label": user_name, "user": user_name, "secret_key": None})
+    return accounts
+
+
+def _expand_specs(specs: Iterable[str]) -> Iterable[str]:
+    for spec in specs:
+        spec = spec.strip()
+        if not spec.startswith("@"):
+            yield spec
+            continue
+        with open(spec[1:], "r", encoding="utf-8") as r_obj:
+            for line in r_obj:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    yield line
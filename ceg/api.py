@@ -35,6 +35,41 @@ Object instantiation:
 cgi = CegApi(secret_key="abcd")
 # note that for using an instance for unauthenticated user, set secret_key to `None`
 ```
+All the operations of an instance share a single pooled http session,which can be tuned and
+should be closed once done with the instance:
+```
+with CegApi(secret_key="abcd", pool_maxsize=20) as cgi:
+    cgi.backup()
+# or call `cgi.close()` explicitly
+```
+Every call keeps its own request state,so a single instance(and its pooled connections) can be
+shared between threads,i.e the workers of a web service:
+```
+with ThreadPoolExecutor() as executor:
+    executor.submit(cgi.list_other, "justaus3r")
+    executor.submit(cgi.get, "abcd1234")
+```
+Requests are paced according to github's rate limit and paused(instead of failing) once it's exhausted,
+the remaining budget can be inspected for planning batch jobs:
+```
+print(cgi.rate_limit["remaining"], cgi.rate_limit["reset"])
+```
+Transient failures are retried with an exponential backoff,which can be tuned:
+```
+cgi = CegApi(secret_key="abcd", retry_policy=RetryPolicy(retries=5, backoff=1.0))
+# `from ceg.retry import RetryPolicy`
+```
+Listings and gists are kept in a bounded in-memory cache for a minute,so repeated reads are served
+locally.post/patch/delete drop the entries they affect:
+```
+cgi = CegApi(secret_key="abcd", metadata_cache_size=256, metadata_ttl=300)
+cgi.metadata_cache.clear()  # force the next reads to hit the api
+```
+Listings are also kept in a local SQLite store,which can be filtered and queried offline:
+```
+python_gists = cgi.list(language="python", updated_since="2022-08-01")
+notes = cgi.list(offline=True, filename="*.md", public=False)
+```
 For creating a gist:
 ```
 gist_url = cgi.post("file1.py", "file2.py", "dirty_secrets.verysecurefile", is_private=False, gist_description="bla")
@@ -42,6 +77,12 @@ gist_url = cgi.post("file1.py", "file2.py", "dirty_secrets.verysecurefile", is_p
 # it in your default file editor.
 ```   
 
+For creating gists in bulk(from a json/csv manifest or a directory-per-gist layout):
+```
+gist_urls = cgi.post_bulk("reports/", is_private=True, max_workers=8)
+# maps every entry to the url of its gist,or the exception it failed with
+```
+
 For modifying an existing gist:
 ```
 response_str = cgi.patch("file2.py", gist_id="abc")
@@ -51,6 +92,9 @@ response_str = cgi.patch("file2.py", gist_id="abc")
 For listing gists for authenticated user:
 ```
 user_gist_list = cgi.list()
+# every gist is a lightweight `ceg.records.GistRecord`
+for gist in user_gist_list:
+    print(gist.id, gist.public, gist.description, gist.file_names)
 ```
 
 For list gist for unauthenticated user:
@@ -58,6 +102,15 @@ For list gist for unauthenticated user:
 user_gist_list = cgi.list_other("username")
 ```
 
+For lazily iterating over all the gists(fetched page by page):
+```
+for gist in cgi.iter_gists():
+    print(gist["id"])
+# or for unauthenticated users
+for gist in cgi.iter_gists_of("username"):
+    print(gist["html_url"])
+```
+
 For downloading a gist:
 ```
 response_str = cgi.get("gistid1", "gistid2")
@@ -71,20 +124,58 @@ For creating a backup:
 response_str = cgi.backup()
 # or for unauthenticated users
 response_str = cgi.backup(username="myusername")
+# only download what changed since the last backup
+response_str = cgi.backup(incremental=True)
+# or stream everything into a single compressed archive(GIST-BACKUP-<timestamp>.tar.xz)
+response_str = cgi.backup(archive="xz")
+# or record a deduplicated snapshot,and only keep a week of them
+response_str = cgi.backup(snapshot_dir="GIST-SNAPSHOTS")
+dropped_snapshots = cgi.prune_snapshots("GIST-SNAPSHOTS", keep_daily=7)
+```
+
+For backing up many accounts at once(over the pooled connections,every token paced by its own rate limit budget),every account
+into its own directory(i.e `GIST-BACKUP/username`):
+```
+summaries = cgi.backup_accounts(["justaus3r", "token:ghp_abcd", "@team-accounts.txt"], max_accounts=8)
+for account, summary in summaries.items():
+    print(account, summary["root"], summary["gists"], summary["error"] or len(summary["failures"]))
+```
+
+For keeping a directory in sync with a gist(both ways,conflicting changes are reported and left alone):
+```
+outcome = cgi.sync("notes/", "aa5a315d61ae9438b18d")
+print(outcome["upload"], outcome["download"], outcome["conflicts"])
+```
+
+For searching the contents of a backup(using its local index,without any network access):
+```
+for result in cgi.search("retry backoff", backup_dir="GIST-BACKUP"):
+    print(result["gist_id"], result["file"], result["line"], result["text"])
 ```
 
-For deleting a gist:
+For deleting gists:
 ```
-cgi.delete("gistid")
-# doesn't support batch operation for now 
+outcomes = cgi.delete("gistid1", "gistid2", max_workers=8)
+# maps every gist-id to its response status string,or the exception its deletion failed with
+failed = [gist_id for gist_id, outcome in outcomes.items() if isinstance(outcome, Exception)]
 ```
 
 Api Reference
 -------------
 """
 
+import os
+import sqlite3
 from .ceg import Ceg
-from typing import List, Dict, Optional
+from .cache import HttpCache, MetadataCache
+from .store import MetadataStore
+from .records import GistRecord
+from .retry import RetryPolicy
+from .ratelimit import RateLimitGovernor
+from typing import List, Dict, Optional, Iterator, Iterable, Union, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .session import CegSession
 
 
 class CegApi:
@@ -92,14 +183,86 @@ class CegApi:
 
     Provides the main interface open for api.contains all
     the methods needed to perform all basic operations on gists.
+    every call runs on its own Ceg instance(sharing the pooled session,
+    caches and rate limit budget of the CegApi instance),so a single
+    instance can be reused and shared between threads.
 
     Attributes:
         ceg_instance: its an instance of Ceg class.which contains the main
-                      implementation of ceg utility.
+                      implementation of ceg utility,it holds the defaults(i.e
+                      max_workers) every call starts from and is never mutated by calls.
+        session: pooled http session reused by every operation of the instance.
+        metadata_cache: in-memory cache of listings and gists,invalidated by post/patch/delete.
+        metadata_store: (Optional) local SQLite store of listings,used for filtered/offline listing.
     """
 
-    def __init__(self, secret_key: str) -> None:
-        """Inits CegApi with github secret key"""
+    def __init__(
+        self,
+        secret_key: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        use_http_cache: bool = True,
+        cache_dir: Optional[str] = None,
+        governor: Optional[RateLimitGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metadata_cache_size: int = 128,
+        metadata_ttl: Optional[float] = 60.0,
+        use_metadata_store: bool = True,
+        http_cache_size: int = 1024,
+    ) -> None:
+        """Inits CegApi with github secret key and connection pool configuration.
+
+        The on-disk caches are left out if cache_dir(or the default cache directory) isn't writable.
+
+        Args:
+            secret_key: github secret key.
+            pool_connections: number of per-host connection pools to cache.
+            pool_maxsize: maximum number of connections kept alive per host.
+            pool_block: whether to block(instead of opening throwaway connections) once
+                        pool_maxsize connections to a host are in use.
+            keep_alive: whether to keep connections alive between requests.
+            use_http_cache: whether to send listing requests conditionally using the on-disk http cache.
+            cache_dir: (Optional) cache directory,defaults to `$XDG_CACHE_HOME/ceg`.
+            governor: (Optional) rate limit governor,can be shared between instances using the same credentials.
+            retry_policy: (Optional) retry policy for transient failures,defaults to `RetryPolicy()`.
+            metadata_cache_size: maximum number of cached listings/gists,0 disables the metadata cache.
+            metadata_ttl: seconds for which cached listings/gists are reused,None for no expiry.
+            use_metadata_store: whether to keep listings in a local SQLite store(under cache_dir).
+            http_cache_size: maximum number of responses kept in the on-disk http cache.
+        """
+        # imported lazily as requests is quite heavy to import
+        from .session import CegSession
+
+        self.session: CegSession = CegSession(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            governor=governor,
+            retry_policy=retry_policy,
+        )
+        self.metadata_cache: MetadataCache = MetadataCache(
+            maxsize=metadata_cache_size, ttl=metadata_ttl
+        )
+        self.metadata_store: Optional[MetadataStore] = None
+        if use_metadata_store:
+            try:
+                self.metadata_store = MetadataStore(
+                    os.path.join(cache_dir, "metadata.sqlite3") if cache_dir else None
+                )
+            except (OSError, sqlite3.Error):
+                # listing still works without the store,just not offline
+                self.metadata_store = None
+        http_cache: Optional[HttpCache] = None
+        if use_http_cache:
+            try:
+                http_cache = HttpCache(cache_dir, max_entries=http_cache_size)
+            except OSError:
+                # an unwritable cache directory shouldn't prevent api calls
+                http_cache = None
+        self.__secret_key: Optional[str] = secret_key
         self.ceg_instance: Ceg = Ceg(
             operation="",
             arg_value="",
@@ -110,24 +273,101 @@ class CegApi:
             gist_no_public=False,
             gist_desc="",
             gist_id="",
+            session=self.session,
+            http_cache=http_cache,
+            metadata_cache=self.metadata_cache,
+            metadata_store=self.metadata_store,
         )
 
-    def get(self, *args: str, username: Optional[str] = None) -> str:
+    def __ceg(
+        self,
+        operation: str,
+        arg_value: Optional[Any] = "",
+        max_workers: Optional[int] = None,
+        **attributes: Any,
+    ) -> Ceg:
+        """Return a Ceg for a single call.
+
+        Args:
+            operation: http operation of the call.
+            arg_value: argument value of the call.
+            max_workers: (Optional) upper bound on number of concurrent requests,
+                         defaults to the one of ceg_instance.
+            **attributes: Ceg attributes to set for the call.
+
+        Returns:
+            Ceg sharing the session and caches of ceg_instance.
+        """
+        ceg_obj: Ceg = Ceg(
+            operation=operation,
+            arg_value=arg_value,
+            is_recursive_operation=False,
+            is_other_user=False,
+            secret_key=self.__secret_key,
+            do_logging=False,
+            gist_no_public=False,
+            gist_desc="",
+            gist_id="",
+            session=self.session,
+            max_workers=max_workers or self.ceg_instance.max_workers,
+            http_cache=self.ceg_instance.http_cache,
+            metadata_cache=self.metadata_cache,
+            metadata_store=self.metadata_store,
+        )
+        for attribute, value in attributes.items():
+            setattr(ceg_obj, attribute, value)
+        return ceg_obj
+
+    @property
+    def rate_limit(self) -> Dict[str, Any]:
+        """Snapshot of the rate limit budget.
+
+        Contains the `limit`,`remaining` and `used` requests of the current window,
+        the epoch time at which it `reset`s and the epoch time until which requests
+        are `paused_until`(due to an exhausted budget or a secondary rate limit).
+        """
+        return self.session.governor.state()
+
+    def close(self) -> None:
+        """Close all the pooled connections(and metadata store) of the instance."""
+        self.session.close()
+        if self.metadata_store is not None:
+            self.metadata_store.close()
+
+    def __enter__(self) -> "CegApi":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def get(
+        self,
+        *args: str,
+        username: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> str:
         """Downloads a gist.
 
-        Receives arbitrary amount gist-ids and downloads them.
+        Receives arbitrary amount gist-ids and downloads them concurrently.
 
         Args:
             *args: Variable lenght argument list containing gist-ids.
-
+            username: (Optional) username,for downloading gists of unauthenticated user.
+            max_workers: (Optional) upper bound on number of concurrent downloads.
 
         Returns:
             Returns HTTP call response status in string format.
+
+        Raises:
+            IncompleteOperation: raised if one or more gists failed to download,after the rest are done.
         """
-        self.ceg_instance.http_operation = "get"
-        self.ceg_instance.arg_val = list(("user:" + username, ) + args) if username else list(args) #type: ignore
-        self.ceg_instance.get()
-        return self.ceg_instance.response_status_str
+        ceg_obj: Ceg = self.__ceg(
+            "get",
+            ["user:" + username, *args] if username else list(args),
+            max_workers=max_workers,
+        )
+        ceg_obj.get()
+        return ceg_obj.response_status_str
 
     def post(
         self,
@@ -145,80 +385,320 @@ class CegApi:
         Returns:
             Returns HTML url for newly created gist.
         """
-        self.ceg_instance.http_operation = "post"
-        self.ceg_instance.arg_val = args
-        self.ceg_instance.gist_no_public = is_private
-        self.ceg_instance.gist_description = gist_description
+        ceg_obj: Ceg = self.__ceg(
+            "post",
+            args,
+            gist_no_public=is_private,
+            gist_description=gist_description,
+        )
         # type casting because of distinct variable types(i.e Optional[str] and str)
         # and so so mypy will complain if not type casted
-        gist_html_url: str = str(self.ceg_instance.post())
+        gist_html_url: str = str(ceg_obj.post())
         return gist_html_url
 
+    def post_bulk(
+        self,
+        source: str,
+        is_private: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Union[str, BaseException]]:
+        """Create gists in bulk,concurrently.
+
+        Args:
+            source: path to a json/csv manifest,or a directory whose every sub-directory
+                    becomes a gist(check `ceg.bulk.load_bulk_entries` for the formats).
+            is_private: default visibility of entries which don't specify one.
+            max_workers: (Optional) upper bound on number of concurrently created gists.
+
+        Returns:
+            Returns a mapping of every entry name to the HTML url of its gist,
+            or the exception it failed with.
+        """
+        ceg_obj: Ceg = self.__ceg(
+            "post", source, max_workers=max_workers, gist_no_public=is_private
+        )
+        return ceg_obj.post_bulk(raise_on_failure=False)
+
     def patch(
         self, *args: str, gist_id: str, gist_description: Optional[str] = None
     ) -> str:
         """Modify arbitrary number of existing gists.
 
+        Only files differing from the gist are uploaded,the gist isn't written at all if nothing changed.
+
         Args:
-             *args: variable lenght arguments list containing gist-names.
+             *args: variable lenght arguments list containing gist-names(`old->new` renames a file,
+                    `name->` deletes it).
              gist_id: gist-id for the gist,that is to be modified.
              gist_description: (Optional) Description for the gist.
 
         Returns:
-            Returns HTTP call response status in string format.
+            Returns HTTP call response status in string format(`Not Modified!` if nothing changed).
         """
-        self.ceg_instance.http_operation = "patch"
-        self.ceg_instance.arg_val = list(args)  # type: ignore
-        self.ceg_instance.gist_description = gist_description
-        self.ceg_instance.gist_id = gist_id
-        self.ceg_instance.patch()
-        return self.ceg_instance.response_status_str
+        ceg_obj: Ceg = self.__ceg(
+            "patch",
+            list(args),
+            gist_description=gist_description,
+            gist_id=gist_id,
+        )
+        ceg_obj.patch()
+        return ceg_obj.response_status_str
 
-    def delete(self, *args) -> str:
-        """Delete an existing gist.
+    def delete(
+        self, *args: str, max_workers: Optional[int] = None
+    ) -> Dict[str, Union[str, BaseException]]:
+        """Delete existing gists concurrently.
 
         Args:
-        gist_id = arbitrary amount of gist-ids.
+            *args: arbitrary amount of gist-ids.
+            max_workers: (Optional) upper bound on number of concurrent deletions.
 
         Returns:
-            Returns HTTP call response status in string format.
+            Returns a mapping of every gist-id to its outcome,i.e HTTP call response status
+            in string format on success or the exception the deletion failed with.
         """
-        self.ceg_instance.http_operation = "delete"
-        self.ceg_instance.arg_val = args
-        self.ceg_instance.delete()
-        return self.ceg_instance.response_status_str
+        ceg_obj: Ceg = self.__ceg("delete", args, max_workers=max_workers)
+        return ceg_obj.delete(raise_on_failure=False)
 
-    def list(self) -> Optional[List[Dict[str, str]]]:
+    def list(
+        self,
+        offline: bool = False,
+        language: Optional[str] = None,
+        filename: Optional[str] = None,
+        updated_since: Optional[str] = None,
+        public: Optional[bool] = None,
+    ) -> List[GistRecord]:
         """Return gist data for authenticated user.
 
+        Args:
+            offline: answer from the metadata store,without fetching the listing.
+            language: (Optional) only gists having a file of this language.
+            filename: (Optional) only gists having a file whose name matches this glob pattern.
+            updated_since: (Optional) only gists updated since this ISO 8601 date/time.
+            public: (Optional) only public(True) or private(False) gists.
+
         Returns:
-            Returns a sequence containing list of all the gists of user with some info.
+            Returns a list of records(`ceg.records.GistRecord`) of all the gists of user.
         """
-        self.ceg_instance.http_operation = "get"
-        return self.ceg_instance.list()
+        ceg_obj: Ceg = self.__ceg(
+            "get",
+            "self",
+            **self.__list_attributes(offline, language, filename, updated_since, public),
+        )
+        return ceg_obj.list()  # type: ignore
 
-    def list_other(self, user_name: str) -> Optional[List[Dict[str, str]]]:
+    def list_other(
+        self,
+        user_name: str,
+        offline: bool = False,
+        language: Optional[str] = None,
+        filename: Optional[str] = None,
+        updated_since: Optional[str] = None,
+        public: Optional[bool] = None,
+    ) -> List[GistRecord]:
         """Return gist data for unauthenticated user.
 
         Args:
             user_name: username for the user.
+            offline: answer from the metadata store,without fetching the listing.
+            language: (Optional) only gists having a file of this language.
+            filename: (Optional) only gists having a file whose name matches this glob pattern.
+            updated_since: (Optional) only gists updated since this ISO 8601 date/time.
+            public: (Optional) only public(True) or private(False) gists.
+
+        Returns:
+            Returns a list of records(`ceg.records.GistRecord`) of all the public gists of user.
+        """
+        ceg_obj: Ceg = self.__ceg(
+            "get",
+            "user:" + user_name,
+            **self.__list_attributes(offline, language, filename, updated_since, public),
+        )
+        return ceg_obj.list_other()  # type: ignore
+
+    @staticmethod
+    def __list_attributes(
+        offline: bool,
+        language: Optional[str],
+        filename: Optional[str],
+        updated_since: Optional[str],
+        public: Optional[bool],
+    ) -> Dict[str, Any]:
+        list_filters: Dict[str, Any] = {
+            filter_name: filter_value
+            for filter_name, filter_value in (
+                ("language", language),
+                ("filename", filename),
+                ("updated_since", updated_since),
+                ("public", public),
+            )
+            if filter_value is not None
+        }
+        return {"offline": offline, "list_filters": list_filters}
+
+    def prune_snapshots(
+        self,
+        snapshot_dir: str = "GIST-SNAPSHOTS",
+        keep_last: Optional[int] = None,
+        keep_daily: Optional[int] = None,
+    ) -> List[str]:
+        """Drop the backup snapshots outside a retention policy.
+
+        Args:
+            snapshot_dir: snapshot store.
+            keep_last: (Optional) keep the given number of most recent snapshots.
+            keep_daily: (Optional) keep the latest snapshot of each of the given number of most recent days.
+
+        Returns:
+            Returns ids of the dropped snapshots.
+        """
+        ceg_obj: Ceg = self.__ceg(
+            "prune_snapshots",
+            snapshot_dir,
+            snapshot_dir=snapshot_dir,
+            keep_last=keep_last,
+            keep_daily=keep_daily,
+        )
+        return ceg_obj.prune_snapshots()
+
+    def sync(
+        self, directory: str, gist_id: str, max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Sync a directory with a gist,both ways.
+
+        Files changed on one side since the last sync are uploaded/downloaded,files changed on
+        both sides are reported as conflicts and left untouched.re-syncing an unchanged directory
+        costs a single conditional request.
+
+        Args:
+            directory: the synced directory,which keeps the state of the sync(`.ceg-sync.json`).
+            gist_id: gist-id of the synced gist.
+            max_workers: (Optional) upper bound on number of concurrent downloads.
+
+        Returns:
+            Returns the names of the files that were uploaded(`upload`),downloaded(`download`),
+            deleted(`delete_remote`/`delete_local`) or conflicted(`conflicts`),along with a mapping
+            of the files that failed to sync to their exceptions(`failures`).
+        """
+        ceg_obj: Ceg = self.__ceg("sync", [directory, gist_id], max_workers=max_workers)
+        return ceg_obj.sync(raise_on_failure=False)
+
+    def search(
+        self, query: str, backup_dir: str = "GIST-BACKUP", limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """Search the contents of a local backup.
+
+        Args:
+            query: words to look for.
+            backup_dir: backup directory to search.
+            limit: maximum number of results.
 
         Returns:
-            Returns a sequence containing list of all the gists of user with some info.
+            Returns the ranked results,each containing `gist_id`,`file`,`line`,`text` and `score`.
+        """
+        ceg_obj: Ceg = self.__ceg("search", query, backup_dir=backup_dir)
+        return ceg_obj.search(limit=limit)  # type: ignore
+
+    def iter_gists(self) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all the gists of authenticated user.
+
+        Gists are fetched page by page and yielded as soon as their page arrives.
+
+        Yields:
+            json-decoded mapping for every gist.
         """
-        self.ceg_instance.http_operation = "get"
-        self.ceg_instance.arg_val = user_name
-        return self.ceg_instance.list_other()
+        return self.__ceg("get").iter_gists()
+
+    def iter_gists_of(self, user_name: str) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all the public gists of a user.
 
-    def backup(self, username: Optional[str] = None) -> str:
+        Args:
+            user_name: username for the user.
+
+        Yields:
+            json-decoded mapping for every gist.
+        """
+        return self.__ceg("get").iter_gists(
+            end_point=f"https://api.github.com/users/{user_name}/gists",
+            no_header=True,
+        )
+
+    def backup(
+        self,
+        username: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        incremental: bool = False,
+        delete_removed: bool = False,
+        archive: Optional[str] = None,
+        snapshot_dir: Optional[str] = None,
+        backup_dir: str = "GIST-BACKUP",
+    ) -> str:
         """Create backup of all gists on local media.
 
+        Args:
+            username: (Optional) username,for backing up gists of unauthenticated user.
+            max_workers: (Optional) upper bound on number of concurrent downloads.
+            incremental: update an existing backup,only downloading gists added/changed since the last backup.
+            delete_removed: in incremental mode,delete(instead of archiving) gists removed since the last backup.
+            archive: (Optional) compression(`gz`/`xz`) of a single tar archive to stream the gists into,
+                     instead of a directory per gist.
+            snapshot_dir: (Optional) snapshot store to record a deduplicated snapshot in,instead of
+                          a directory per gist.
+            backup_dir: directory to back up the gists in(or next to,for archives).
+
         Returns:
             Returns HTTP call response status in string format.
         """
-        self.ceg_instance.http_operation = "get"
-        self.ceg_instance.is_recursive_op = True
-        if username:
-            self.ceg_instance.arg_val = "user:" + username
-        self.ceg_instance.backup()
-        return self.ceg_instance.response_status_str
+        ceg_obj: Ceg = self.__ceg(
+            "get",
+            "user:" + username if username else "",
+            max_workers=max_workers,
+            is_recursive_op=True,
+            incremental=incremental,
+            delete_removed=delete_removed,
+            archive_format=archive,
+            snapshot_dir=snapshot_dir,
+            backup_dir=backup_dir,
+        )
+        ceg_obj.backup()
+        return ceg_obj.response_status_str
+
+    def backup_accounts(
+        self,
+        accounts: Iterable[str],
+        backup_dir: str = "GIST-BACKUP",
+        max_accounts: int = 4,
+        max_workers: Optional[int] = None,
+        incremental: bool = False,
+        delete_removed: bool = False,
+        archive: Optional[str] = None,
+        snapshot_dir: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Back up the gists of many accounts concurrently,over the pooled connections of the instance.
+
+        Args:
+            accounts: github usernames,`token:<secret key>` entries or `@<path>` files listing them
+                      (check `ceg.accounts.load_accounts` for the format).
+            backup_dir: directory containing a backup directory per account.
+            max_accounts: upper bound on number of concurrently backed up accounts.
+            max_workers: (Optional) upper bound on number of concurrent downloads per account.
+            incremental: update the existing backups,only downloading gists added/changed since the last backup.
+            delete_removed: in incremental mode,delete(instead of archiving) gists removed since the last backup.
+            archive: (Optional) compression(`gz`/`xz`) of a single tar archive per account to stream the gists into.
+            snapshot_dir: (Optional) directory containing a snapshot store per account to record a snapshot in.
+
+        Returns:
+            Returns a mapping of every account name to its summary(check `Ceg.backup_accounts`).
+        """
+        ceg_obj: Ceg = self.__ceg(
+            "backup_accounts",
+            list(accounts),
+            max_workers=max_workers,
+            backup_dir=backup_dir,
+            max_accounts=max_accounts,
+            incremental=incremental,
+            delete_removed=delete_removed,
+            archive_format=archive,
+            snapshot_dir=snapshot_dir,
+        )
+        return ceg_obj.backup_accounts(raise_on_failure=False)
@@ -0,0 +1,216 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Streaming compressed archive backups """
+
+import io
+import os
+import json
+import time
+import hashlib
+import tarfile
+import tempfile
+import threading
+from typing import Dict, Iterable, Optional, Set, Tuple, Any
+
+__all__ = ("ArchiveWriter", "GistArchiveHandler")
+
+
+class ArchiveWriter:
+    """Streaming writer of a compressed tar archive of gists.
+
+    Files are added as `<gist-id>/<file-name>` members while they're downloaded,the archive
+    is written as a stream(i.e without seeking) so nothing but the archive itself hits the disk.
+    since a tar header carries the size of its member,every file is spooled in memory(up to
+    `spool_size` bytes,beyond which it spills to a temporary file) before its member is written.
+    an index of the archived gists(in the format of the backup manifest) is added as the last
+    member and written next to the archive as `<archive>.index.json`.the archive is only moved
+    into place once its complete.its safe to add files from multiple threads.
+
+    Attributes:
+        COMPRESSIONS: supported compressions.
+        INDEX_NAME: name of the index member.
+        path: path of the archive.
+        index: mapping of gist-id to its index entry.
+    """
+
+    COMPRESSIONS: Tuple[str, ...] = ("gz", "xz")
+    INDEX_NAME: str = ".ceg-manifest.json"
+    VERSION: int = 1
+
+    def __init__(
+        self, path: str, compression: str = "gz", spool_size: int = 8 * 1024 * 1024
+    ) -> None:
+        """Inits ArchiveWriter and opens the archive stream.
+
+        Args:
+            path: path of the archive.
+            compression: compression of the archive,either `gz` or `xz`.
+            spool_size: maximum size of a file buffered in memory.
+        """
+        if compression not in self.COMPRESSIONS:
+            raise ValueError(f"Unsupported archive compression '{compression}'!")
+        self.path: str = path
+        self.index: Dict[str, Dict[str, Any]] = {}
+        self.__spool_size: int = spool_size
+        self.__lock: threading.Lock = threading.Lock()
+        self.__part_path: str = path + ".part"
+        self.__fileobj: io.BufferedWriter = open(self.__part_path, "wb")
+        # literal modes,so that the stream mode(and its compression) is checked statically
+        self.__tar: tarfile.TarFile = (
+            tarfile.open(fileobj=self.__fileobj, mode="w|gz")
+            if compression == "gz"
+            else tarfile.open(fileobj=self.__fileobj, mode="w|xz")
+        )
+        self.__failed_gists: Set[str] = set()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *_: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def gist_handler(self, gist_id: str) -> "GistArchiveHandler":
+        """Return a file handler writing the files of a gist into the archive."""
+        return GistArchiveHandler(self, gist_id)
+
+    def add(
+        self, gist_id: str, file_name: str, chunks: Iterable[bytes]
+    ) -> Tuple[int, str]:
+        """Add a file to the archive.
+
+        Args:
+            gist_id: gist-id of the gist the file belongs to.
+            file_name: name of the file.
+            chunks: iterable of binary chunks.
+
+        Returns:
+            A tuple containing size and sha256 hash of the content.
+        """
+        file_size: int = 0
+        hash_obj = hashlib.sha256()
+        with tempfile.SpooledTemporaryFile(max_size=self.__spool_size) as spool:
+            for chunk in chunks:
+                spool.write(chunk)
+                hash_obj.update(chunk)
+                file_size += len(chunk)
+            spool.seek(0)
+            tar_info: tarfile.TarInfo = tarfile.TarInfo(f"{gist_id}/{file_name}")
+            tar_info.size = file_size
+            tar_info.mtime = int(time.time())
+            tar_info.mode = 0o644
+            file_hash: str = hash_obj.hexdigest()
+            with self.__lock:
+                self.__tar.addfile(tar_info, spool)  # type: ignore
+                self.index.setdefault(gist_id, {"files": {}})["files"][file_name] = {
+                    "size": file_size,
+                    "sha256": file_hash,
+                }
+        return file_size, file_hash
+
+    def mark_failed(self, gist_id: str) -> None:
+        """Leave a gist out of the index,i.e once some of its files failed to download."""
+        with self.__lock:
+            self.__failed_gists.add(gist_id)
+
+    def close(self, updated_at: Optional[Dict[str, Any]] = None) -> None:
+        """Complete the archive with its index and move it into place.
+
+        Args:
+            updated_at: (Optional) mapping of gist-id to its `updated_at` timestamp,recorded in the index.
+        """
+        updated_at = updated_at or {}
+        index: Dict[str, Any] = {
+            "version": self.VERSION,
+            "gists": {
+                gist_id: {"updated_at": updated_at.get(gist_id), **entry}
+                for gist_id, entry in self.index.items()
+                if gist_id not in self.__failed_gists
+            },
+        }
+        index_bytes: bytes = json.dumps(index, indent=1).encode("utf-8")
+        tar_info: tarfile.TarInfo = tarfile.TarInfo(self.INDEX_NAME)
+        tar_info.size = len(index_bytes)
+        tar_info.mtime = int(time.time())
+        tar_info.mode = 0o644
+        with self.__lock:
+            self.__tar.addfile(tar_info, io.BytesIO(index_bytes))
+            self.__tar.close()
+            self.__fileobj.close()
+        os.replace(self.__part_path, self.path)
+        index_path: str = self.path + ".index.json"
+        with open(index_path + ".tmp", "wb") as w_obj:
+            w_obj.write(index_bytes)
+        os.replace(index_path + ".tmp", index_path)
+
+    def abort(self) -> None:
+        """Discard the incomplete archive."""
+        with self.__lock:
+            try:
+                self.__tar.close()
+            finally:
+                self.__fileobj.close()
+                os.remove(self.__part_path)
+
+
+class GistArchiveHandler:
+    """File handler for the files of a single gist inside an archive.
+
+    Stands in for `FileHandler` during archive backups.
+
+    Attributes:
+        return_code: return code,1 leaves the gist out of the archive index.
+    """
+
+    def __init__(self, archive: ArchiveWriter, gist_id: str) -> None:
+        """Inits GistArchiveHandler with the archive and gist-id"""
+        self.__archive: ArchiveWriter = archive
+        self.__gist_id: str = gist_id
+        self.__return_code: int = 0
+
+    @property
+    def return_code(self) -> int:
+        return self.__return_code
+
+    @return_code.setter
+    def return_code(self, return_code: int) -> None:
+        self.__return_code = return_code
+        if self.__return_code == 1:
+            self.__archive.mark_failed(self.__gist_id)
+
+    def write_stream(
+        self,
+        file_name: str,
+        chunks: Iterable[bytes],
+        known_hash: Optional[str] = None,
+    ) -> Tuple[int, str]:
+        """Stream binary chunks into the archive(known_hash is irrelevant for archives)."""
+        return self.__archive.add(self.__gist_id, file_name, chunks)
+
+    def exists(self, file_name: str) -> bool:
+        return False
+
+    def remove(self, file_name: str) -> None:
+        pass
@@ -74,6 +74,13 @@ class ArgumentParser(argparse.ArgumentParser):
         )
         self.add_argument("-desc", "--description", type=str, help=argparse.SUPPRESS)
 
+        group.add_argument(
+            "-pb",
+            "--post-bulk",
+            help="create a gist for every entry of a json/csv manifest or sub-directory",
+            metavar="SOURCE",
+            type=str,
+        )
         group.add_argument(
             "-pa",
             "--patch",
@@ -110,6 +117,27 @@ class ArgumentParser(argparse.ArgumentParser):
             nargs="?",
             const="self",
         )
+        # anonymous auxiliary arguments for --list
+        self.add_argument(
+            "-off", "--offline", action="store_true", help=argparse.SUPPRESS
+        )
+        self.add_argument("-lang", "--language", type=str, help=argparse.SUPPRESS)
+        self.add_argument("-fn", "--filename", type=str, help=argparse.SUPPRESS)
+        self.add_argument("-us", "--updated-since", type=str, help=argparse.SUPPRESS)
+        self.add_argument(
+            "-vis",
+            "--visibility",
+            choices=("public", "private"),
+            type=str,
+            help=argparse.SUPPRESS,
+        )
+        self.add_argument(
+            "-o",
+            "--output",
+            choices=("ndjson", "json", "tsv"),
+            type=str,
+            help=argparse.SUPPRESS,
+        )
         group.add_argument(
             "-bk",
             "--backup",
@@ -119,6 +147,58 @@ class ArgumentParser(argparse.ArgumentParser):
             nargs="?",
             const="self",
         )
+        # anonymous auxiliary arguments for --backup
+        self.add_argument(
+            "-inc", "--incremental", action="store_true", help=argparse.SUPPRESS
+        )
+        self.add_argument(
+            "-dr", "--delete-removed", action="store_true", help=argparse.SUPPRESS
+        )
+        self.add_argument(
+            "-ar", "--archive", choices=("gz", "xz"), type=str, help=argparse.SUPPRESS
+        )
+        self.add_argument(
+            "-snap", "--snapshot", action="store_true", help=argparse.SUPPRESS
+        )
+        group.add_argument(
+            "-bka",
+            "--backup-accounts",
+            help="back up gists of many accounts concurrently",
+            metavar="ACCOUNT",
+            type=str,
+            nargs="+",
+        )
+        # anonymous auxiliary arguments for --backup-accounts
+        self.add_argument("-ja", "--account-jobs", type=int, help=argparse.SUPPRESS)
+        group.add_argument(
+            "-ps",
+            "--prune-snapshots",
+            help="drop backup snapshots outside the retention policy",
+            metavar="OPT-SNAPSHOT-DIR",
+            type=str,
+            nargs="?",
+            const="GIST-SNAPSHOTS",
+        )
+        # anonymous auxiliary arguments for --prune-snapshots
+        self.add_argument("-kl", "--keep-last", type=int, help=argparse.SUPPRESS)
+        self.add_argument("-kd", "--keep-daily", type=int, help=argparse.SUPPRESS)
+        group.add_argument(
+            "-sy",
+            "--sync",
+            help="sync a directory with a gist,both ways",
+            metavar=("DIR", "GISTID"),
+            type=str,
+            nargs=2,
+        )
+        group.add_argument(
+            "-s",
+            "--search",
+            help="search the contents of the local backup",
+            metavar="QUERY",
+            type=str,
+        )
+        # anonymous auxiliary arguments for --search
+        self.add_argument("-bd", "--backup-dir", type=str, help=argparse.SUPPRESS)
         self.add_argument(
             "-sk",
             "--secret-key",
@@ -126,6 +206,26 @@ class ArgumentParser(argparse.ArgumentParser):
             metavar="SECRETKEY",
             type=str,
         )
+        self.add_argument(
+            "-j",
+            "--jobs",
+            help="number of concurrent downloads/deletions",
+            metavar="N",
+            type=int,
+        )
+        self.add_argument(
+            "-rt",
+            "--retries",
+            help="number of retries for transient failures",
+            metavar="N",
+            type=int,
+        )
+        self.add_argument(
+            "-nc",
+            "--no-cache",
+            help="don't send conditional requests using the on-disk http cache",
+            action="store_true",
+        )
         self.add_argument(
             "-nl",
             "--no-logging",
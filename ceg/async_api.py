@@ -0,0 +1,553 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Description
+-----------
+
+Asyncio flavour of ceg's api.AsyncCegApi mirrors the interface of `ceg.api.CegApi` with coroutines,
+all the operations of an instance share a single aiohttp connection pool and the fan-out of requests
+is bounded by a semaphore,so thousands of gists can be fetched concurrently on a single event loop.
+it requires the optional `aiohttp` dependency(`python3 -m pip install ceg[async]`).
+
+Typical usage example
+---------------------
+```
+async with AsyncCegApi(secret_key="abcd", max_concurrency=20) as cgi:
+    gist_url = await cgi.post("file1.py", gist_description="bla")
+    await cgi.get("gistid1", "gistid2")
+    user_gist_list = await cgi.list()
+    async for gist in cgi.iter_gists_of("username"):
+        print(gist["id"])
+```
+
+Api Reference
+-------------
+"""
+
+import os
+import json
+import asyncio
+from .exceptions import CegExceptions
+from .retry import RetryPolicy
+from .ratelimit import RateLimitGovernor
+from .records import GistRecord
+from .diff import diff_gist_files
+from .misc import Misc, FileHandler, gist_filename_validated, validate_status_code
+from typing import List, Dict, Tuple, Optional, AsyncIterator, Iterator, Union, Any
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # type: ignore
+
+__all__ = ("AsyncCegApi",)
+
+
+class AsyncCegApi:
+    """Asyncio interface for api.
+
+    Attributes:
+        header: A Dict containing the HTTP header.
+        end_point: Endpoint for api calls.
+        max_concurrency: upper bound on number of in-flight requests.
+        pool_maxsize: maximum number of pooled connections.
+        pool_maxsize_per_host: maximum number of pooled connections per host.
+        keep_alive: whether to keep connections alive between requests.
+        governor: rate limit governor pacing(and pausing) all the requests of the instance.
+        retry_policy: retry policy for transient failures.
+    """
+
+    def __init__(
+        self,
+        secret_key: Optional[str],
+        max_concurrency: int = 10,
+        pool_maxsize: int = 100,
+        pool_maxsize_per_host: int = 10,
+        keep_alive: bool = True,
+        governor: Optional[RateLimitGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """Inits AsyncCegApi with github secret key and connection pool configuration.
+
+        Args:
+            secret_key: github secret key,set it to `None` for unauthenticated user.
+            max_concurrency: upper bound on number of in-flight requests.
+            pool_maxsize: maximum number of pooled connections.
+            pool_maxsize_per_host: maximum number of pooled connections per host.
+            keep_alive: whether to keep connections alive between requests.
+            governor: (Optional) rate limit governor,can be shared between instances(of both apis)
+                      using the same credentials.
+            retry_policy: (Optional) retry policy for transient failures,defaults to `RetryPolicy()`.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncCegApi requires aiohttp,install it with `python3 -m pip install ceg[async]`"
+            )
+        self.header: Dict[str, str] = {
+            "Authorization": f"token {secret_key}",
+            "Accept": "application/vnd.github+json",
+        }
+        self.end_point: str = "https://api.github.com/gists"
+        self.__anonymous: bool = secret_key is None
+        self.max_concurrency: int = max_concurrency
+        self.pool_maxsize: int = pool_maxsize
+        self.pool_maxsize_per_host: int = pool_maxsize_per_host
+        self.keep_alive: bool = keep_alive
+        self.governor: RateLimitGovernor = (
+            governor if governor is not None else RateLimitGovernor()
+        )
+        self.retry_policy: RetryPolicy = (
+            retry_policy if retry_policy is not None else RetryPolicy()
+        )
+        self.__session: Optional["aiohttp.ClientSession"] = None
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+
+    def __get_session(self) -> "aiohttp.ClientSession":
+        """Lazily create the pooled session(it must be created inside a running event loop)."""
+        if self.__session is None or self.__session.closed:
+            connector: aiohttp.TCPConnector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize,
+                limit_per_host=self.pool_maxsize_per_host,
+                force_close=not self.keep_alive,
+            )
+            self.__session = aiohttp.ClientSession(connector=connector)
+            self.__semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.__session
+
+    async def __request(
+        self,
+        method: str,
+        url: str,
+        no_header: bool = False,
+        **kwargs: Any,
+    ) -> Tuple["aiohttp.ClientResponse", bytes]:
+        """Send a request over the pooled session,bounded by the semaphore.
+
+        Requests are paced by the rate limit governor and a rate limited request
+        is retried once the governor's pause is over.transient failures are retried
+        as per the retry policy.
+
+        Args:
+            method: http verb,i.e get,post,patch or delete.
+            url: url for the request.
+            no_header: boolean indicating whether to send the request without header.
+            **kwargs: any other keyword argument accepted by aiohttp.ClientSession.request().
+
+        Returns:
+            Returns the (already released) response and its body.
+        """
+        session: aiohttp.ClientSession = self.__get_session()
+        pauses: int = 0
+        attempt: int = 0
+        while True:
+            await asyncio.sleep(self.governor.reserve())
+            try:
+                async with self.__semaphore:  # type: ignore
+                    async with session.request(
+                        method, url, headers=None if no_header else self.header, **kwargs
+                    ) as response:
+                        body: bytes = await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exception:
+                if not self.retry_policy.should_retry(
+                    method,
+                    attempt,
+                    reached_server=not isinstance(
+                        exception, aiohttp.ClientConnectorError
+                    ),
+                ):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay(attempt))
+                attempt += 1
+                continue
+            self.governor.update(response.headers)
+            if response.status in self.retry_policy.retry_statuses:
+                if self.retry_policy.should_retry(method, attempt):
+                    await asyncio.sleep(
+                        self.retry_policy.delay(
+                            attempt, response.headers.get("Retry-After")
+                        )
+                    )
+                    attempt += 1
+                    continue
+                break
+            pause: Optional[float] = (
+                self.governor.pause_for(
+                    response.status,
+                    response.headers,
+                    body.decode("utf-8", "replace"),
+                )
+                if pauses < self.governor.max_pauses
+                else None
+            )
+            if pause is None:
+                break
+            pauses += 1
+        validate_status_code(response.status)
+        return response, body
+
+    @property
+    def rate_limit(self) -> Dict[str, Any]:
+        """Snapshot of the rate limit budget,i.e limit,remaining,reset,used and paused_until."""
+        return self.governor.state()
+
+    async def close(self) -> None:
+        """Close all the pooled connections of the instance."""
+        if self.__session is not None:
+            await self.__session.close()
+
+    async def __aenter__(self) -> "AsyncCegApi":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def __iter_gists(
+        self, end_point: str, no_header: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every gist of a listing,following the Link header page by page."""
+        next_url: Optional[str] = end_point
+        params: Optional[Dict[str, int]] = {"per_page": Misc.gists_per_page}
+        while next_url:
+            response, body = await self.__request(
+                "get", next_url, no_header=no_header, params=params
+            )
+            for gist in json.loads(body.decode("utf-8")):
+                yield gist
+            params = None
+            next_link = response.links.get("next")
+            next_url = str(next_link["url"]) if next_link else None
+
+    def iter_gists(self) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily iterate over all the gists of authenticated user.
+
+        Yields:
+            json-decoded mapping for every gist.
+        """
+        return self.__iter_gists(self.end_point)
+
+    def iter_gists_of(self, user_name: str) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily iterate over all the public gists of a user.
+
+        Args:
+            user_name: username for the user.
+
+        Yields:
+            json-decoded mapping for every gist.
+        """
+        return self.__iter_gists(
+            f"https://api.github.com/users/{user_name}/gists", no_header=True
+        )
+
+    async def list(self) -> List[GistRecord]:
+        """Return gist data for authenticated user.
+
+        Returns:
+            Returns a list of records(`ceg.records.GistRecord`) of all the gists of user.
+        """
+        return [GistRecord.from_json(gist) async for gist in self.iter_gists()]
+
+    async def list_other(self, user_name: str) -> List[GistRecord]:
+        """Return gist data for unauthenticated user.
+
+        Args:
+            user_name: username for the user.
+
+        Returns:
+            Returns a list of records(`ceg.records.GistRecord`) of all the gists of user.
+        """
+        return [GistRecord.from_json(gist) async for gist in self.iter_gists_of(user_name)]
+
+    async def __fetch_gist(self, gist_id: str) -> Dict[str, Any]:
+        """Fetch a single gist,with its complete file table."""
+        _, body = await self.__request(
+            "get",
+            f"{self.end_point}/{gist_id}",
+            no_header=self.__anonymous,
+        )
+        return json.loads(body.decode("utf-8"))
+
+    async def __download_file(
+        self, file_handler: FileHandler, file_name: str, file_url: str
+    ) -> Tuple[int, str]:
+        """Stream a raw file into the directory of its gist.
+
+        The body is written by `FileHandler.write_stream` in a worker thread(which pulls the chunks
+        off the event loop),so the file is hashed and atomically replaced without blocking the loop.
+        failed downloads are retried as per the retry policy.
+
+        Returns:
+            A tuple containing size and sha256 hash of the content.
+        """
+        session: aiohttp.ClientSession = self.__get_session()
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        attempt: int = 0
+        while True:
+            retry_after: Optional[str] = None
+            try:
+                async with self.__semaphore:  # type: ignore
+                    async with session.get(file_url) as response:
+                        if response.status not in self.retry_policy.retry_statuses or (
+                            not self.retry_policy.should_retry("get", attempt)
+                        ):
+                            validate_status_code(response.status)
+                            return await asyncio.to_thread(
+                                file_handler.write_stream,
+                                file_name,
+                                self.__iter_body(response, loop),
+                            )
+                        retry_after = response.headers.get("Retry-After")
+            except (
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientPayloadError,
+                asyncio.TimeoutError,
+            ) as exception:
+                if not self.retry_policy.should_retry(
+                    "get",
+                    attempt,
+                    reached_server=not isinstance(
+                        exception, aiohttp.ClientConnectorError
+                    ),
+                ):
+                    raise
+            await asyncio.sleep(self.retry_policy.delay(attempt, retry_after))
+            attempt += 1
+
+    @staticmethod
+    def __iter_body(
+        response: "aiohttp.ClientResponse", loop: asyncio.AbstractEventLoop
+    ) -> Iterator[bytes]:
+        """Iterate over the body of a response from outside the event loop,chunk by chunk."""
+        while True:
+            chunk: bytes = asyncio.run_coroutine_threadsafe(
+                response.content.read(Misc.download_chunk_size), loop
+            ).result()
+            if not chunk:
+                return
+            yield chunk
+
+    async def __download_gist(self, gist: Dict[str, Any], root_dir: str) -> None:
+        """Concurrently download all the files of a gist into its own directory."""
+        if gist.get("truncated"):
+            gist = await self.__fetch_gist(gist["id"])
+            if gist.get("truncated"):
+                raise CegExceptions.InternalException(
+                    "The gist has too many files for the api,use CegApi for cloning it!"
+                )
+        file_handler: FileHandler = FileHandler(
+            dir_name=os.path.join(root_dir, gist["id"])
+        )
+        try:
+            await asyncio.gather(
+                *(
+                    self.__download_file(
+                        file_handler, file_name, file_hashtable["raw_url"]
+                    )
+                    for file_name, file_hashtable in gist.get("files", {}).items()
+                    if file_hashtable.get("raw_url") is not None
+                )
+            )
+        except Exception:
+            file_handler.return_code = 1
+            raise
+
+    async def __download_gists(
+        self,
+        gist_ids: Optional[List[str]],
+        username: Optional[str],
+        root_dir: str,
+    ) -> None:
+        """Download the given gists(or all of them if gist_ids is None) concurrently.
+
+        Given gists are fetched directly by their ids,the listing is only walked for a backup.
+
+        Raises:
+            IncompleteOperation: raised once all downloads are settled,if one or more gists failed.
+        """
+
+        async def fetch_and_download(gist_id: str) -> None:
+            await self.__download_gist(await self.__fetch_gist(gist_id), root_dir)
+
+        failures: Dict[str, BaseException] = {}
+        downloads: Dict[str, "asyncio.Future[None]"] = {}
+        if gist_ids is None:
+            gist_iterator: AsyncIterator[Dict[str, Any]] = (
+                self.iter_gists_of(username) if username else self.iter_gists()
+            )
+            async for gist in gist_iterator:
+                downloads[gist["id"]] = asyncio.ensure_future(
+                    self.__download_gist(gist, root_dir)
+                )
+        else:
+            for gist_id in gist_ids:
+                downloads[gist_id] = asyncio.ensure_future(fetch_and_download(gist_id))
+        results: List[Any] = await asyncio.gather(
+            *downloads.values(), return_exceptions=True
+        )
+        for gist_id, result in zip(downloads, results):
+            if isinstance(result, BaseException):
+                failures[gist_id] = result
+        if failures:
+            raise CegExceptions.IncompleteOperation(failures)
+
+    async def get(self, *args: str, username: Optional[str] = None) -> str:
+        """Downloads gists concurrently.
+
+        Args:
+            *args: Variable lenght argument list containing gist-ids.
+            username: (Optional) username,for downloading gists of unauthenticated user.
+
+        Returns:
+            Returns HTTP call response status in string format.
+
+        Raises:
+            IncompleteOperation: raised if one or more gists failed to download,after the rest are done.
+        """
+        await self.__download_gists(list(args), username, os.curdir)
+        return validate_status_code(200)
+
+    async def backup(self, username: Optional[str] = None) -> str:
+        """Create backup of all gists on local media.
+
+        Unlike CegApi.backup(),the working directory of the process is never changed.
+
+        Args:
+            username: (Optional) username,for backing up gists of unauthenticated user.
+
+        Returns:
+            Returns HTTP call response status in string format.
+        """
+        backup_dir: FileHandler = FileHandler("GIST-BACKUP")
+        try:
+            await self.__download_gists(None, username, "GIST-BACKUP")
+        except Exception:
+            backup_dir.return_code = 1
+            raise
+        return validate_status_code(200)
+
+    @staticmethod
+    def __files_payload(files: Tuple[str, ...]) -> Dict[str, Dict[str, str]]:
+        """Read and validate the files into the `files` payload of a gist."""
+        file_to_content_map: Dict[str, Dict[str, str]] = {}
+        for file in files:
+            file_basename: str = os.path.basename(file)
+            if not gist_filename_validated(file_basename):
+                continue
+            with open(file, "r", encoding="utf-8") as r_obj:
+                file_to_content_map[file_basename] = {"content": r_obj.read()}
+        return file_to_content_map
+
+    async def post(
+        self,
+        *args: str,
+        is_private: bool = False,
+        gist_description: Optional[str] = None,
+    ) -> str:
+        """Create a gist.
+
+        Unlike CegApi.post(),missing files are not opened in an editor.
+
+        Args:
+            *args: variable lenght arguments list containing file names.
+            is_private: indicates whether to make gist private.
+            gist_description: Description for the gist.
+
+        Returns:
+            Returns HTML url for newly created gist.
+        """
+        payload: Dict[str, Any] = {
+            "files": self.__files_payload(args),
+            "public": not is_private,
+        }
+        if gist_description:
+            payload["description"] = gist_description
+        _, body = await self.__request("post", self.end_point, data=json.dumps(payload))
+        return json.loads(body.decode("utf-8")).get("html_url")
+
+    async def patch(
+        self, *args: str, gist_id: str, gist_description: Optional[str] = None
+    ) -> str:
+        """Modify an existing gist.
+
+        Only files differing from the gist are uploaded(files the api truncates are always
+        uploaded),the gist isn't written at all if nothing changed.
+
+        Args:
+             *args: variable lenght arguments list containing file names(`old->new` renames a file,
+                    `name->` deletes it).
+             gist_id: gist-id for the gist,that is to be modified.
+             gist_description: (Optional) Description for the gist.
+
+        Returns:
+            Returns HTTP call response status in string format(`Not Modified!` if nothing changed).
+        """
+        local_files: Dict[str, str] = {}
+        new_filename_map: Dict[str, str] = {}
+        deleted_filenames: List[str] = []
+        for file in args:
+            oldname, separator, newname = file.partition("->")
+            file_basename: str = os.path.basename(oldname)
+            if separator and not newname:
+                deleted_filenames.append(file_basename)
+                continue
+            if newname:
+                new_filename_map[file_basename] = newname
+            if gist_filename_validated(file_basename) and (
+                not newname or os.path.exists(oldname)
+            ):
+                local_files[file_basename] = oldname
+        remote_gist: Dict[str, Any] = await self.__fetch_gist(gist_id)
+        files_payload, _ = diff_gist_files(
+            remote_gist.get("files") or {},
+            local_files,
+            renames=new_filename_map,
+            deletions=deleted_filenames,
+        )
+        payload: Dict[str, Any] = {"files": files_payload}
+        if gist_description and gist_description != remote_gist.get("description"):
+            payload["description"] = gist_description
+        if not files_payload and "description" not in payload:
+            return "Not Modified!"
+        response, _ = await self.__request(
+            "patch", f"{self.end_point}/{gist_id}", data=json.dumps(payload)
+        )
+        return validate_status_code(response.status)
+
+    async def delete(self, *args: str) -> Dict[str, Union[str, BaseException]]:
+        """Delete existing gists concurrently.
+
+        Args:
+            *args: arbitrary amount of gist-ids.
+
+        Returns:
+            Returns a mapping of every gist-id to its outcome,i.e HTTP call response status
+            in string format on success or the exception the deletion failed with.
+        """
+
+        async def delete_gist(gist_id: str) -> str:
+            response, _ = await self.__request("delete", f"{self.end_point}/{gist_id}")
+            return validate_status_code(response.status)
+
+        results: List[Union[str, BaseException]] = await asyncio.gather(
+            *(delete_gist(gist) for gist in args), return_exceptions=True
+        )
+        return dict(zip(args, results))
@@ -0,0 +1,104 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Bulk gist creation sources """
+
+import os
+import csv
+import json
+from .exceptions import CegExceptions
+from typing import List, Dict, Optional, Any
+
+__all__ = ("load_bulk_entries",)
+
+
+def load_bulk_entries(source: str, is_private: bool = False) -> List[Dict[str, Any]]:
+    """Load the gists to create in bulk from a manifest or a directory.
+
+    The source can either be:
+    - a directory,every sub-directory of which becomes a gist(named after the sub-directory)
+      containing all the regular files directly inside it.
+    - a json manifest containing a list of entries(or a mapping of names to entries),
+      i.e `[{"name": "report-1", "files": ["a.md", "b.csv"], "description": "..", "public": false}]`.
+    - a csv manifest with `name`,`files`(separated by `;`),`description` and `public` columns.
+
+    File paths in manifests are relative to the manifest's directory.
+
+    Args:
+        source: path to the directory or manifest.
+        is_private: default visibility of entries which don't specify one.
+
+    Returns:
+        A list of entries,each containing the `name`,`files`,`description` and `public` keys.
+    """
+    if os.path.isdir(source):
+        return [
+            {
+                "name": entry.name,
+                "files": sorted(
+                    file.path for file in os.scandir(entry.path) if file.is_file()
+                ),
+                "description": entry.name,
+                "public": not is_private,
+            }
+            for entry in sorted(os.scandir(source), key=lambda entry: entry.name)
+            if entry.is_dir()
+        ]
+
+    base_dir: str = os.path.dirname(os.path.abspath(source))
+    raw_entries: List[Dict[str, Any]]
+    with open(source, "r", encoding="utf-8", newline="") as r_obj:
+        if source.endswith(".json"):
+            manifest: Any = json.load(r_obj)
+            raw_entries = (
+                [dict(entry, name=name) for name, entry in manifest.items()]
+                if isinstance(manifest, dict)
+                else manifest
+            )
+        elif source.endswith(".csv"):
+            raw_entries = [
+                dict(row, files=[file for file in (row.get("files") or "").split(";") if file])
+                for row in csv.DictReader(r_obj)
+            ]
+        else:
+            raise CegExceptions.BadManifest(
+                f"Expected a directory or a .json/.csv manifest but got '{source}'"
+            )
+
+    entries: List[Dict[str, Any]] = []
+    for entry_no, raw_entry in enumerate(raw_entries):
+        if not raw_entry.get("files"):
+            raise CegExceptions.BadManifest(f"Entry #{entry_no} of '{source}' has no files!")
+        public: Optional[Any] = raw_entry.get("public")
+        if isinstance(public, str):
+            public = public.strip().lower() in ("1", "true", "yes") if public.strip() else None
+        entries.append(
+            {
+                "name": str(raw_entry.get("name") or f"entry-{entry_no}"),
+                "files": [
+                    os.path.join(base_dir, file.strip()) for file in raw_entry["files"]
+                ],
+                "description": raw_entry.get("description") or None,
+                "public": (not is_private) if public is None else bool(public),
+            }
+        )
+    return entries
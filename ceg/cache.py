@@ -0,0 +1,294 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Caches used by ceg """
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Callable, Tuple, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+__all__ = ("HttpCache", "MetadataCache")
+
+
+def default_cache_dir() -> str:
+    """Return ceg's cache directory,honoring XDG_CACHE_HOME."""
+    return os.path.join(
+        os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "ceg",
+    )
+
+
+class HttpCache:
+    """On-disk http validator cache.
+
+    Stores the ETag/Last-Modified validators along with the body of
+    successful GET responses per url and credential,so that repeated
+    requests can be sent conditionally.a `304 Not Modified` reply is
+    then answered from the cache and doesn't count against github's
+    rate limit.the cache is bounded,least recently used entries are
+    evicted once more than `max_entries` entries are stored.
+
+    Attributes:
+        cache_dir: directory containing the cache entries.
+        max_entries: maximum number of stored entries.
+        STORED_HEADERS: response headers that are kept along with the body.
+    """
+
+    STORED_HEADERS: tuple = ("ETag", "Last-Modified", "Link", "Content-Type")
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 1024) -> None:
+        """Inits HttpCache with a cache directory and its bound"""
+        self.cache_dir: str = os.path.join(cache_dir or default_cache_dir(), "http")
+        self.max_entries: int = max_entries
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+
+    @staticmethod
+    def key(
+        url: str, params: Optional[Dict[str, Any]], credential: Optional[str]
+    ) -> str:
+        """Derive the cache key of a request.
+
+        Args:
+            url: url of the request.
+            params: query parameters of the request.
+            credential: value of the Authorization header,if any.
+
+        Returns:
+            hex digest identifying the request.
+        """
+        # imported lazily as requests is quite heavy to import
+        import requests
+
+        prepared_request: requests.models.PreparedRequest = (
+            requests.models.PreparedRequest()
+        )
+        prepared_request.prepare_url(url, params)
+        return hashlib.sha256(
+            f"{prepared_request.url}\n{credential or ''}".encode("utf-8")
+        ).hexdigest()
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def __load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.__path(key), "r", encoding="utf-8") as r_obj:
+                return json.load(r_obj)
+        except (OSError, ValueError):
+            return None
+
+    def validators(self, key: str) -> Dict[str, str]:
+        """Return the conditional request headers for a cached request.
+
+        Args:
+            key: cache key of the request.
+
+        Returns:
+            If-None-Match/If-Modified-Since headers,empty if nothing is cached.
+        """
+        entry: Optional[Dict[str, Any]] = self.__load(key)
+        if entry is None:
+            return {}
+        conditional_headers: Dict[str, str] = {}
+        if entry["headers"].get("ETag"):
+            conditional_headers["If-None-Match"] = entry["headers"]["ETag"]
+        if entry["headers"].get("Last-Modified"):
+            conditional_headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return conditional_headers
+
+    def store(self, key: str, response: "requests.models.Response") -> None:
+        """Store a successful response,if it carries any validator.
+
+        Args:
+            key: cache key of the request.
+            response: the http response.
+        """
+        headers: Dict[str, str] = {
+            header: response.headers[header]
+            for header in self.STORED_HEADERS
+            if header in response.headers
+        }
+        if "ETag" not in headers and "Last-Modified" not in headers:
+            return None
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.cache_dir, suffix=".tmp", delete=False
+        ) as w_obj:
+            json.dump(
+                {
+                    "url": response.url,
+                    "headers": headers,
+                    "body": response.content.decode("utf-8"),
+                },
+                w_obj,
+            )
+        os.replace(w_obj.name, self.__path(key))
+        self.__evict()
+
+    def __evict(self) -> None:
+        """Remove the least recently used entries beyond max_entries."""
+        entries: List[Tuple[float, str]] = []
+        with os.scandir(self.cache_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                if not dir_entry.name.endswith(".json"):
+                    continue
+                try:
+                    entries.append((dir_entry.stat().st_mtime, dir_entry.path))
+                except OSError:
+                    continue
+        entries.sort()
+        for _, entry_path in entries[: max(len(entries) - self.max_entries, 0)]:
+            try:
+                os.remove(entry_path)
+            except OSError:
+                # already evicted by another process
+                pass
+
+    def cached_response(self, key: str) -> Optional["requests.models.Response"]:
+        """Rebuild the cached response of a request(i.e on a `304 Not Modified` reply).
+
+        Args:
+            key: cache key of the request.
+
+        Returns:
+            The cached response,or None if the entry has vanished.
+        """
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        entry: Optional[Dict[str, Any]] = self.__load(key)
+        if entry is None:
+            return None
+        try:
+            # a hit makes the entry the most recently used one
+            os.utime(self.__path(key))
+        except OSError:
+            pass
+        response: requests.models.Response = requests.models.Response()
+        response.status_code = 200
+        response.url = entry["url"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = "utf-8"
+        response._content = entry["body"].encode("utf-8")
+        return response
+
+
+class MetadataCache:
+    """In-memory cache of gist metadata.
+
+    Holds json-decoded listings(keyed by their endpoint) and single gists
+    (keyed by their id) for a long running process.the cache is bounded,
+    least recently used entries are evicted once `maxsize` entries are held
+    and every entry expires `ttl` seconds after it was stored.writes are
+    expected to invalidate the entries they affect.its safe to share
+    between threads.
+
+    Attributes:
+        maxsize: maximum number of entries,0 disables the cache.
+        ttl: seconds after which an entry expires,None for no expiry.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: Optional[float] = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Inits MetadataCache with its bounds.
+
+        Args:
+            maxsize: maximum number of entries,0 disables the cache.
+            ttl: seconds after which an entry expires,None for no expiry.
+            clock: monotonic clock used for expiring entries.
+        """
+        self.maxsize: int = maxsize
+        self.ttl: Optional[float] = ttl
+        self.__clock: Callable[[], float] = clock
+        self.__entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, kind: str, name: str) -> Optional[Any]:
+        """Return a cached entry.
+
+        Args:
+            kind: kind of the entry,i.e `listing` or `gist`.
+            name: name of the entry,i.e the endpoint of a listing or the id of a gist.
+
+        Returns:
+            The cached value,or None if its missing or has expired.
+        """
+        with self.__lock:
+            entry: Optional[Tuple[float, Any]] = self.__entries.get((kind, name))
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if self.ttl is not None and self.__clock() >= expires_at:
+                del self.__entries[(kind, name)]
+                return None
+            self.__entries.move_to_end((kind, name))
+            return value
+
+    def put(self, kind: str, name: str, value: Any) -> None:
+        """Store an entry,evicting the least recently used ones if full.
+
+        Args:
+            kind: kind of the entry,i.e `listing` or `gist`.
+            name: name of the entry,i.e the endpoint of a listing or the id of a gist.
+            value: value to cache.
+        """
+        if self.maxsize <= 0:
+            return None
+        with self.__lock:
+            self.__entries[(kind, name)] = (
+                self.__clock() + (self.ttl or 0.0),
+                value,
+            )
+            self.__entries.move_to_end((kind, name))
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, kind: str, name: Optional[str] = None) -> None:
+        """Drop an entry,or all the entries of a kind if no name is given.
+
+        Args:
+            kind: kind of the entries.
+            name: (Optional) name of the entry.
+        """
+        with self.__lock:
+            for key in list(self.__entries):
+                if key[0] == kind and (name is None or key[1] == name):
+                    del self.__entries[key]
+
+    def clear(self) -> None:
+        """Drop all the entries."""
+        with self.__lock:
+            self.__entries.clear()
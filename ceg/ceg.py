@@ -26,122 +26,117 @@ import re
 import os
 import sys
 import json
-import requests
+import time
+import functools
+import shutil
+import hashlib
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 from .logger import Logger
-from rich.tree import Tree
-from rich.console import Console
+from .ratelimit import RateLimitGovernor
+from .manifest import BackupManifest
+from .cache import HttpCache, MetadataCache
+from .store import MetadataStore
+from .search import SearchIndex
+from .archive import ArchiveWriter
+from .snapshot import SnapshotStore, SnapshotGistHandler
+from .records import GistRecord
+from .output import RecordWriter
+from .bulk import load_bulk_entries
+from .accounts import load_accounts
+from .diff import diff_gist_files
+from .sync import SyncState, scan_directory, plan_sync
 from .exceptions import GenericReturnCodes, CegExceptions
-from .misc import Misc, FileHandler, open_file, gist_filename_validated
-from typing import List, Tuple, Dict, Optional, Union, Callable, Any
+from .misc import (
+    Misc,
+    FileHandler,
+    open_file,
+    gist_filename_validated,
+    validate_status_code,
+)
+from typing import (
+    List,
+    Tuple,
+    Dict,
+    Optional,
+    Union,
+    Callable,
+    Iterator,
+    Iterable,
+    TextIO,
+    Collection,
+    TypedDict,
+    Any,
+    TYPE_CHECKING,
+)
+
+if TYPE_CHECKING:
+    import requests
+    from rich.tree import Tree
+    from rich.console import Console
+    from .session import CegSession
+
+
+
+@functools.lru_cache(maxsize=None)
+def get_console() -> "Console":
+    """Return the (lazily created) rich console,rich is only imported on first render."""
+    from rich.console import Console
+
+    return Console()
 
-console: Console = Console()
 
 __all__ = ("Ceg",)
 
 
-class AuxSequence(List):
-    """An Auxiliary sequence.
-
-    An Auxiliary Sequence that structurally saves stdout for
-    delivering api.
-
-    Attributes:
-    single_item_dict: A dictionary containing elements of single gist.
-    """
-
-    def __init__(self) -> None:
-        self.single_item_dict: Dict[str, Union[str, List[str]]] = {}
-
-    def append(
-        self,
-        writable: Optional[Union[str, Tree, Dict[str, List[str]]]],
-        iteration_complete: bool = False,
-    ) -> None:
-        """Overloads the append method of List
-
-        Receives (unsanitized) data which is added to
-        a mapping,which is then appended to the
-        sequence itself.
-
-        Args:
-        writable: Actual stream which is to be stored.
-        iteration_complete: A boolean acting as a delimiter for gists.
-        """
-        if isinstance(writable, Dict):
-            self.single_item_dict.update(writable)
-        else:
-            key, val = writable.split(":")  # type: ignore
-            self.single_item_dict.update({key: val})
-        if iteration_complete:
-            single_item_dict_copy = self.single_item_dict.copy()
-            super().append(single_item_dict_copy)
-            self.single_item_dict.clear()
-
-
 class WriteStdout:
-    """Write stdout to an initialized resource.
+    """Write stdout to console.
 
-    Implements the "write stdout" functionality.It writes the stdout to an initialized resource.
+    Implements the "write stdout" functionality,used for rendering on cli.
 
     Attributes:
         to_stdout: A bool indicating whether to write to stdout or not.
-        stream_cache: A list containing all gists info.
-        write_stdout: A Callable which either writes to stdout or stream_cache.
     """
 
     def __init__(self, to_stdout: bool) -> None:
         """Inits WriteStdout with appropriate attributes"""
         self.to_stdout: bool = to_stdout
-        self.stream_cache: AuxSequence = AuxSequence()
-        self.write_stdout: Callable[
-            [Optional[Union[str, Tree, Dict[str, List[str]]]], bool], None
-        ]
-        # mypy was being bitchy when using ternary operator so ...
-        # related issue: https://github.com/python/mypy/issues/10740
-        if self.to_stdout:
-            self.write_stdout = lambda writable, _: console.print(writable)
-        else:
-            self.write_stdout = self.stream_cache.append
 
     def __call__(
         self,
-        writable: Optional[Union[str, Tree, Dict[str, List[str]]]] = None,
+        writable: Optional[Union[str, "Tree"]] = None,
         is_rule: bool = False,
-        silent: bool = False,
         text_style: Optional[str] = None,
-        iteration_complete: bool = False,
     ) -> None:
         """Implements dunder call
 
-        Calls the actual write_stdout method after evaluation.
+        Writes the writable to console,if writing to stdout.
 
         Args:
             writable: A string or Tree object.
             is_rule: A boolean indicating if the writable is a rule object.
-            is_tree: A boolean indicating if the writable is a Tree object.
-            silent: A boolean indicating whether to waste the write_stdout
-                    call(mostly while self.to_stdout is False and we don't
-                    want to print the rule).
             text_style: Contains the styling string.
 
         """
-        if isinstance(writable, Tree) and not self.to_stdout:
-            tree_dict: Dict[str, List[str]] = {"Files": []}
-            retreive_file: Callable[
-                [Tree], str
-            ] = lambda tree_obj: tree_obj.label  # type: ignore
-            tree_files: List[str] = list(map(retreive_file, writable.children))
-            tree_dict["Files"] = tree_files
-            writable = tree_dict
-        if not silent:
-            writable = text_style + writable if text_style and self.to_stdout else writable  # type: ignore
-            self.write_stdout(
-                writable, iteration_complete
-            ) if not is_rule else console.rule(
-                writable  # type: ignore
+        if not self.to_stdout:
+            return None
+        if is_rule:
+            get_console().rule(writable)  # type: ignore
+        else:
+            get_console().print(
+                text_style + writable if text_style else writable  # type: ignore
             )
 
 
+class GetNamespace(TypedDict):
+    """States and responses relating to Ceg.get()."""
+
+    has_response: bool
+    response: Optional[List[Dict[str, Any]]]
+
+
 class Ceg:
     """Main implementation of ceg.
 
@@ -163,6 +158,30 @@ class Ceg:
         response_status_str: Contains HTTP call response status in string format.
         logger: Logger object.
         ceg_get_namespace: a namespace containing states and responses relating to Ceg.get()
+        session: pooled http session shared by all the http calls and raw file downloads.
+        max_workers: upper bound on the number of concurrent downloads.
+        incremental: boolean indicating whether backup() updates an existing backup using its manifest.
+        delete_removed: boolean indicating whether incremental backup() deletes(instead of archiving)
+                        the gists which were removed since the last backup.
+        http_cache: (Optional) on-disk http validator cache used for conditional GET requests.
+        metadata_cache: (Optional) in-memory cache of listings and gists,which is invalidated on writes.
+                        ceg_get_namespace is used instead if not given.
+        metadata_store: (Optional) local store of listings,which list() refreshes and answers from.
+        offline: boolean indicating whether list() answers from metadata store without fetching the listing.
+        list_filters: filters applied by list(),see `MetadataStore.query` for the supported ones.
+        backup_dir: backup directory created by backup() and searched by search(),root of the per-account
+                    backup directories for backup_accounts().
+        max_accounts: upper bound on the number of accounts backup_accounts() backs up concurrently.
+        archive_format: (Optional) compression(`gz`/`xz`) of a single archive backup() streams the
+                        gists into,instead of a directory per gist.
+        snapshot_dir: (Optional) snapshot store backup() records a deduplicated snapshot in,instead of
+                      a directory per gist.
+        keep_last: (Optional) number of most recent snapshots kept by prune_snapshots().
+        keep_daily: (Optional) number of most recent days whose latest snapshot is kept by prune_snapshots().
+        output_format: (Optional) machine readable format(`ndjson`/`json`/`tsv`) list() streams the gists
+                       to output_stream in,instead of rendering them.
+        output_stream: text stream written to in output_format,defaults to stdout.
+        no_header: boolean indicating whether gists are fetched without auth header(i.e for other users).
     """
 
     def __init__(
@@ -176,6 +195,11 @@ class Ceg:
         gist_no_public: bool,
         gist_desc: Optional[str],
         gist_id: Optional[str],
+        session: Optional["CegSession"] = None,
+        max_workers: int = 8,
+        http_cache: Optional[HttpCache] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        metadata_store: Optional[MetadataStore] = None,
     ) -> None:
         """Inits Ceg with appropriate attributes"""
         self.http_operation: str = operation
@@ -187,19 +211,102 @@ class Ceg:
         self.gist_description: Optional[str] = gist_desc
         self.gist_id: Optional[str] = gist_id
         self.response_status_str: str = ""
+        self.max_workers: int = max_workers
+        self.incremental: bool = False
+        self.delete_removed: bool = False
+        self.http_cache: Optional[HttpCache] = http_cache
+        self.metadata_cache: Optional[MetadataCache] = metadata_cache
+        self.metadata_store: Optional[MetadataStore] = metadata_store
+        self.offline: bool = False
+        self.list_filters: Dict[str, Any] = {}
+        self.backup_dir: str = "GIST-BACKUP"
+        self.max_accounts: int = 4
+        self.archive_format: Optional[str] = None
+        self.snapshot_dir: Optional[str] = None
+        self.keep_last: Optional[int] = None
+        self.keep_daily: Optional[int] = None
+        self.output_format: Optional[str] = None
+        self.output_stream: TextIO = sys.stdout
+        self.no_header: bool = False
+        self.__secret_key: Optional[str] = secret_key
         self.header: Dict[str, str] = {
             "Authorization": f"token {secret_key}",
             "Accept": "application/vnd.github+json",
         }
         self.end_point: str = "https://api.github.com/gists"
-        self.payload: Dict[str, Union[Dict[str, Dict[str, str]], bool, str]] = {}
+        # a None file entry deletes the file(when patching)
+        self.payload: Dict[
+            str, Union[Dict[str, Optional[Dict[str, str]]], bool, str]
+        ] = {}
         self.logger: Logger = Logger(send_log=do_logging)
-        # ceg_get_namespace["response"] has a ridiculous annotation
-        # so better off using `Any` to please mypy
-        self.ceg_get_namespace: Dict[str, Union[bool, Any]] = {
+        self.ceg_get_namespace: GetNamespace = {
             "has_response": False,
             "response": None,
         }
+        # a session handed over by the caller is owned (and closed) by the caller
+        self.__owns_session: bool = session is None
+        if session is None:
+            # imported lazily as requests is quite heavy to import
+            from .session import CegSession
+
+            session = CegSession()
+        self.session: CegSession = session
+
+    def close(self) -> None:
+        """Release the pooled connections if the session is owned by this instance."""
+        if self.__owns_session:
+            self.session.close()
+
+    def __request(
+        self,
+        method: str,
+        end_point: str,
+        header: Dict[str, str],
+        no_header: bool = False,
+        **kwargs: Any,
+    ) -> "requests.models.Response":
+        """sends a request over the pooled session
+
+        GET requests are sent conditionally(If-None-Match/If-Modified-Since) when
+        the http cache holds validators for them,a `304 Not Modified` reply is
+        then answered with the cached response.
+
+        Args:
+            method: http verb,i.e get,post,patch or delete.
+            end_point: endpoint string.
+            header: header for the request.
+            no_header: boolean indicating whether to send the request without header.
+            **kwargs: any other keyword argument accepted by CegSession.request().
+
+        Returns:
+            Returns the http response.
+        """
+        request_header: Dict[str, str] = {} if no_header else dict(header)
+        cache_key: Optional[str] = None
+        if method == "get" and self.http_cache is not None:
+            cache_key = self.http_cache.key(
+                end_point, kwargs.get("params"), request_header.get("Authorization")
+            )
+            request_header.update(self.http_cache.validators(cache_key))
+        response: requests.models.Response = self.session.request(
+            method, end_point, headers=request_header or None, **kwargs
+        )
+        if cache_key is not None:
+            if response.status_code == 304:
+                cached_response: Optional[
+                    requests.models.Response
+                ] = self.http_cache.cached_response(  # type: ignore
+                    cache_key
+                )
+                if cached_response is None:
+                    # entry vanished in between,fallback to an unconditional request
+                    return self.session.request(
+                        method, end_point, headers=(None if no_header else header), **kwargs
+                    )
+                response = cached_response
+            elif response.status_code == 200:
+                self.http_cache.store(cache_key, response)  # type: ignore
+        return response
 
     def __send_http_request(
         self,
@@ -225,11 +332,8 @@ class Ceg:
         if header is None:
             header = self.header
 
-        http_operation = getattr(requests, self.http_operation)
-        response: requests.models.Response = (
-            http_operation(url=end_point, data=params, headers=header)
-            if not no_header
-            else http_operation(url=end_point, data=params)
+        response: requests.models.Response = self.__request(
+            self.http_operation, end_point, header, no_header=no_header, data=params
         )
         self.response_status_str = self.__response_validator(response)
         return_var: Union[
@@ -246,7 +350,7 @@ class Ceg:
 
         return return_var
 
-    def __response_validator(self, response: requests.models.Response) -> str:
+    def __response_validator(self, response: "requests.models.Response") -> str:
         """Validates the response
 
         Takes http response as argument and checks to see if its valid,returns the response string,otherwise raises
@@ -258,66 +362,111 @@ class Ceg:
             Response status string.
 
         """
-        try:
-            http_response_codes: Misc.HttpResponseCodes = Misc.http_response_codes
-            response_str: str
-            exception_obj_dict: Dict[str, Misc.OptionalException]
-            response_str, exception_obj_dict = tuple(
-                http_response_codes[response.status_code].items()  # type: ignore
-            )[0]
-            exception_obj = exception_obj_dict.get("exception_obj")
-            response_action: Callable[
-                [Misc.OptionalException], None
-            ] = http_response_codes.get(  # type: ignore
-                "exception_action"
-            )
-            response_action(exception_obj)
-        except KeyError:
-            raise CegExceptions.InternalException(
-                "Undefined Response!.please open an issue on github."
+        return validate_status_code(response.status_code)
+
+    def iter_pages(
+        self,
+        end_point: Optional[str] = None,
+        header: Optional[Dict[str, str]] = None,
+        no_header: bool = False,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Lazily iterate over all the pages of a gist listing.
+
+        Requests the listing with the maximum page size and follows the
+        `next` relation of the Link header until the last page,yielding
+        every page as soon as it arrives.
+
+        Args:
+            end_point: optional listing endpoint string.
+            header: optional header for the request.
+            no_header: boolean indicating whether to send the request without header.
+
+        Yields:
+            A list of gists(as json-decoded mappings) for every page.
+        """
+        if end_point is None:
+            end_point = self.end_point
+        if header is None:
+            header = self.header
+        next_url: Optional[str] = end_point
+        params: Optional[Dict[str, int]] = {"per_page": Misc.gists_per_page}
+        while next_url:
+            response: requests.models.Response = self.__request(
+                "get", next_url, header, no_header=no_header, params=params
             )
+            self.response_status_str = self.__response_validator(response)
+            yield json.loads(response.content.decode("utf-8"))
+            # the next url already carries the query string
+            params = None
+            next_url = response.links.get("next", {}).get("url")
+
+    def iter_gists(
+        self,
+        end_point: Optional[str] = None,
+        header: Optional[Dict[str, str]] = None,
+        no_header: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over every gist of a listing,page by page.
+
+        Args:
+            end_point: optional listing endpoint string.
+            header: optional header for the request.
+            no_header: boolean indicating whether to send the request without header.
 
-        return response_str
+        Yields:
+            json-decoded mapping for every gist.
+        """
+        for page in self.iter_pages(end_point, header, no_header):
+            yield from page
 
     def list(
         self,
         end_point: Optional[str] = None,
         header: Optional[Dict[str, str]] = None,
         no_header: bool = False,
-    ) -> Optional[List[Dict[str, str]]]:
+    ) -> Optional[List[GistRecord]]:
         """lists public/private gists for authenticated user.
 
         Performs GET operation on endpoint and retrieves all the public/private gists and propagates the formatted
-        response to standard stream.
+        response to standard stream.with a metadata store,the listing is stored locally first and the gists matching
+        list_filters are listed from it(offline,without the GET operation,if asked to).with an output_format,
+        every gist is written as a record as soon as its page arrives.
 
         Args:
             end_point: optional endpoint string.
             header:    optional header for the request.
 
         Returns:
-            (Optionally) returns a list containing all gists.
+            (Optionally) returns a list of records of all gists,if not writing to stdout.
         """
         if end_point is None:
             end_point = self.end_point
         if header is None:
             header = self.header
 
-        hashtable_response: Union[
-            int, List[Dict[str, Union[str, Dict[str, str], None, bool, int]]]
-        ] = (
-            self.__send_http_request(end_point, header)
-            if not no_header
-            else self.__send_http_request(end_point, no_header=True)
+        gists: Iterable[Dict[str, Any]] = self.__stored_gists(
+            end_point, header, no_header
         )
+        if self.output_format is not None:
+            record_writer: RecordWriter = RecordWriter(
+                self.output_stream, self.output_format
+            )
+            for gist in gists:
+                record_writer.write(GistRecord.from_json(gist))
+            record_writer.close()
+            return None
+        if not self.to_stdout:
+            return [GistRecord.from_json(gist) for gist in gists]
+        self.__render_gists(gists)
+        return None
+
+    def __render_gists(self, gists: Iterable[Dict[str, Any]]) -> None:
+        """Render the gists of a listing to stdout."""
+        from rich.tree import Tree
 
         write_stdout: WriteStdout = WriteStdout(self.to_stdout)
-        for gist_no, gist_hashtable in enumerate(hashtable_response):  # type: ignore
-            write_stdout(
-                f"Gist#{gist_no}",
-                is_rule=True,
-                silent=not self.to_stdout,
-                text_style="[cyan bold]",
-            )
+        for gist_no, gist_hashtable in enumerate(gists):
+            write_stdout(f"Gist#{gist_no}", is_rule=True, text_style="[cyan bold]")
             write_stdout(f"GistId: {gist_hashtable.get('id')}", text_style="[yellow]")
             write_stdout(
                 f"Publicity: {'Public' if gist_hashtable.get('public') else 'Private'}",
@@ -342,32 +491,82 @@ class Ceg:
                 )
                 file_tree_branch.add(f"Created at: {gist_hashtable.get('created_at')}")
                 file_tree_branch.add(f"Updated at: {gist_hashtable.get('updated_at')}")
-            write_stdout(file_tree, iteration_complete=True)
-            write_stdout(is_rule=True, silent=not self.to_stdout)
-        if not self.to_stdout:
-            return write_stdout.stream_cache
-        # welp mypy wants explicit return statement
-        else:
-            return None
+            write_stdout(file_tree)
+            write_stdout(is_rule=True)
+
+    def __listed_gists(
+        self, end_point: str, header: Dict[str, str], no_header: bool
+    ) -> Iterable[Dict[str, Any]]:
+        """Return the listing of an endpoint from metadata cache,or iterate it lazily without one."""
+        if self.metadata_cache is None:
+            return self.iter_gists(end_point, header, no_header)
+        listing: Optional[List[Dict[str, Any]]] = self.metadata_cache.get(
+            "listing", end_point
+        )
+        if listing is None:
+            listing = list(self.iter_gists(end_point, header, no_header))
+            self.metadata_cache.put("listing", end_point, listing)
+        return listing
 
-    def get(self, **kwargs) -> None:
-        """Download gists using gist-ids as argument.
+    def __stored_gists(
+        self, end_point: str, header: Dict[str, str], no_header: bool
+    ) -> Iterable[Dict[str, Any]]:
+        """Return the gists to list,refreshing and filtering them through metadata store.
 
-        This method downloads all the gists given on cli. backup() also uses this method internally.
+        Without a metadata store(and filters),the listing is iterated as is.
 
-        Args:
-            **kwargs = Auxiliary arbitrary keyword arguments.
+        Raises:
+            InsufficientSubArguments: raised if asked to list offline without a metadata store.
+            ResourceNotFound: raised if asked to list offline,but the listing was never stored.
+        """
+        metadata_store: Optional[MetadataStore] = self.metadata_store
+        if metadata_store is None:
+            if self.offline:
+                raise CegExceptions.InsufficientSubArguments(
+                    "Offline listing needs the metadata store!"
+                )
+            if not self.list_filters:
+                return self.__listed_gists(end_point, header, no_header)
+            metadata_store = MetadataStore(":memory:")
+        # listings are stored per credential,so that secret gists never leak to another one
+        source: str = MetadataStore.source(
+            end_point, None if no_header else header.get("Authorization")
+        )
+        if self.offline:
+            if metadata_store.refreshed_at(source) is None:
+                raise CegExceptions.ResourceNotFound(
+                    "No stored listing found!,list once without --offline."
+                )
+        elif not self.list_filters:
+            return self.__storing_gists(
+                metadata_store, source, end_point, header, no_header
+            )
+        else:
+            metadata_store.refresh(
+                source, self.__listed_gists(end_point, header, no_header)
+            )
+        return metadata_store.query(source, **self.list_filters)
+
+    def __storing_gists(
+        self,
+        metadata_store: MetadataStore,
+        source: str,
+        end_point: str,
+        header: Dict[str, str],
+        no_header: bool,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the gists of a listing as they arrive,storing the listing(as source) once its complete."""
+        listing: List[Dict[str, Any]] = []
+        for gist in self.__listed_gists(end_point, header, no_header):
+            listing.append(gist)
+            yield gist
+        metadata_store.refresh(source, listing)
+
+    def __resolve_user(self) -> None:
+        """Resolve the optional `user:user_name` prefix of the arguments.
+
+        Switches the listing endpoint to the one of given user and drops the auth header.
         """
-        gist_id: Optional[str]
-        do_logging: Optional[bool]
-        bypass_recursion: Optional[bool]
-        no_header: bool = False
-        gist_id = kwargs.get("gist_id")
-        do_logging = kwargs.get("logging_status")
-        bypass_recursion = kwargs.get("bypass_recursion")
-        hashtable_response: Union[
-            int, List[Dict[str, Union[str, Dict[str, str], None, bool, int]]]
-        ]
         match_str: Union[List, str] = (
             self.arg_val if isinstance(self.arg_val, str) else self.arg_val[0]  # type: ignore
         )
@@ -380,69 +579,415 @@ class Ceg:
                     f"users/{username_match.group().split(':')[1]}/gists",
                     self.end_point,
                 )
-                no_header = True
+                self.no_header = True
                 if isinstance(self.arg_val, List):
                     self.arg_val.pop(0)
 
+    def __fetch_listing(self) -> List[Dict[str, Any]]:
+        """Fetch(once) the complete gist listing used by get().
+
+        Returns:
+            json-decoded listing of all the gists.
+        """
+        self.__resolve_user()
+        listing: Optional[List[Dict[str, Any]]] = self.__listing_at_hand()
+        if listing is None:
+            listing = list(
+                self.iter_gists(self.end_point, self.header, no_header=self.no_header)
+            )
+            if self.metadata_cache is not None:
+                self.metadata_cache.put("listing", self.end_point, listing)
+            else:
+                self.ceg_get_namespace["response"] = listing
+                self.ceg_get_namespace["has_response"] = True
+        else:
+            # the listing at hand was validated when it was fetched
+            self.response_status_str = validate_status_code(200)
+        return listing
+
+    def __listing_at_hand(self) -> Optional[List[Dict[str, Any]]]:
+        """Return the already fetched listing of current endpoint,if any."""
+        if self.metadata_cache is not None:
+            return self.metadata_cache.get("listing", self.end_point)
+        if self.ceg_get_namespace["has_response"]:
+            return self.ceg_get_namespace["response"]
+        return None
+
+    def __invalidate(self, gist_id: Optional[str] = None) -> None:
+        """Drop the cached metadata affected by a write.
+
+        Args:
+            gist_id: (Optional) gist-id of the modified/deleted gist.
+        """
+        if self.metadata_cache is None:
+            return None
+        self.metadata_cache.invalidate("listing")
         if gist_id is not None:
-            self.logger.info(
-                f"Inquiring for gist with id '{gist_id}'", send_log=do_logging
+            self.metadata_cache.invalidate("gist", gist_id)
+
+    def get(self, **kwargs) -> None:
+        """Download gists using gist-ids as argument.
+
+        This method downloads all the gists given on cli. backup() also uses this method internally.
+        Inquired gists are looked up in the listing if its already at hand,otherwise they are fetched
+        directly(and concurrently) by their ids.Files are downloaded concurrently by a bounded pool of
+        `max_workers` threads and a failing gist doesn't cancel the downloads of the remaining ones.
+
+        Args:
+            **kwargs = Auxiliary arbitrary keyword arguments.
+
+        Raises:
+            IncompleteOperation: raised once all downloads are settled,if one or more gists failed.
+        """
+        manifest: Optional[BackupManifest] = kwargs.get("manifest")
+        root_dir: str = kwargs.get("root_dir", os.curdir)
+        failures: Dict[str, BaseException] = {}
+        if self.is_recursive_op:
+            self.__download_gists(
+                self.__fetch_listing(),
+                failures,
+                False,
+                manifest=manifest,
+                root_dir=root_dir,
             )
-        if not self.ceg_get_namespace["has_response"]:
-            self.ceg_get_namespace["response"] = self.__send_http_request(
-                self.end_point, self.header, no_header=no_header
+            return None
+
+        self.__resolve_user()
+        gist_index: Dict[str, Dict[str, Any]] = {
+            gist["id"]: gist for gist in self.__listing_at_hand() or ()
+        }
+        gists: List[Dict[str, Any]] = []
+        unlisted_gist_ids: List[str] = []
+        for gist_id in self.arg_val:  # type: ignore
+            self.logger.info(f"Inquiring for gist with id '{gist_id}'")
+            if gist_id in gist_index:
+                gists.append(gist_index[gist_id])
+            else:
+                unlisted_gist_ids.append(gist_id)
+
+        fetched_gist_ids: List[str] = []
+        if unlisted_gist_ids:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                lookups: Dict[Future, str] = {
+                    executor.submit(self.fetch_gist, gist_id): gist_id
+                    for gist_id in unlisted_gist_ids
+                }
+                for lookup in as_completed(lookups):
+                    gist_id = lookups[lookup]
+                    try:
+                        gists.append(lookup.result())
+                    except CegExceptions.ResourceNotFound:
+                        failures[gist_id] = CegExceptions.ResourceNotFound(
+                            "The Inquired Gist was not found!"
+                        )
+                        self.logger.error(f"Gist with id '{gist_id}' was not found!")
+                    except Exception as exception:
+                        failures[gist_id] = exception
+                    else:
+                        fetched_gist_ids.append(gist_id)
+                        self.logger.info("Gist Found!")
+        self.__download_gists(
+            gists,
+            failures,
+            True,
+            manifest=manifest,
+            complete_gist_ids=fetched_gist_ids,
+            root_dir=root_dir,
+        )
+
+    def __download_gists(
+        self,
+        gists: List[Dict[str, Any]],
+        failures: Dict[str, BaseException],
+        do_logging: bool,
+        manifest: Optional[BackupManifest] = None,
+        complete_gist_ids: Collection[str] = (),
+        file_handler_factory: Optional[Callable[[str], FileHandler]] = None,
+        root_dir: str = os.curdir,
+    ) -> None:
+        """Concurrently download all the files of the given gists.
+
+        Every gist is downloaded into a directory named after its id(inside root_dir),files of all the gists
+        are queued on a bounded pool of `max_workers` threads and a failing gist doesn't cancel
+        the downloads of the remaining ones.
+
+        Args:
+            gists: json-decoded gists to download.
+            failures: mapping of already failed gist-ids to their exceptions,which is updated in place.
+            do_logging: boolean indicating whether to log the progress.
+            manifest: (Optional) backup manifest,files whose hash matches the manifest are left
+                      untouched on disk and successfully downloaded gists are recorded in it.
+            complete_gist_ids: ids of the gists fetched through the single gist endpoint,the content
+                               of their(untruncated) files is written without downloading it again.
+            file_handler_factory: (Optional) callable returning the file handler for a gist-id,
+                                  defaults to a FileHandler for a directory named after it.
+            root_dir: directory containing the gist directories,defaults to the current directory.
+
+        Raises:
+            IncompleteOperation: raised once all downloads are settled,if one or more gists failed.
+        """
+        file_handlers: Dict[str, FileHandler] = {}
+        file_records: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            truncated_gists: Dict[Future, str] = {
+                executor.submit(self.fetch_gist, gist["id"]): gist["id"]
+                for gist in gists
+                if gist.get("truncated") and gist["id"] not in complete_gist_ids
+            }
+            if truncated_gists:
+                self.logger.info(
+                    f"Fetching complete file list of {len(truncated_gists)} truncated gist(s)...",
+                    send_log=do_logging,
+                )
+            complete_gists: Dict[str, Dict[str, Any]] = {}
+            for truncated_gist in as_completed(truncated_gists):
+                if truncated_gist.exception() is not None:
+                    failures[truncated_gists[truncated_gist]] = truncated_gist.exception()  # type: ignore
+                else:
+                    complete_gists[truncated_gists[truncated_gist]] = truncated_gist.result()
+            gists = [
+                complete_gists.get(gist["id"], gist)
+                for gist in gists
+                if gist["id"] not in failures
+            ]
+
+            downloads: Dict[Future, str] = {}
+            for gist in gists:
+                gist_id: str = gist["id"]
+                file_handler: FileHandler = (
+                    file_handler_factory(gist_id)
+                    if file_handler_factory is not None
+                    else FileHandler(
+                        dir_name=os.path.join(root_dir, gist_id), exist_ok=self.incremental
+                    )
+                )
+                file_handlers[gist_id] = file_handler
+                file_records[gist_id] = {}
+                self.logger.info(
+                    "Downloading and organizing all the files!", send_log=do_logging
+                )
+                if gist.get("truncated"):
+                    # even the single gist endpoint caps the file list,only a clone has them all
+                    downloads[
+                        executor.submit(
+                            self.__clone_gist, gist, file_handler, manifest
+                        )
+                    ] = gist_id
+                    continue
+                for file_name, file_hashtable in gist.get("files").items():  # type: ignore
+                    known_hash: Optional[str] = (
+                        manifest.file_hash(gist_id, file_name) if manifest else None
+                    )
+                    if (
+                        file_hashtable.get("content") is not None
+                        and not file_hashtable.get("truncated")
+                        and file_hashtable.get("encoding", "utf-8") == "utf-8"
+                    ):
+                        # single gist responses already carry the content of small files
+                        downloads[
+                            executor.submit(
+                                self.__write_file,
+                                file_handler,
+                                file_name,
+                                file_hashtable["content"],
+                                known_hash,
+                            )
+                        ] = gist_id
+                        continue
+                    if file_hashtable.get("raw_url") is None:
+                        continue
+                    downloads[
+                        executor.submit(
+                            self.__download_file,
+                            file_handler,
+                            file_name,
+                            file_hashtable["raw_url"],
+                            known_hash,
+                        )
+                    ] = gist_id
+
+            for download in as_completed(downloads):
+                gist_id = downloads[download]
+                download_exception: Optional[BaseException] = download.exception()
+                if download_exception is not None:
+                    failures.setdefault(gist_id, download_exception)
+                else:
+                    file_records[gist_id].update(download.result())
+
+        for gist_id, failure in failures.items():
+            if gist_id in file_handlers:
+                file_handlers[gist_id].return_code = 1
+            self.logger.error(f"Failed to download the gist '{gist_id}': {failure}")
+        for gist in gists:
+            gist_id = gist["id"]
+            if gist_id in failures:
+                continue
+            if manifest is not None:
+                for stale_file in set(manifest.gists.get(gist_id, {}).get("files", {})):
+                    if stale_file not in file_records[gist_id]:
+                        file_handlers[gist_id].remove(stale_file)
+                manifest.record(gist, file_records[gist_id])
+            self.logger.info(
+                f"Sucessfully downloaded the gist '{gist_id}'!", send_log=do_logging
             )
-            self.ceg_get_namespace["has_response"] = True
+        if failures:
+            raise CegExceptions.IncompleteOperation(failures)
 
-        hashtable_response = self.ceg_get_namespace["response"]
+    def fetch_gist(self, gist_id: str) -> Dict[str, Any]:
+        """Fetch a single gist with its complete metadata.
 
-        gist_ids: List[str] = [
-            gist.get("id")  # type: ignore
-            for gist in hashtable_response  # type: ignore
-        ]
+        Args:
+            gist_id: gist-id of the gist.
 
-        gist_id_list: List[str] = (
-            gist_ids if self.is_recursive_op else self.arg_val  # type: ignore
+        Returns:
+            json-decoded gist.
+        """
+        if self.metadata_cache is not None:
+            cached_gist: Optional[Dict[str, Any]] = self.metadata_cache.get("gist", gist_id)
+            if cached_gist is not None:
+                # the cached gist was validated when it was fetched
+                self.response_status_str = validate_status_code(200)
+                return cached_gist
+        response: requests.models.Response = self.__request(
+            "get",
+            f"https://api.github.com/gists/{gist_id}",
+            self.header,
+            no_header=self.no_header,
         )
-        if not bypass_recursion:
-            do_logging = False if self.is_recursive_op else True
-            for gist in gist_id_list:
-                self.get(gist_id=gist, bypass_recursion=True, logging_status=do_logging)
-            return None
-        try:
-            gist_id_index: int = gist_ids.index(gist_id)
-        except ValueError:
-            raise CegExceptions.ResourceNotFound("The Inquired Gist was not found!")
-        self.logger.info("Gist Found!", send_log=do_logging)
-        gist_files: List[Tuple[str, str]] = [
-            (key, value)
-            for key, val in hashtable_response[gist_id_index]  # type: ignore
-            .get("files")
-            .items()
-            if (value := val.get("raw_url")) is not None  # type: ignore
-        ]
-        file_handler: FileHandler = FileHandler(dir_name=gist_id)
-        self.logger.info(
-            "Downloading and organizing all the files!", send_log=do_logging
+        self.response_status_str = self.__response_validator(response)
+        gist: Dict[str, Any] = json.loads(response.content.decode("utf-8"))
+        if self.metadata_cache is not None:
+            self.metadata_cache.put("gist", gist_id, gist)
+        return gist
+
+    def __clone_gist(
+        self,
+        gist: Dict[str, Any],
+        file_handler: FileHandler,
+        manifest: Optional[BackupManifest] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Clone a gist whose file list is truncated even by the single gist endpoint.
+
+        The gist's git repository is shallow cloned into a temporary directory and
+        every file is then streamed into the gist directory.
+
+        Args:
+            gist: json-decoded gist.
+            file_handler: FileHandler for the gist directory.
+            manifest: (Optional) backup manifest used for leaving unchanged files untouched.
+
+        Returns:
+            mapping of every file name to its size and sha256 hash.
+        """
+        file_records: Dict[str, Dict[str, Any]] = {}
+        with tempfile.TemporaryDirectory() as clone_dir:
+            try:
+                clone_process: subprocess.CompletedProcess = subprocess.run(
+                    ["git", "clone", "--quiet", "--depth", "1", gist["git_pull_url"], clone_dir],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
+            except FileNotFoundError:
+                raise CegExceptions.InternalException(
+                    "The gist has too many files for the api and git isn't available for cloning it!"
+                )
+            if clone_process.returncode != 0:
+                raise CegExceptions.InternalException(
+                    f"Failed to clone the gist: {clone_process.stderr.decode('utf-8', 'replace').strip()}"
+                )
+            for file_name in os.listdir(clone_dir):
+                file_path: str = os.path.join(clone_dir, file_name)
+                if file_name == ".git" or not os.path.isfile(file_path):
+                    continue
+                with open(file_path, "rb") as r_obj:
+                    file_size, file_hash = file_handler.write_stream(
+                        file_name,
+                        iter(lambda: r_obj.read(Misc.download_chunk_size), b""),
+                        known_hash=manifest.file_hash(gist["id"], file_name)
+                        if manifest
+                        else None,
+                    )
+                file_records[file_name] = {"size": file_size, "sha256": file_hash}
+        return file_records
+
+    @staticmethod
+    def __write_file(
+        file_handler: FileHandler,
+        file_name: str,
+        content: str,
+        known_hash: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Write the already fetched content of a file to its gist directory.
+
+        Args:
+            file_handler: FileHandler for the gist directory.
+            file_name: name of the file.
+            content: content of the file.
+            known_hash: (Optional) sha256 hash of the local copy.
+
+        Returns:
+            mapping of the file name to its size and sha256 hash.
+        """
+        file_size, file_hash = file_handler.write_stream(
+            file_name, (content.encode("utf-8"),), known_hash=known_hash
         )
-        for single_gist in gist_files:
+        return {file_name: {"size": file_size, "sha256": file_hash}}
+
+    def __download_file(
+        self,
+        file_handler: FileHandler,
+        file_name: str,
+        file_url: str,
+        known_hash: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Download a single raw file and stream it to its gist directory.
+
+        The content is written chunk by chunk as received,without being decoded,
+        so memory use stays constant and binary files are kept byte for byte.
+
+        Args:
+            file_handler: FileHandler for the gist directory.
+            file_name: name of the file.
+            file_url: raw url of the file.
+            known_hash: (Optional) sha256 hash of the local copy,if it matches the downloaded
+                        content,the local copy is left untouched.
+
+        Returns:
+            mapping of the file name to its size and sha256 hash.
+        """
+        import requests
+
+        attempt: int = 0
+        while True:
             try:
-                file_name: str
-                file_url: str
-                file_name, file_url = single_gist
-                file_content = requests.get(url=file_url).content.decode("utf-8")
-                file_handler.write(file_name, file_content)
+                with self.session.request("get", file_url, stream=True) as response:
+                    self.__response_validator(response)
+                    file_size: int
+                    file_hash: str
+                    file_size, file_hash = file_handler.write_stream(
+                        file_name,
+                        response.iter_content(chunk_size=Misc.download_chunk_size),
+                        known_hash=known_hash,
+                    )
+                break
+            except requests.exceptions.ChunkedEncodingError:
+                # connection dropped mid-stream,the partial file has already been discarded
+                if not self.session.retry_policy.should_retry("get", attempt):
+                    raise
+                self.session.retry_policy.sleep(attempt)
+                attempt += 1
             except requests.exceptions.ConnectionError:
-                file_handler.return_code = 1
                 raise requests.exceptions.ConnectionError(
                     "Connection Error!,please check your internet connection."
                 )
-        self.logger.info("Sucessfully downloaded the gist!", send_log=do_logging)
+        return {file_name: {"size": file_size, "sha256": file_hash}}
 
     def post(self, **kwargs) -> Optional[str]:
         """Create gists.
 
-        Creates arbitrary number of gists depending on files given on cli.
+        Creates arbitrary number of gists depending on files given on cli.when patching,only the
+        files that differ from the remote gist(along with renamed and deleted ones) are sent and
+        nothing is sent at all if the gist is already up to date.
 
         Args:
             **kwargs: Auxiliary arbitrary keyword arguments.
@@ -455,11 +1000,13 @@ class Ceg:
 
         is_patch = kwargs.get("is_patch")
         new_filenames = kwargs.get("new_filenames")
+        deleted_filenames: List[str] = kwargs.get("deleted_filenames", [])
 
         op_success_msg: Dict[str, str] = {"post": "published", "patch": "updated"}
         all_files_validate: bool = True
         files_to_ignore: List[str] = []
-        file_to_content_map: Dict[str, Dict[str, str]] = {}
+        file_to_content_map: Dict[str, Optional[Dict[str, str]]] = {}
+        local_files: Dict[str, str] = {}
         for file in self.arg_val:  # type: ignore
             if not os.path.exists(file):
                 self.logger.info(
@@ -480,24 +1027,45 @@ class Ceg:
                 self.logger.warning(f"{file} will be ignored!")
                 files_to_ignore.append(file)
                 continue
+            if is_patch:
+                # read(only if needed) once compared against the remote gist
+                local_files[file_basename] = file
+                continue
             with open(file, "r", encoding="utf-8") as r_obj:
                 file_content: str = r_obj.read()
             file_to_content_map.update({file_basename: {"content": file_content}})
-            if is_patch and new_filenames.get(file_basename):  # type: ignore
-                file_to_content_map[file_basename].update(
-                    {"filename": new_filenames.get(file_basename)}  # type: ignore
-                )
 
         if not all_files_validate:
             self.logger.warning(
                 "One or more files were found to have filenames that are prohibited by github and hence will be ignored."
             )
+        if is_patch:
+            remote_gist: Dict[str, Any] = self.fetch_gist(self.gist_id)  # type: ignore
+            unchanged_files: List[str]
+            file_to_content_map, unchanged_files = diff_gist_files(
+                remote_gist.get("files") or {},
+                local_files,
+                renames=new_filenames,
+                deletions=deleted_filenames,
+                remote_hash=self.__remote_file_hash,
+            )
+            if unchanged_files:
+                self.logger.info(
+                    f"{len(unchanged_files)} file(s) unchanged: {', '.join(unchanged_files)}"
+                )
+            if self.gist_description == remote_gist.get("description"):
+                self.gist_description = None
+            if not file_to_content_map and not self.gist_description:
+                self.response_status_str = "Not Modified!"
+                self.logger.info("The gist is already up to date!")
+                return None
         self.payload.update({"files": file_to_content_map})
         if is_patch is None:
             self.payload.update({"public": not self.gist_no_public})
         if self.gist_description:
             self.payload.update({"description": self.gist_description})
         gist_html_url = self.__send_http_request(params=json.dumps(self.payload))
+        self.__invalidate(self.gist_id if is_patch else None)
         self.logger.info(f"Sucessfully {op_success_msg[self.http_operation]} the gist!")
         if self.http_operation == "post":
             if self.to_stdout:
@@ -506,58 +1074,561 @@ class Ceg:
                 return gist_html_url  # type: ignore
         return None
 
+    def __remote_file_hash(self, remote_file: Dict[str, Any]) -> Optional[str]:
+        """Stream a(truncated) remote file and return its sha256 hash,None if it can't be fetched."""
+        if remote_file.get("raw_url") is None:
+            return None
+        hash_obj = hashlib.sha256()
+        try:
+            with self.session.request("get", remote_file["raw_url"], stream=True) as response:
+                self.__response_validator(response)
+                for chunk in response.iter_content(chunk_size=Misc.download_chunk_size):
+                    hash_obj.update(chunk)
+        except Exception:
+            # the file is then just uploaded,which is always correct
+            return None
+        return hash_obj.hexdigest()
+
+    def post_bulk(
+        self, raise_on_failure: bool = True
+    ) -> Dict[str, Union[str, BaseException]]:
+        """Create gists in bulk.
+
+        Loads the gists to create from the manifest or directory given as argument(see
+        `ceg.bulk.load_bulk_entries`) and creates all of them concurrently on a bounded
+        pool of `max_workers` threads,reading and validating the files of every entry
+        in its own worker.a failing entry doesn't stop the remaining ones.
+
+        Args:
+            raise_on_failure: boolean indicating whether to raise once all entries are settled,
+                              if one or more of them failed.
+
+        Returns:
+            mapping of every entry name to the html url of its gist or the exception it failed with.
+
+        Raises:
+            IncompleteOperation: raised if one or more entries failed and raise_on_failure is set.
+        """
+        entries: List[Dict[str, Any]] = load_bulk_entries(
+            self.arg_val, is_private=self.gist_no_public  # type: ignore
+        )
+        self.logger.info(f"Publishing {len(entries)} gist(s)...")
+        outcomes: Dict[str, Union[str, BaseException]] = {
+            entry["name"]: "" for entry in entries
+        }
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            creations: Dict[Future, str] = {
+                executor.submit(self.__create_gist, entry): entry["name"]
+                for entry in entries
+            }
+            for creation in as_completed(creations):
+                entry_name: str = creations[creation]
+                try:
+                    outcomes[entry_name] = creation.result()
+                except Exception as exception:
+                    outcomes[entry_name] = exception
+                    self.logger.error(f"Failed to publish '{entry_name}': {exception}")
+                else:
+                    self.logger.info(f"Published '{entry_name}': {outcomes[entry_name]}")
+        failures: Dict[str, BaseException] = {
+            name: outcome
+            for name, outcome in outcomes.items()
+            if isinstance(outcome, BaseException)
+        }
+        if failures and raise_on_failure:
+            raise CegExceptions.IncompleteOperation(failures)
+        return outcomes
+
+    def __create_gist(self, entry: Dict[str, Any]) -> str:
+        """Read,validate and publish the files of a single bulk entry.
+
+        Args:
+            entry: bulk entry containing `files`,`description` and `public`.
+
+        Returns:
+            html url of the newly created gist.
+        """
+        file_to_content_map: Dict[str, Dict[str, str]] = {}
+        for file in entry["files"]:
+            file_basename: str = os.path.basename(file)
+            if not gist_filename_validated(file_basename):
+                self.logger.warning(f"{file} will be ignored!")
+                continue
+            with open(file, "r", encoding="utf-8") as r_obj:
+                file_to_content_map[file_basename] = {"content": r_obj.read()}
+        if not file_to_content_map:
+            raise CegExceptions.UnprocessableRequest("No publishable files found!")
+        payload: Dict[str, Any] = {
+            "files": file_to_content_map,
+            "public": entry["public"],
+        }
+        if entry.get("description"):
+            payload["description"] = entry["description"]
+        response: requests.models.Response = self.__request(
+            "post", self.end_point, self.header, data=json.dumps(payload)
+        )
+        self.__response_validator(response)
+        self.__invalidate()
+        return json.loads(response.content.decode("utf-8")).get("html_url")
+
     def patch(self) -> None:
         """Modify an existing gist."""
         if self.gist_id is None:
             raise CegExceptions.InsufficientSubArguments("--gist-id missing!")
         new_filename_map: Dict[str, str] = {}
+        deleted_filenames: List[str] = []
         self.end_point += "/" + self.gist_id
 
-        for file_index, file in enumerate(self.arg_val):  # type: ignore
+        local_files: List[str] = []
+        for file in self.arg_val:  # type: ignore
             try:
                 oldname, newname = file.split("->")
-                oldname_base: str = os.path.basename(oldname)
-                new_filename_map.update({oldname_base: newname})
-                self.arg_val[file_index] = oldname  # type: ignore
             except ValueError:
-                pass
-        self.post(is_patch=True, new_filenames=new_filename_map)
-
-    def delete(self) -> None:
-        """Delete an existing gist."""
-        endpoint_copy: str = self.end_point
-        for gist in self.arg_val:  # type: ignore
-            self.logger.info(f"Searching and deleting gist with id '{gist[:4]}...'")
-            self.end_point = "{}/{}".format(endpoint_copy, gist)  # type: ignore
-            self.__send_http_request()
-            self.logger.info("Gist deleted sucessfully!.")
+                local_files.append(file)
+                continue
+            oldname_base: str = os.path.basename(oldname)
+            if not newname:
+                # `name->` deletes the file from the gist
+                deleted_filenames.append(oldname_base)
+                continue
+            new_filename_map.update({oldname_base: newname})
+            if os.path.exists(oldname):
+                local_files.append(oldname)
+        self.arg_val = local_files  # type: ignore
+        self.post(
+            is_patch=True,
+            new_filenames=new_filename_map,
+            deleted_filenames=deleted_filenames,
+        )
+
+    def delete(
+        self, raise_on_failure: bool = True
+    ) -> Dict[str, Union[str, BaseException]]:
+        """Delete existing gists concurrently.
+
+        Deletions are issued on a bounded pool of `max_workers` threads and a failing
+        deletion(i.e a 404) doesn't stop the remaining ones.
+
+        Args:
+            raise_on_failure: boolean indicating whether to raise once all deletions are settled,
+                              if one or more of them failed.
+
+        Returns:
+            mapping of every gist-id to its outcome,i.e the response status string on success
+            or the exception it failed with.
+
+        Raises:
+            IncompleteOperation: raised if one or more deletions failed and raise_on_failure is set.
+        """
+        outcomes: Dict[str, Union[str, BaseException]] = {
+            gist: "" for gist in self.arg_val  # type: ignore
+        }
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            deletions: Dict[Future, str] = {
+                executor.submit(self.__delete_gist, gist): gist for gist in outcomes
+            }
+            for deletion in as_completed(deletions):
+                gist = deletions[deletion]
+                try:
+                    outcomes[gist] = deletion.result()
+                except Exception as exception:
+                    outcomes[gist] = exception
+                    self.logger.error(f"Failed to delete gist '{gist[:4]}...': {exception}")
+                else:
+                    self.response_status_str = outcomes[gist]  # type: ignore
+                    self.logger.info(f"Gist '{gist[:4]}...' deleted sucessfully!.")
+        failures: Dict[str, BaseException] = {
+            gist: outcome
+            for gist, outcome in outcomes.items()
+            if isinstance(outcome, BaseException)
+        }
+        if failures and raise_on_failure:
+            raise CegExceptions.IncompleteOperation(failures)
+        return outcomes
+
+    def __delete_gist(self, gist_id: str) -> str:
+        """Delete a single gist.
+
+        Args:
+            gist_id: gist-id of the gist.
+
+        Returns:
+            Response status string.
+        """
+        self.logger.info(f"Searching and deleting gist with id '{gist_id[:4]}...'")
+        response: requests.models.Response = self.__request(
+            "delete", f"{self.end_point}/{gist_id}", self.header
+        )
+        response_status: str = self.__response_validator(response)
+        self.__invalidate(gist_id)
+        return response_status
 
     def backup(self) -> None:
-        """Create a local backup of all the gists."""
+        """Create a local backup of all the gists in backup_dir.
+
+        A manifest of all the backed up gists is kept in the backup directory.in incremental mode,
+        an existing backup is updated using that manifest: only added or changed gists are downloaded,
+        unchanged files are left alone and removed gists are archived(or deleted).
+        """
+        import requests
+
         self.logger.info("Backing up all gists to local media...")
-        dir_handler: FileHandler = FileHandler("GIST-BACKUP")
-        os.chdir("GIST-BACKUP")
+        if self.archive_format is not None or self.snapshot_dir is not None:
+            if self.incremental:
+                raise CegExceptions.InsufficientSubArguments(
+                    "--archive/--snapshot can't be combined with --incremental!"
+                )
+            if self.snapshot_dir is not None:
+                self.__snapshot_backup()
+            else:
+                self.__archive_backup()
+            self.logger.info("Backup successfull!")
+            return None
+        # paths are resolved against backup_dir instead of changing the working directory,
+        # so that backups can run side by side in a single process
+        dir_handler: FileHandler = FileHandler(
+            self.backup_dir, exist_ok=self.incremental
+        )
         try:
-            self.get()
+            if self.incremental:
+                self.__incremental_backup()
+            else:
+                # record the fresh backup,so that the next run can be incremental
+                manifest: BackupManifest = BackupManifest(self.backup_dir)
+                try:
+                    self.get(manifest=manifest, root_dir=self.backup_dir)
+                finally:
+                    manifest.save()
         except requests.exceptions.ConnectionError:
             raise requests.exceptions.ConnectionError(
                 "Connection Error!,please check your internet connection."
             )
         except Exception:
-            os.chdir("../")
             dir_handler.return_code = 1
             raise sys.exc_info()[1]  # type: ignore
         else:
             self.logger.info("Backup successfull!")
 
-    def list_other(self) -> Optional[List[Dict[str, str]]]:
+    def backup_accounts(
+        self, raise_on_failure: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """Back up the gists of many accounts,concurrently.
+
+        Loads the accounts given as argument(see `ceg.accounts.load_accounts`) and backs up up to
+        `max_accounts` of them at once,every account into its own directory inside backup_dir(or
+        snapshot_dir) named after its user.all the accounts share the pooled connections,username
+        accounts also share the rate limit budget(of the shared secret key) while every token is
+        paced according to its own budget.the working directory is never changed.a failing account doesn't
+        stop the remaining ones.
+
+        Args:
+            raise_on_failure: boolean indicating whether to raise once all accounts are settled,
+                              if one or more of them(or their gists) failed.
+
+        Returns:
+            mapping of every account name to its summary,containing its `label`(as logged),the `root` directory(archives are
+            written next to it,as `<root>-<timestamp>.tar.<compression>`),number of
+            listed `gists`,the `failures`(mapping of gist-id to exception) and the `error` it failed with(if any).
+
+        Raises:
+            IncompleteOperation: raised if one or more accounts failed and raise_on_failure is set.
+        """
+        accounts: List[Dict[str, Optional[str]]] = load_accounts(
+            [self.arg_val] if isinstance(self.arg_val, str) else self.arg_val  # type: ignore
+        )
+        self.logger.info(f"Backing up the gists of {len(accounts)} account(s)...")
+        os.makedirs(self.snapshot_dir or self.backup_dir, exist_ok=True)
+        claimed_names: Dict[str, str] = {}
+        claim_lock: threading.Lock = threading.Lock()
+        summaries: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_accounts) as executor:
+            backups: Dict[Future, Dict[str, Optional[str]]] = {
+                executor.submit(
+                    self.__backup_account, account, claimed_names, claim_lock
+                ): account
+                for account in accounts
+            }
+            for backup in as_completed(backups):
+                summary: Dict[str, Any] = backup.result()
+                summaries[summary.pop("name")] = summary
+                if summary["error"] is not None:
+                    self.logger.error(
+                        f"Failed to back up '{summary['label']}': {summary['error']}"
+                    )
+                else:
+                    self.logger.info(
+                        f"Backed up '{summary['label']}'({summary['gists']} gist(s),"
+                        f"{len(summary['failures'])} failed) to '{summary['root']}'."
+                    )
+        failures: Dict[str, BaseException] = {
+            name: summary["error"]
+            or CegExceptions.IncompleteOperation(summary["failures"])
+            for name, summary in summaries.items()
+            if summary["error"] is not None or summary["failures"]
+        }
+        self.logger.info(
+            f"{len(summaries) - len(failures)} of {len(summaries)} account(s) backed up,"
+            f"{sum(summary['gists'] for summary in summaries.values())} gist(s) in total."
+        )
+        if failures and raise_on_failure:
+            raise CegExceptions.IncompleteOperation(failures)
+        return summaries
+
+    def __backup_account(
+        self,
+        account: Dict[str, Optional[str]],
+        claimed_names: Dict[str, str],
+        claim_lock: threading.Lock,
+    ) -> Dict[str, Any]:
+        """Back up a single account of backup_accounts().
+
+        Args:
+            account: account as returned by `load_accounts`.
+            claimed_names: mapping of the(lowercased) account names already backed up to their label,
+                           so that two entries resolving to the same user don't share a directory.
+            claim_lock: lock guarding claimed_names.
+
+        Returns:
+            summary of the account,containing its `name` and `label` along with the summary keys
+            of backup_accounts().
+        """
+        ceg_obj: Ceg = Ceg(
+            operation="get",
+            arg_value="",
+            is_recursive_operation=True,
+            is_other_user=False,
+            secret_key=account["secret_key"] or self.__secret_key,
+            do_logging=self.to_stdout,
+            gist_no_public=False,
+            gist_desc=None,
+            gist_id=None,
+            # every token has a budget of its own,so its paced by a governor of its own(over the shared pool)
+            session=self.session
+            if account["secret_key"] is None
+            else self.session.with_governor(
+                RateLimitGovernor(
+                    pace_below=self.session.governor.pace_below,
+                    max_pause=self.session.governor.max_pause,
+                    max_pauses=self.session.governor.max_pauses,
+                )
+            ),
+            max_workers=self.max_workers,
+            http_cache=self.http_cache,
+            # listings of different credentials share the endpoint,so aren't cached in memory
+            metadata_cache=self.metadata_cache if account["secret_key"] is None else None,
+        )
+        ceg_obj.logger = self.logger
+        ceg_obj.incremental = self.incremental
+        ceg_obj.delete_removed = self.delete_removed
+        ceg_obj.archive_format = self.archive_format
+        summary: Dict[str, Any] = {
+            "name": account["label"],
+            "label": account["label"],
+            "root": None,
+            "gists": 0,
+            "failures": {},
+            "error": None,
+        }
+        try:
+            if account["user"] is not None:
+                account_name: str = account["user"]
+                ceg_obj.end_point = f"https://api.github.com/users/{account_name}/gists"
+                ceg_obj.no_header = ceg_obj.__secret_key is None
+            else:
+                account_name = ceg_obj.__account_login()
+            with claim_lock:
+                claimed_by: str = claimed_names.setdefault(
+                    account_name.lower(), account["label"]  # type: ignore
+                )
+            if claimed_by != account["label"]:
+                raise CegExceptions.InternalException(
+                    f"'{account_name}' is already backed up by '{claimed_by}'!"
+                )
+            if account_name != account["label"]:
+                summary["name"] = account_name
+                summary["label"] = f"{account_name}({account['label']})"
+            ceg_obj.backup_dir = os.path.join(self.backup_dir, account_name)
+            if self.snapshot_dir is not None:
+                ceg_obj.snapshot_dir = os.path.join(self.snapshot_dir, account_name)
+            summary["root"] = ceg_obj.snapshot_dir or ceg_obj.backup_dir
+            try:
+                ceg_obj.backup()
+            except CegExceptions.IncompleteOperation as exception:
+                summary["failures"] = exception.failures
+            summary["gists"] = len(ceg_obj.__listing_at_hand() or ())
+        except Exception as exception:
+            summary["error"] = exception
+        return summary
+
+    def __account_login(self) -> str:
+        """Return the login of the user the secret key belongs to."""
+        response: requests.models.Response = self.__request(
+            "get", "https://api.github.com/user", self.header
+        )
+        self.__response_validator(response)
+        return json.loads(response.content.decode("utf-8"))["login"]
+
+    def __archive_backup(self) -> None:
+        """Stream all the gists into a single compressed archive next to backup_dir."""
+        listing: List[Dict[str, Any]] = self.__fetch_listing()
+        archive_path: str = (
+            f"{self.backup_dir}-{time.strftime('%Y%m%d-%H%M%S')}.tar.{self.archive_format}"
+        )
+        archive: ArchiveWriter = ArchiveWriter(archive_path, self.archive_format)  # type: ignore
+        try:
+            self.__download_gists(
+                listing,
+                {},
+                False,
+                file_handler_factory=archive.gist_handler,  # type: ignore
+            )
+        except BaseException as exception:
+            if not isinstance(exception, CegExceptions.IncompleteOperation):
+                archive.abort()
+                raise
+            # keep the archive of the gists that were downloaded,failed ones are left out of its index
+            archive.close({gist["id"]: gist.get("updated_at") for gist in listing})
+            raise
+        archive.close({gist["id"]: gist.get("updated_at") for gist in listing})
+        self.logger.info(f"Gists archived to '{archive_path}'.")
+
+    def __snapshot_backup(self) -> None:
+        """Record a snapshot of all the gists,only downloading the ones changed since the latest snapshot."""
+        snapshot_store: SnapshotStore = SnapshotStore(self.snapshot_dir)  # type: ignore
+        previous_gists: Dict[str, Dict[str, Any]] = snapshot_store.latest()
+        listing: List[Dict[str, Any]] = self.__fetch_listing()
+        changed_gists: List[Dict[str, Any]] = [
+            gist
+            for gist in listing
+            if previous_gists.get(gist["id"], {}).get("updated_at") != gist.get("updated_at")
+        ]
+        self.logger.info(
+            f"{len(changed_gists)} of {len(listing)} gist(s) changed since the latest snapshot."
+        )
+        gist_handlers: Dict[str, SnapshotGistHandler] = {}
+
+        def gist_handler(gist_id: str) -> SnapshotGistHandler:
+            gist_handlers[gist_id] = SnapshotGistHandler(snapshot_store)
+            return gist_handlers[gist_id]
+
+        incomplete_operation: Optional[CegExceptions.IncompleteOperation] = None
+        try:
+            self.__download_gists(
+                changed_gists, {}, False, file_handler_factory=gist_handler  # type: ignore
+            )
+        except CegExceptions.IncompleteOperation as exception:
+            incomplete_operation = exception
+        failed_gist_ids: Collection[str] = (
+            incomplete_operation.failures if incomplete_operation else ()
+        )
+        snapshot_gists: Dict[str, Dict[str, Any]] = {}
+        for gist in listing:
+            gist_id: str = gist["id"]
+            if gist_id in gist_handlers and gist_id not in failed_gist_ids:
+                snapshot_gists[gist_id] = {
+                    "updated_at": gist.get("updated_at"),
+                    "files": gist_handlers[gist_id].files,
+                }
+            elif gist_id in previous_gists:
+                # unchanged(or failed to download),so the previous version is referenced
+                snapshot_gists[gist_id] = previous_gists[gist_id]
+        snapshot_id: str = snapshot_store.commit(snapshot_gists)
+        self.logger.info(f"Recorded snapshot '{snapshot_id}'.")
+        if incomplete_operation is not None:
+            raise incomplete_operation
+
+    def prune_snapshots(self) -> List[str]:
+        """Drop the snapshots outside the retention policy(keep_last/keep_daily) and their unreferenced contents.
+
+        Returns:
+            ids of the dropped snapshots.
+        """
+        snapshot_store: SnapshotStore = SnapshotStore(
+            self.snapshot_dir or self.arg_val  # type: ignore
+        )
+        dropped_snapshots: List[str] = snapshot_store.prune(
+            keep_last=self.keep_last, keep_daily=self.keep_daily
+        )
+        self.logger.info(
+            f"Pruned {len(dropped_snapshots)} snapshot(s),{len(snapshot_store.snapshots())} left."
+        )
+        return dropped_snapshots
+
+    def __incremental_backup(self) -> None:
+        """Update the backup in backup_dir using its manifest."""
+        manifest: BackupManifest = BackupManifest(self.backup_dir)
+        changed_gists: List[Dict[str, Any]]
+        removed_gist_ids: List[str]
+        changed_gists, removed_gist_ids = manifest.diff(self.__fetch_listing())
+        self.logger.info(
+            f"{len(changed_gists)} added/changed and {len(removed_gist_ids)} removed gist(s) found."
+        )
+        try:
+            self.__download_gists(
+                changed_gists, {}, False, manifest=manifest, root_dir=self.backup_dir
+            )
+        finally:
+            removed_dir: str = os.path.join(self.backup_dir, ".removed")
+            for gist_id in removed_gist_ids:
+                gist_dir: str = os.path.join(self.backup_dir, gist_id)
+                if os.path.isdir(gist_dir):
+                    if self.delete_removed:
+                        shutil.rmtree(gist_dir)
+                    else:
+                        os.makedirs(removed_dir, exist_ok=True)
+                        archive_path: str = os.path.join(removed_dir, gist_id)
+                        if os.path.exists(archive_path):
+                            archive_path += f"-{int(time.time())}"
+                        shutil.move(gist_dir, archive_path)
+                manifest.forget(gist_id)
+            manifest.save()
+
+    def search(self, limit: int = 20) -> Optional[List[Dict[str, Any]]]:
+        """Search the contents of the local backup.
+
+        Looks up the words given as argument in the search index of the backup in
+        `backup_dir`,without any network access.the index is built lazily,on the first search
+        of a backup,and later searches only reindex the files changed since(as per the manifest).
+
+        Args:
+            limit: maximum number of results.
+
+        Returns:
+            (Optionally) returns the ranked results,each containing `gist_id`,`file`,`line`,`text` and `score`.
+
+        Raises:
+            ResourceNotFound: raised if there's no backup in backup_dir.
+        """
+        manifest: BackupManifest = BackupManifest(self.backup_dir)
+        if not os.path.exists(manifest.path):
+            raise CegExceptions.ResourceNotFound(
+                f"No backup found in '{self.backup_dir}'!,create one with --backup first."
+            )
+        with SearchIndex(self.backup_dir) as search_index:
+            search_index.update(manifest)
+            results: List[Dict[str, Any]] = search_index.search(
+                self.arg_val, limit=limit  # type: ignore
+            )
+        if not self.to_stdout:
+            return results
+        from rich.markup import escape
+
+        self.logger.info(f"{len(results)} result(s) found.")
+        for result in results:
+            get_console().print(
+                f"[yellow]{result['gist_id']}[/yellow] [magenta]{escape(result['file'])}[/magenta]"
+                f":[cyan]{result['line']}[/cyan]  {escape(result['text'])}"
+            )
+        return None
+
+    def list_other(self) -> Optional[List[GistRecord]]:
         """Get gists for other users
 
         This method simply mutates the endpoint and nulls the auth headers and simply calls the list() method.
         Args:
             user_name: github username for the other user.
         Returns:
-            (Optionally) returns a list containing all gists.
+            (Optionally) returns a list of records of all gists,if not writing to stdout.
         """
         prefix: str
         suffix: str
@@ -568,7 +1639,7 @@ class Ceg:
                 f"Expected username argument of pattern `user:user_name` but got `{self.arg_val}`"
             )
         assert prefix == "user"
-        user_gist_info: Optional[List[Dict[str, str]]] = self.list(
+        user_gist_info: Optional[List[GistRecord]] = self.list(
             end_point=f"https://api.github.com/users/{suffix}/gists",
             no_header=True,
         )
@@ -577,6 +1648,160 @@ class Ceg:
         else:
             return None
 
+    def sync(self, raise_on_failure: bool = True) -> Dict[str, Any]:
+        """Sync a directory(given as argument along with the gist-id) with a gist,both ways.
+
+        The state of the directory and gist as of the last sync is kept in the directory(see
+        `ceg.sync.SyncState`),files changed on one side only are uploaded to(or downloaded from)
+        the other one and files changed differently on both sides are reported as conflicts,
+        without touching either copy.the gist is requested conditionally,so re-syncing an
+        unchanged directory costs a single `304 Not Modified` request.
+
+        Args:
+            raise_on_failure: boolean indicating whether to raise once the sync is settled,if one
+                              or more files conflicted or failed to sync.
+
+        Returns:
+            the sync plan(see `ceg.sync.plan_sync`) along with the `failures`,a mapping of file name
+            to the exception it failed to sync with.
+
+        Raises:
+            SyncConflict: raised if one or more files conflicted and raise_on_failure is set.
+            IncompleteOperation: raised if one or more files failed to sync and raise_on_failure is set.
+        """
+        sync_dir, gist_id = self.arg_val  # type: ignore
+        os.makedirs(sync_dir, exist_ok=True)
+        state: SyncState = SyncState(sync_dir, gist_id)
+        local_files: Dict[str, Dict[str, Any]] = scan_directory(sync_dir, state.files)
+        gist_url: str = f"https://api.github.com/gists/{gist_id}"
+        request_header: Dict[str, str] = {} if self.no_header else dict(self.header)
+        if state.revision is not None and state.etag is not None:
+            request_header["If-None-Match"] = state.etag
+        response: requests.models.Response = self.session.request(
+            "get", gist_url, headers=request_header or None
+        )
+        remote_files: Dict[str, Dict[str, Any]] = {}
+        remote_hashes: Optional[Dict[str, str]] = None
+        if response.status_code == 304:
+            self.logger.info("The gist hasn't changed since the last sync.")
+        else:
+            self.__response_validator(response)
+            remote_gist: Dict[str, Any] = json.loads(response.content.decode("utf-8"))
+            remote_files = remote_gist.get("files") or {}
+            remote_revision: Optional[str] = self.__gist_revision(remote_gist)
+            if state.revision is None or remote_revision != state.revision:
+                remote_hashes = {
+                    file_name: self.__synced_file_hash(remote_file)
+                    for file_name, remote_file in remote_files.items()
+                }
+            state.revision = remote_revision
+            state.etag = response.headers.get("ETag")
+
+        plan: Dict[str, List[str]] = plan_sync(state.files, local_files, remote_hashes)
+        failures: Dict[str, BaseException] = {}
+        for file_name, local_file in local_files.items():
+            # unchanged(possibly just touched) files are recorded with their current mtime
+            if file_name in state.files and local_file["sha256"] == state.files[file_name]["sha256"]:
+                state.files[file_name] = local_file
+        for file_name in plan["agreed"]:
+            if file_name in local_files:
+                state.files[file_name] = local_files[file_name]
+            else:
+                state.files.pop(file_name, None)
+
+        file_handler: FileHandler = FileHandler(sync_dir, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            downloads: Dict[Future, str] = {}
+            for file_name in plan["download"]:
+                remote_file: Dict[str, Any] = remote_files[file_name]
+                if remote_file.get("content") is not None and not remote_file.get("truncated"):
+                    download: Future = executor.submit(
+                        self.__write_file, file_handler, file_name, remote_file["content"]
+                    )
+                else:
+                    download = executor.submit(
+                        self.__download_file, file_handler, file_name, remote_file["raw_url"]
+                    )
+                downloads[download] = file_name
+            for download in as_completed(downloads):
+                file_name = downloads[download]
+                if download.exception() is not None:
+                    failures[file_name] = download.exception()  # type: ignore
+                    continue
+                stat_result: os.stat_result = os.stat(os.path.join(sync_dir, file_name))
+                state.files[file_name] = {
+                    "mtime": stat_result.st_mtime,
+                    "size": stat_result.st_size,
+                    "sha256": download.result()[file_name]["sha256"],
+                }
+        for file_name in plan["delete_local"]:
+            file_handler.remove(file_name)
+            state.files.pop(file_name, None)
+
+        files_payload: Dict[str, Optional[Dict[str, str]]] = {
+            file_name: None for file_name in plan["delete_remote"]
+        }
+        for file_name in plan["upload"]:
+            try:
+                # read without newline translation,so that the gist gets the exact bytes that were hashed
+                with open(os.path.join(sync_dir, file_name), "r", encoding="utf-8", newline="") as r_obj:
+                    files_payload[file_name] = {"content": r_obj.read()}
+            except (OSError, UnicodeDecodeError) as exception:
+                failures[file_name] = exception
+        if files_payload:
+            try:
+                patch_response: requests.models.Response = self.__request(
+                    "patch", gist_url, self.header, data=json.dumps({"files": files_payload})
+                )
+                self.__response_validator(patch_response)
+            except Exception as exception:
+                failures.update({file_name: exception for file_name in files_payload})
+            else:
+                self.__invalidate(gist_id)
+                state.revision = self.__gist_revision(
+                    json.loads(patch_response.content.decode("utf-8"))
+                )
+                # the ETag of the updated gist is only known once its requested again
+                state.etag = None
+                for file_name in files_payload:
+                    if files_payload[file_name] is None:
+                        state.files.pop(file_name, None)
+                    else:
+                        state.files[file_name] = local_files[file_name]
+        if plan["conflicts"] or failures:
+            # the gist has to be compared file by file again on next sync
+            state.revision = state.etag = None
+        state.save()
+
+        self.logger.info(
+            f"{len(plan['upload'])} uploaded,{len(plan['download'])} downloaded,"
+            f"{len(plan['delete_remote'])} deleted remotely,{len(plan['delete_local'])} deleted locally."
+        )
+        for file_name, failure in failures.items():
+            self.logger.error(f"Failed to sync '{file_name}': {failure}")
+        if raise_on_failure and plan["conflicts"]:
+            raise CegExceptions.SyncConflict(plan["conflicts"])
+        if raise_on_failure and failures:
+            raise CegExceptions.IncompleteOperation(failures)
+        return dict(plan, failures=failures)
+
+    @staticmethod
+    def __gist_revision(gist: Dict[str, Any]) -> Optional[str]:
+        """Return the latest revision of a json-decoded gist."""
+        history: List[Dict[str, Any]] = gist.get("history") or []
+        return history[0].get("version") if history else gist.get("updated_at")
+
+    def __synced_file_hash(self, remote_file: Dict[str, Any]) -> str:
+        """Return the sha256 hash of a remote file,streaming it if the api truncates its content."""
+        if remote_file.get("content") is not None and not remote_file.get("truncated"):
+            return hashlib.sha256(remote_file["content"].encode("utf-8")).hexdigest()
+        file_hash: Optional[str] = self.__remote_file_hash(remote_file)
+        if file_hash is None:
+            raise CegExceptions.InternalException(
+                f"Failed to fetch '{remote_file.get('filename')}' for comparing it!"
+            )
+        return file_hash
+
     def perform_operation(self) -> int:
         """Wrapper for all the methods
 
@@ -591,6 +1816,8 @@ class Ceg:
             BadCredentials:  raised due to bad github secret key.
             ResourceNotFound: raised due to inavailability of inquired resource.
         """
+        import requests
+
         try:
             if self.arg_val == "self" and not self.is_recursive_op:
                 self.list()
@@ -606,6 +1833,11 @@ class Ceg:
             CegExceptions.ResourceNotFound,
             CegExceptions.UnprocessableRequest,
             CegExceptions.InsufficientSubArguments,
+            CegExceptions.IncompleteOperation,
+            CegExceptions.SyncConflict,
+            CegExceptions.ServerError,
+            CegExceptions.ForbiddenResource,
+            CegExceptions.BadManifest,
             requests.exceptions.ConnectionError,
         ):
             self.logger.exception("An Error has occured!")
@@ -617,3 +1849,5 @@ class Ceg:
             return GenericReturnCodes.FAILURE
         else:
             return GenericReturnCodes.SUCCESS
+        finally:
+            self.close()
@@ -23,10 +23,9 @@
 """ Main cli """
 
 import sys
-from .ceg import Ceg
 from .misc import Misc
 from .arg_parser import ArgumentParser
-from typing import Optional, Any
+from typing import Dict, Optional, Any
 
 
 def ceg_cli() -> None:
@@ -37,6 +36,14 @@ def ceg_cli() -> None:
     """
     arg_parse_obj: ArgumentParser = ArgumentParser()
     parsed_args = arg_parse_obj.reccord_arguments()
+    # heavy dependencies(requests,rich) are only imported once there's actual work to do,
+    # so that i.e --help/--version stay snappy
+    import sqlite3
+    from .ceg import Ceg
+    from .cache import HttpCache
+    from .store import MetadataStore
+    from .logger import Logger
+
     http_operation: str
     gist_description: Optional[str] = None
     gist_id: Optional[str] = None
@@ -44,6 +51,21 @@ def ceg_cli() -> None:
     is_other: bool = False
     logging_status: bool = True
     gist_no_public: bool = False
+    max_workers: Optional[int] = None
+    retries: Optional[int] = None
+    incremental: bool = False
+    delete_removed: bool = False
+    use_http_cache: bool = True
+    offline: bool = False
+    list_filters: Dict[str, Any] = {}
+    metadata_store: Optional["MetadataStore"] = None
+    backup_dir: Optional[str] = None
+    archive_format: Optional[str] = None
+    snapshot: bool = False
+    keep_last: Optional[int] = None
+    keep_daily: Optional[int] = None
+    output_format: Optional[str] = None
+    max_accounts: Optional[int] = None
     argument_value: Optional[Any]
 
     for arg, arg_val in vars(parsed_args).items():
@@ -57,6 +79,43 @@ def ceg_cli() -> None:
             gist_description = arg_val
         elif arg == "gist_id" and arg_val:
             gist_id = arg_val
+        elif arg == "jobs" and arg_val:
+            max_workers = arg_val
+        elif arg == "retries" and arg_val is not None:
+            retries = arg_val
+        elif arg == "no_cache" and arg_val:
+            use_http_cache = False
+        elif arg == "incremental" and arg_val:
+            incremental = True
+        elif arg == "delete_removed" and arg_val:
+            delete_removed = True
+        elif arg == "offline" and arg_val:
+            offline = True
+        elif arg in ("language", "filename", "updated_since") and arg_val:
+            list_filters[arg] = arg_val
+        elif arg == "visibility" and arg_val:
+            list_filters["public"] = arg_val == "public"
+        elif arg == "archive" and arg_val:
+            archive_format = arg_val
+        elif arg == "output" and arg_val:
+            output_format = arg_val
+        elif arg == "snapshot" and arg_val:
+            snapshot = True
+        elif arg == "keep_last" and arg_val is not None:
+            keep_last = arg_val
+        elif arg == "keep_daily" and arg_val is not None:
+            keep_daily = arg_val
+        elif arg == "backup_dir" and arg_val:
+            backup_dir = arg_val
+        elif arg == "account_jobs" and arg_val:
+            max_accounts = arg_val
+        elif (
+            arg
+            in ("post_bulk", "search", "prune_snapshots", "backup_accounts", "sync")
+            and arg_val
+        ):
+            http_operation = arg
+            argument_value = arg_val
         elif arg in Misc.http_intrinsics and arg_val:
             http_operation = arg
             argument_value = arg_val
@@ -67,7 +126,20 @@ def ceg_cli() -> None:
             argument_value = (
                 None if (arg in ("list", "backup") and arg_val is None) else arg_val
             )
+            if arg == "list":
+                try:
+                    metadata_store = MetadataStore()
+                except (OSError, sqlite3.Error):
+                    # listing still works without the store,just not offline
+                    metadata_store = None
 
+    http_cache: Optional["HttpCache"] = None
+    if use_http_cache:
+        try:
+            http_cache = HttpCache()
+        except OSError:
+            # an unwritable cache directory shouldn't prevent the operation
+            http_cache = None
     ceg_obj = Ceg(
         operation=http_operation,
         arg_value=argument_value,
@@ -78,6 +150,29 @@ def ceg_cli() -> None:
         gist_no_public=gist_no_public,
         gist_desc=gist_description,
         gist_id=gist_id,
+        http_cache=http_cache,
+        metadata_store=metadata_store,
     )
+    if max_workers is not None:
+        ceg_obj.max_workers = max_workers
+    if retries is not None:
+        ceg_obj.session.retry_policy.retries = retries
+    ceg_obj.incremental = incremental
+    ceg_obj.delete_removed = delete_removed
+    ceg_obj.offline = offline
+    ceg_obj.list_filters = list_filters
+    ceg_obj.archive_format = archive_format
+    if output_format is not None:
+        # stdout is reserved for the records
+        ceg_obj.output_format = output_format
+        ceg_obj.logger = Logger(send_log=logging_status, to_stderr=True)
+    if snapshot:
+        ceg_obj.snapshot_dir = backup_dir or "GIST-SNAPSHOTS"
+    ceg_obj.keep_last = keep_last
+    ceg_obj.keep_daily = keep_daily
+    if backup_dir is not None:
+        ceg_obj.backup_dir = backup_dir
+    if max_accounts is not None:
+        ceg_obj.max_accounts = max_accounts
     return_code: int = ceg_obj.perform_operation()
     sys.exit(return_code)
@@ -0,0 +1,105 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Differences between local files and a remote gist """
+
+import hashlib
+from typing import List, Dict, Tuple, Iterable, Callable, Optional, Any
+
+__all__ = ("diff_gist_files",)
+
+
+def diff_gist_files(
+    remote_files: Dict[str, Dict[str, Any]],
+    local_files: Dict[str, str],
+    renames: Optional[Dict[str, str]] = None,
+    deletions: Iterable[str] = (),
+    remote_hash: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None,
+) -> Tuple[Dict[str, Optional[Dict[str, str]]], List[str]]:
+    """Compute the `files` of a PATCH payload,containing only what actually changed.
+
+    A local file is left out if it matches its remote copy.sizes are compared first,then the
+    content is compared against the one inlined in the remote gist or,for files the api truncates,
+    its hash against the one of the remote copy(if remote_hash is given).a remote copy which
+    can't be compared is assumed to differ.
+
+    Args:
+        remote_files: `files` of the json-decoded remote gist.
+        local_files: mapping of gist file name to the path of its local copy.
+        renames: (Optional) mapping of gist file name to its new name.
+        deletions: names of the gist files to delete.
+        remote_hash: (Optional) callable returning the sha256 hash of a remote file(given its
+                     json-decoded entry),or None if it can't be determined.
+
+    Returns:
+        A tuple containing the `files` of the payload(added/changed files with their content,
+        renamed ones with their new `filename` and deleted ones as None) and the names of the
+        unchanged files.
+    """
+    renames = renames or {}
+    changes: Dict[str, Optional[Dict[str, str]]] = {}
+    unchanged: List[str] = []
+    for file_name, file_path in local_files.items():
+        new_name: Optional[str] = renames.get(file_name)
+        remote_file: Optional[Dict[str, Any]] = remote_files.get(file_name)
+        if remote_file is None:
+            # not in the gist yet,so its added under its final name
+            changes[new_name or file_name] = {"content": _read(file_path)}
+            continue
+        change: Dict[str, str] = {}
+        if new_name and new_name != file_name:
+            change["filename"] = new_name
+        content: str = _read(file_path)
+        if not _matches(remote_file, content, remote_hash):
+            change["content"] = content
+        if change:
+            changes[file_name] = change
+        else:
+            unchanged.append(file_name)
+    for file_name, new_name in renames.items():
+        if file_name not in local_files and file_name in remote_files and new_name != file_name:
+            changes[file_name] = {"filename": new_name}
+    for file_name in deletions:
+        if file_name in remote_files:
+            changes[file_name] = None
+    return changes, unchanged
+
+
+def _matches(
+    remote_file: Dict[str, Any],
+    content: str,
+    remote_hash: Optional[Callable[[Dict[str, Any]], Optional[str]]],
+) -> bool:
+    """Return whether the content of a local file is identical to its remote copy."""
+    encoded_content: bytes = content.encode("utf-8")
+    if remote_file.get("size") is not None and len(encoded_content) != remote_file["size"]:
+        return False
+    if remote_file.get("content") is not None and not remote_file.get("truncated"):
+        return remote_file["content"] == content
+    if remote_hash is None:
+        return False
+    return remote_hash(remote_file) == hashlib.sha256(encoded_content).hexdigest()
+
+
+def _read(file_path: str) -> str:
+    with open(file_path, "r", encoding="utf-8") as r_obj:
+        return r_obj.read()
@@ -22,6 +22,8 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """ Cegs exceptions """
 
+from typing import List, Dict
+
 
 class CegExceptions:
     """All of Cegs exceptions."""
@@ -50,6 +52,18 @@ class CegExceptions:
         def __init__(self, msg: str = "Unprocessable Request!") -> None:
             super().__init__(msg)
 
+    class ServerError(Exception):
+        """raised when the server keeps failing(5xx) even after retrying."""
+
+        def __init__(self, msg: str = "Server Error!") -> None:
+            super().__init__(msg)
+
+    class BadManifest(Exception):
+        """raised when a manifest given for a bulk operation is malformed."""
+
+        def __init__(self, msg: str = "Bad Manifest!") -> None:
+            super().__init__(msg)
+
     class InsufficientSubArguments(Exception):
         """raised when sub-arguments are missing from argument list.
 
@@ -60,6 +74,34 @@ class CegExceptions:
         def __init__(self, msg: str) -> None:
             super().__init__(msg)
 
+    class IncompleteOperation(Exception):
+        """raised when a bulk operation settles with one or more failed items.
+
+        Attributes:
+            failures: mapping of each failed item(i.e gist-id) to the exception it failed with.
+        """
+
+        def __init__(self, failures: Dict[str, BaseException]) -> None:
+            self.failures: Dict[str, BaseException] = failures
+            failure_str: str = "; ".join(
+                f"'{item}': {exception}" for item, exception in failures.items()
+            )
+            super().__init__(f"{len(failures)} item(s) failed! {failure_str}")
+
+    class SyncConflict(Exception):
+        """raised when files were changed differently on both sides of a sync.
+
+        Attributes:
+            conflicts: names of the conflicting files.
+        """
+
+        def __init__(self, conflicts: List[str]) -> None:
+            self.conflicts: List[str] = conflicts
+            super().__init__(
+                f"{len(conflicts)} file(s) changed both locally and remotely,left untouched: "
+                + ", ".join(conflicts)
+            )
+
     class InternalException(Exception):
         """raised due to internal errors."""
 
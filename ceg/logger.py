@@ -23,8 +23,10 @@
 """ Enhanced Logger for Ceg """
 
 import logging
-from rich.logging import RichHandler
-from typing import Union, Any, no_type_check
+from typing import Union, Any, no_type_check, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.logging import RichHandler
 
 
 class Logger(logging.getLoggerClass()):  # type: ignore
@@ -39,6 +41,7 @@ class Logger(logging.getLoggerClass()):  # type: ignore
     loglevel = indicates the effective log level.
     dateformat = string represrnting datetime format.
     handler = Handler used by the logger.
+    to_stderr = boolean indicating whether to log to stderr(instead of stdout).
     """
 
     def __init__(
@@ -46,10 +49,22 @@ class Logger(logging.getLoggerClass()):  # type: ignore
         send_log: bool = True,
         loglevel: Union[int, str] = logging.INFO,
         dateformat: str = "[%X]",
+        to_stderr: bool = False,
     ) -> None:
         """Inits the Logger"""
         self.formatter: logging.Formatter = logging.Formatter(datefmt=dateformat)
-        self.handler: RichHandler = RichHandler()
+        self.handler: Union["RichHandler", logging.NullHandler]
+        if send_log:
+            # imported lazily as rich is quite heavy to import
+            from rich.console import Console
+            from rich.logging import RichHandler
+
+            self.handler = (
+                RichHandler(console=Console(stderr=True)) if to_stderr else RichHandler()
+            )
+        else:
+            # nothing is logged,so rich isn't needed
+            self.handler = logging.NullHandler()
 
         self.handler.setFormatter(self.formatter)
         super().__init__(name=__name__, level=logging.INFO)
@@ -0,0 +1,104 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Local manifest of backed up gists """
+
+import os
+import json
+from typing import Dict, List, Tuple, Optional, Any
+
+__all__ = ("BackupManifest",)
+
+
+class BackupManifest:
+    """Manifest of a local gist backup.
+
+    Keeps track of every backed up gist's id,`updated_at` timestamp
+    and per-file size and sha256 hash,which is used for figuring out
+    the gists that were added,changed or removed since the last backup.
+
+    Attributes:
+        FILE_NAME: name of the manifest file inside the backup directory.
+        path: path to the manifest file.
+        gists: mapping of gist-id to its manifest entry.
+    """
+
+    FILE_NAME: str = ".ceg-manifest.json"
+    VERSION: int = 1
+
+    def __init__(self, backup_dir: str) -> None:
+        """Inits BackupManifest and loads the manifest of backup_dir,if any"""
+        self.path: str = os.path.join(backup_dir, self.FILE_NAME)
+        self.gists: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as r_obj:
+                self.gists = json.load(r_obj).get("gists", {})
+
+    def diff(
+        self, listing: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Compare a remote gist listing against the manifest.
+
+        Args:
+            listing: json-decoded gist listing.
+
+        Returns:
+            A tuple containing the added/changed gists and ids of the removed gists.
+        """
+        changed: List[Dict[str, Any]] = [
+            gist
+            for gist in listing
+            if self.gists.get(gist["id"], {}).get("updated_at") != gist.get("updated_at")
+        ]
+        listed_ids = {gist["id"] for gist in listing}
+        removed: List[str] = [
+            gist_id for gist_id in self.gists if gist_id not in listed_ids
+        ]
+        return changed, removed
+
+    def file_hash(self, gist_id: str, file_name: str) -> Optional[str]:
+        """Return the recorded sha256 hash of a backed up file,if any."""
+        return (
+            self.gists.get(gist_id, {}).get("files", {}).get(file_name, {}).get("sha256")
+        )
+
+    def record(
+        self, gist: Dict[str, Any], files: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Record a (successfully) backed up gist.
+
+        Args:
+            gist: json-decoded gist.
+            files: mapping of file name to its size and sha256 hash.
+        """
+        self.gists[gist["id"]] = {"updated_at": gist.get("updated_at"), "files": files}
+
+    def forget(self, gist_id: str) -> None:
+        """Drop a gist from the manifest."""
+        self.gists.pop(gist_id, None)
+
+    def save(self) -> None:
+        """Atomically write the manifest to disk."""
+        tmp_path: str = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as w_obj:
+            json.dump({"version": self.VERSION, "gists": self.gists}, w_obj, indent=1)
+        os.replace(tmp_path, self.path)
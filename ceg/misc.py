@@ -23,10 +23,12 @@
 """ Misc stuff dat i couldn't figure out where to put """
 
 import os
+import hashlib
+import uuid
 import platform
 import subprocess
 from .exceptions import CegExceptions
-from typing import List, Dict, Callable, Union, Optional, Type, TypeAlias
+from typing import List, Dict, Tuple, Iterable, Callable, Union, Optional, Type, TypeAlias
 
 __all__ = ("UtilInfo", "Misc")
 
@@ -51,10 +53,52 @@ sub-arguments:
       --no-public/-np        switch gist visibility to private
 
       --description/-desc    description for the gist
-    
+
+  --post-bulk/-pb
+      --no-public/-np        switch default visibility of the gists to private
+
   --patch/-pa
       --gist-id/-gi          gist-id for the gist
 
+  --list/-l
+      --offline/-off         list from the local metadata store,without fetching the listing
+
+      --language/-lang       only list gists having a file of given language
+
+      --filename/-fn         only list gists having a file matching given glob pattern
+
+      --updated-since/-us    only list gists updated since given ISO 8601 date(i.e 2022-08-01)
+
+      --visibility/-vis      only list public/private gists
+
+      --output/-o            stream gists as ndjson/json/tsv records(logs go to stderr)
+
+  --backup/-bk
+      --backup-dir/-bd       directory to back up to(defaults to GIST-BACKUP)
+
+      --incremental/-inc     only download gists added/changed since the last backup
+
+      --delete-removed/-dr   delete(instead of archiving) gists removed since the last backup
+
+      --archive/-ar          stream all gists into a single gz/xz compressed tar archive
+
+      --snapshot/-snap       record a deduplicated snapshot(in --backup-dir,defaults to GIST-SNAPSHOTS)
+
+  --backup-accounts/-bka
+      --account-jobs/-ja     number of accounts backed up concurrently(defaults to 4)
+
+      --backup-dir/-bd       directory containing a backup per account(defaults to GIST-BACKUP)
+
+      (sub-arguments of --backup apply to every account)
+
+  --prune-snapshots/-ps
+      --keep-last/-kl        keep given number of most recent snapshots
+
+      --keep-daily/-kd       keep the latest snapshot of given number of most recent days
+
+  --search/-s
+      --backup-dir/-bd       backup directory to search(defaults to GIST-BACKUP)
+
 For more usage help, check out https://www.github.com/justaus3r/ceg/#examples"""
     DESCRIPTION: str = "An all in one github's gist manager."
     # Caution(message to myself): Be careful when updating the version because
@@ -73,6 +117,42 @@ def exception_executioner(exception_obj) -> None:
         raise exception_obj
 
 
+def validate_status_code(status_code: int) -> str:
+    """Validates http response status code.
+
+    Looks up the status code in Misc.http_response_codes and raises the
+    respective exception if the status code indicates a failure.
+
+    Args:
+        status_code: http response status code.
+
+    Returns:
+        Response status string.
+    """
+    http_response_codes: Misc.HttpResponseCodes = Misc.http_response_codes
+    response_str: str
+    exception_obj_dict: Dict[str, Misc.OptionalException]
+    try:
+        response_str, exception_obj_dict = tuple(
+            http_response_codes[status_code].items()  # type: ignore
+        )[0]
+    except KeyError:
+        if status_code >= 500:
+            raise CegExceptions.ServerError(
+                f"Server Error({status_code})!.please try again later."
+            )
+        raise CegExceptions.InternalException(
+            "Undefined Response!.please open an issue on github."
+        )
+    response_action: Callable[
+        [Misc.OptionalException], None
+    ] = http_response_codes.get(  # type: ignore
+        "exception_action"
+    )
+    response_action(exception_obj_dict.get("exception_obj"))
+    return response_str
+
+
 class Misc:
     """Misc stuff.
 
@@ -81,6 +161,8 @@ class Misc:
     Attributes:
     http_intrinsics: List containing names of all http methods.
     secret_key: Gitub Secret key extracted from env variable.
+    gists_per_page: page size used while paginating gist listings(maximum allowed by github).
+    download_chunk_size: size of the buffer used while streaming downloads to disk.
     """
 
     http_intrinsics: List[str] = ["get", "post", "patch", "delete"]
@@ -112,9 +194,12 @@ class Misc:
                 "exception_obj": CegExceptions.UnprocessableRequest
             }
         },
+        429: {"Too Many Requests!": {"exception_obj": CegExceptions.ForbiddenResource}},
         "exception_action": exception_executioner,
     }
     secret_key: Optional[str] = os.getenv("GITHUB_SECRET_KEY")
+    gists_per_page: int = 100
+    download_chunk_size: int = 64 * 1024
 
 
 class FileHandler:
@@ -129,11 +214,12 @@ class FileHandler:
         return_code: return code which determines whether to keep a directory or not.
     """
 
-    def __init__(self, dir_name: str) -> None:
+    def __init__(self, dir_name: str, exist_ok: bool = False) -> None:
         "Inits FileHandler with some directory name"
         self.__dir_name: str = dir_name
         self.__return_code: int = 0
-        os.mkdir(self.__dir_name)
+        if not (exist_ok and os.path.isdir(self.__dir_name)):
+            os.mkdir(self.__dir_name)
 
     @property
     def return_code(self) -> int:
@@ -150,6 +236,54 @@ class FileHandler:
         with open(os.path.join(self.__dir_name, file_name), "w", encoding="utf-8") as wr:
             wr.write(content)
 
+    def write_stream(
+        self,
+        file_name: str,
+        chunks: Iterable[bytes],
+        known_hash: Optional[str] = None,
+    ) -> Tuple[int, str]:
+        """Stream binary chunks into a file.
+
+        Chunks are written to a temporary file in the gist directory which then
+        atomically replaces the target file,unless the content hashes to known_hash
+        and the target file exists,in which case the target is left untouched.
+
+        Args:
+            file_name: name of the file.
+            chunks: iterable of binary chunks.
+            known_hash: (Optional) sha256 hash of the existing copy of the file.
+
+        Returns:
+            A tuple containing size and sha256 hash of the content.
+        """
+        file_size: int = 0
+        hash_obj = hashlib.sha256()
+        part_path: str = os.path.join(
+            self.__dir_name, f".{file_name}.{uuid.uuid4().hex}.part"
+        )
+        try:
+            with open(part_path, "wb") as wr:
+                for chunk in chunks:
+                    wr.write(chunk)
+                    hash_obj.update(chunk)
+                    file_size += len(chunk)
+        except BaseException:
+            os.remove(part_path)
+            raise
+        file_hash: str = hash_obj.hexdigest()
+        if file_hash == known_hash and self.exists(file_name):
+            os.remove(part_path)
+        else:
+            os.replace(part_path, os.path.join(self.__dir_name, file_name))
+        return file_size, file_hash
+
+    def exists(self, file_name: str) -> bool:
+        return os.path.isfile(os.path.join(self.__dir_name, file_name))
+
+    def remove(self, file_name: str) -> None:
+        if self.exists(file_name):
+            os.remove(os.path.join(self.__dir_name, file_name))
+
 
 def open_file(file_name: str) -> int:
     """Opens an already existing or
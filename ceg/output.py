@@ -0,0 +1,106 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Machine readable output of listings """
+
+import json
+from .records import GistRecord
+from typing import List, TextIO, Tuple
+
+__all__ = ("RecordWriter",)
+
+
+class RecordWriter:
+    """Streaming writer of gist records in a machine readable format.
+
+    Every record is written(and flushed) as soon as its given,so that consumers
+    can start processing before the listing is complete.supported formats are
+    `ndjson`(a json object per line),`json`(a single array) and `tsv`(a header
+    row and a row per gist,with file names separated by commas).
+
+    Attributes:
+        FORMATS: supported output formats.
+        TSV_COLUMNS: columns of the tsv format.
+        stream: text stream written to.
+        output_format: output format.
+    """
+
+    FORMATS: Tuple[str, ...] = ("ndjson", "json", "tsv")
+    TSV_COLUMNS: Tuple[str, ...] = (
+        "id",
+        "public",
+        "description",
+        "created_at",
+        "updated_at",
+        "html_url",
+        "files",
+    )
+
+    def __init__(self, stream: TextIO, output_format: str) -> None:
+        """Inits RecordWriter with the stream and output format"""
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Unsupported output format '{output_format}'!")
+        self.stream: TextIO = stream
+        self.output_format: str = output_format
+        self.__records_written: int = 0
+        if output_format == "tsv":
+            self.__emit("\t".join(self.TSV_COLUMNS) + "\n")
+
+    def __emit(self, text: str) -> None:
+        self.stream.write(text)
+        self.stream.flush()
+
+    @staticmethod
+    def __tsv_field(value: object) -> str:
+        if value is None:
+            return ""
+        return (
+            str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+        )
+
+    def write(self, record: GistRecord) -> None:
+        """Write a single record."""
+        if self.output_format == "ndjson":
+            self.__emit(json.dumps(record.to_dict()) + "\n")
+        elif self.output_format == "json":
+            separator: str = "[\n" if self.__records_written == 0 else ",\n"
+            self.__emit(separator + json.dumps(record.to_dict()))
+        else:
+            row: List[str] = [
+                self.__tsv_field(value)
+                for value in (
+                    record.id,
+                    str(record.public).lower(),
+                    record.description,
+                    record.created_at,
+                    record.updated_at,
+                    record.html_url,
+                    ",".join(record.file_names),
+                )
+            ]
+            self.__emit("\t".join(row) + "\n")
+        self.__records_written += 1
+
+    def close(self) -> None:
+        """Terminate the output,i.e close the json array."""
+        if self.output_format == "json":
+            self.__emit("[]\n" if self.__records_written == 0 else "\n]\n")
@@ -0,0 +1,159 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Rate limit governor for ceg """
+
+import time
+import threading
+from typing import Dict, Optional, Mapping, Callable, Any
+
+__all__ = ("RateLimitGovernor",)
+
+
+class RateLimitGovernor:
+    """Rate-limit-aware request governor.
+
+    Tracks github's rate limit budget from the `X-RateLimit-*` headers of every
+    api response and governs the requests of all the threads(or coroutines)
+    sharing it: once the remaining budget runs low,requests are spaced out so
+    that it lasts until the reset,and when the budget is exhausted or a
+    secondary rate limit is hit,requests are paused until they can be resumed
+    instead of failing.
+
+    Attributes:
+        limit: maximum number of requests per window,as reported by github.
+        remaining: remaining number of requests in the current window.
+        reset: epoch time at which the current window resets.
+        used: number of requests used in the current window.
+        paused_until: epoch time until which all requests are paused.
+        pace_below: fraction of the limit,below which the remaining budget is spaced out(i.e
+                    0.1 paces the last 500 of 5000 authenticated and the last 6 of 60
+                    unauthenticated requests).
+        max_pause: longest pause(in seconds) the governor waits out,longer ones
+                   are given up so that the request fails instead.
+        max_pauses: maximum number of consecutive pauses for a single request.
+    """
+
+    SECONDARY_LIMIT_PAUSE: float = 60.0
+
+    def __init__(
+        self,
+        pace_below: float = 0.1,
+        max_pause: float = 3600.0,
+        max_pauses: int = 5,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Inits RateLimitGovernor with pacing configuration"""
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset: Optional[float] = None
+        self.used: Optional[int] = None
+        self.paused_until: float = 0.0
+        self.pace_below: float = pace_below
+        self.max_pause: float = max_pause
+        self.max_pauses: int = max_pauses
+        self.__clock: Callable[[], float] = clock
+        self.__next_slot: float = 0.0
+        self.__lock: threading.Lock = threading.Lock()
+
+    def state(self) -> Dict[str, Any]:
+        """Return a snapshot of the governor's state,for planning batch jobs around it."""
+        with self.__lock:
+            return {
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "reset": self.reset,
+                "used": self.used,
+                "paused_until": self.paused_until,
+            }
+
+    def reserve(self) -> float:
+        """Reserve a slot for the next request.
+
+        Returns:
+            number of seconds the caller must wait before sending the request.
+        """
+        with self.__lock:
+            now: float = self.__clock()
+            slot: float = max(now, self.paused_until)
+            if self.remaining is not None and self.reset is not None and self.reset > slot:
+                if self.remaining <= 0:
+                    slot = self.reset
+                elif self.limit is not None and self.remaining < self.limit * self.pace_below:
+                    # spread the remaining budget evenly over the rest of the window
+                    slot = max(slot, self.__next_slot)
+                    self.__next_slot = slot + (self.reset - slot) / self.remaining
+                    self.remaining -= 1
+            return max(0.0, slot - now)
+
+    def wait(self) -> None:
+        """Reserve a slot for the next request and sleep until it's due."""
+        delay: float = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Update the budget from the `X-RateLimit-*` headers of a response."""
+        if "X-RateLimit-Remaining" not in headers:
+            return None
+        with self.__lock:
+            self.remaining = int(headers["X-RateLimit-Remaining"])
+            if "X-RateLimit-Limit" in headers:
+                self.limit = int(headers["X-RateLimit-Limit"])
+            if "X-RateLimit-Reset" in headers:
+                self.reset = float(headers["X-RateLimit-Reset"])
+            if "X-RateLimit-Used" in headers:
+                self.used = int(headers["X-RateLimit-Used"])
+
+    def pause_for(
+        self, status_code: int, headers: Mapping[str, str], message: str = ""
+    ) -> Optional[float]:
+        """Figure out whether a response was rate limited and pause accordingly.
+
+        Args:
+            status_code: http response status code.
+            headers: http response headers.
+            message: (Optional) response body,used for recognizing secondary rate limits.
+
+        Returns:
+            number of seconds all requests are paused for,None if the response wasn't
+            rate limited or the pause would exceed max_pause.
+        """
+        if status_code not in (403, 429):
+            return None
+        now: float = self.__clock()
+        delay: float
+        if "Retry-After" in headers:
+            delay = float(headers["Retry-After"])
+        elif headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+            delay = float(headers["X-RateLimit-Reset"]) - now + 1
+        elif status_code == 429 or "rate limit" in message.lower():
+            delay = self.SECONDARY_LIMIT_PAUSE
+        else:
+            # a plain 403 is an actually forbidden resource
+            return None
+        delay = max(delay, 0.0)
+        if delay > self.max_pause:
+            return None
+        with self.__lock:
+            self.paused_until = max(self.paused_until, now + delay)
+        return delay
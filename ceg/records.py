@@ -0,0 +1,114 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Typed records of gists """
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Any
+
+__all__ = ("GistRecord", "GistFileRecord")
+
+
+@dataclass(frozen=True, slots=True)
+class GistFileRecord:
+    """A file of a gist.
+
+    Attributes:
+        name: name of the file.
+        size: size of the file in bytes.
+        language: language of the file,as detected by github.
+        raw_url: url of the raw content of the file.
+    """
+
+    name: str
+    size: Optional[int] = None
+    language: Optional[str] = None
+    raw_url: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class GistRecord:
+    """A gist,as listed.
+
+    Attributes:
+        id: gist-id of the gist.
+        public: boolean indicating whether the gist is public.
+        description: description of the gist.
+        files: files of the gist.
+        created_at: ISO 8601 creation time.
+        updated_at: ISO 8601 time of the last update.
+        html_url: url of the gist.
+    """
+
+    id: str
+    public: bool
+    description: Optional[str]
+    files: Tuple[GistFileRecord, ...]
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    html_url: Optional[str] = None
+
+    @classmethod
+    def from_json(cls, gist: Dict[str, Any]) -> "GistRecord":
+        """Build a record from a json-decoded gist of github's api."""
+        return cls(
+            id=gist["id"],
+            public=bool(gist.get("public")),
+            description=gist.get("description"),
+            files=tuple(
+                GistFileRecord(
+                    name=file_name,
+                    size=file_hashtable.get("size"),
+                    language=file_hashtable.get("language"),
+                    raw_url=file_hashtable.get("raw_url"),
+                )
+                for file_name, file_hashtable in (gist.get("files") or {}).items()
+            ),
+            created_at=gist.get("created_at"),
+            updated_at=gist.get("updated_at"),
+            html_url=gist.get("html_url"),
+        )
+
+    @property
+    def file_names(self) -> List[str]:
+        """Names of all the files of the gist."""
+        return [gist_file.name for gist_file in self.files]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a json-serializable mapping."""
+        return {
+            "id": self.id,
+            "public": self.public,
+            "description": self.description,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "html_url": self.html_url,
+            "files": [
+                {
+                    "name": gist_file.name,
+                    "size": gist_file.size,
+                    "language": gist_file.language,
+                    "raw_url": gist_file.raw_url,
+                }
+                for gist_file in self.files
+            ],
+        }
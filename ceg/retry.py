@@ -0,0 +1,103 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Retry policy for ceg """
+
+import time
+import random
+from typing import Tuple, Optional
+
+__all__ = ("RetryPolicy",)
+
+
+class RetryPolicy:
+    """Retry policy for transient failures.
+
+    Decides whether a request which failed due to a dropped connection,
+    a timeout or a 5xx response is worth retrying and how long to back
+    off before doing so(exponential backoff with full jitter).idempotent
+    requests are retried freely while POST/PATCH requests are only retried
+    if they never reached the server,or if explicitly allowed.
+
+    Attributes:
+        retries: maximum number of retries after the first attempt.
+        backoff: base backoff(in seconds),doubled on every retry.
+        max_backoff: upper bound on a single backoff.
+        jitter: boolean indicating whether to randomize backoffs(full jitter).
+        retry_unsafe: boolean indicating whether POST/PATCH requests are retried even if
+                      they might have reached the server(which may duplicate a created gist).
+        retry_statuses: http status codes considered transient.
+    """
+
+    IDEMPOTENT_METHODS: Tuple[str, ...] = ("get", "head", "options", "delete")
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_unsafe: bool = False,
+        retry_statuses: Tuple[int, ...] = (500, 502, 503, 504),
+    ) -> None:
+        """Inits RetryPolicy"""
+        self.retries: int = retries
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.jitter: bool = jitter
+        self.retry_unsafe: bool = retry_unsafe
+        self.retry_statuses: Tuple[int, ...] = retry_statuses
+
+    def should_retry(self, method: str, attempt: int, reached_server: bool = True) -> bool:
+        """Decide whether a failed attempt is retried.
+
+        Args:
+            method: http verb of the request.
+            attempt: number of the failed attempt,starting at 0.
+            reached_server: boolean indicating whether the request(possibly) reached the server.
+
+        Returns:
+            boolean indicating whether to retry.
+        """
+        if attempt >= self.retries:
+            return False
+        return (
+            method.lower() in self.IDEMPOTENT_METHODS
+            or self.retry_unsafe
+            or not reached_server
+        )
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Return the backoff(in seconds) before retrying a failed attempt.
+
+        Args:
+            attempt: number of the failed attempt,starting at 0.
+            retry_after: (Optional) value of the Retry-After header of the failed response.
+        """
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff)
+        delay: float = min(self.backoff * 2**attempt, self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def sleep(self, attempt: int, retry_after: Optional[str] = None) -> None:
+        """Back off before retrying a failed attempt."""
+        time.sleep(self.delay(attempt, retry_after))
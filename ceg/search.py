@@ -0,0 +1,216 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Full-text search index over backed up gists """
+
+import os
+import re
+import math
+import sqlite3
+from .manifest import BackupManifest
+from typing import List, Dict, Tuple, Iterator, Any
+
+__all__ = ("SearchIndex",)
+
+
+class SearchIndex:
+    """Inverted index over the files of a local gist backup.
+
+    Maps every word(case-insensitively) to the files and lines it occurs on.the
+    index lives in the backup directory and is updated incrementally using the
+    backup manifest: only files whose hash changed are re-read and files that are
+    no longer backed up are dropped,so neither updates nor lookups rescan the backup.
+    binary(non utf-8) files aren't indexed.
+
+    Attributes:
+        FILE_NAME: name of the index database inside the backup directory.
+        backup_dir: the backup directory.
+    """
+
+    FILE_NAME: str = ".ceg-index.sqlite3"
+    SCHEMA: str = """
+    CREATE TABLE IF NOT EXISTS files (
+        id INTEGER PRIMARY KEY,
+        gist_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        sha256 TEXT,
+        UNIQUE (gist_id, name)
+    );
+    CREATE TABLE IF NOT EXISTS postings (
+        token TEXT NOT NULL,
+        file_id INTEGER NOT NULL,
+        line INTEGER NOT NULL,
+        PRIMARY KEY (token, file_id, line)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS postings_file_id ON postings (file_id);
+    """
+    TOKEN_PATTERN: "re.Pattern[str]" = re.compile(r"\w+")
+
+    def __init__(self, backup_dir: str) -> None:
+        """Inits SearchIndex and opens(or creates) the index of backup_dir"""
+        self.backup_dir: str = backup_dir
+        self.__connection: sqlite3.Connection = sqlite3.connect(
+            os.path.join(backup_dir, self.FILE_NAME)
+        )
+        with self.__connection:
+            self.__connection.executescript(self.SCHEMA)
+
+    def close(self) -> None:
+        """Close the index."""
+        self.__connection.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """Split text into lowercased words."""
+        return cls.TOKEN_PATTERN.findall(text.lower())
+
+    def __postings(self, file_id: int, path: str) -> Iterator[Tuple[str, int, int]]:
+        with open(path, "r", encoding="utf-8") as r_obj:
+            for line_no, line in enumerate(r_obj, start=1):
+                for token in set(self.tokenize(line)):
+                    yield token, file_id, line_no
+
+    def update(self, manifest: BackupManifest) -> Tuple[int, int]:
+        """Bring the index in line with the backup manifest.
+
+        Args:
+            manifest: manifest of the backup.
+
+        Returns:
+            A tuple containing the number of (re)indexed and dropped files.
+        """
+        indexed_files: Dict[Tuple[str, str], Tuple[int, str]] = {
+            (gist_id, name): (file_id, sha256)
+            for file_id, gist_id, name, sha256 in self.__connection.execute(
+                "SELECT id, gist_id, name, sha256 FROM files"
+            )
+        }
+        backed_up_files: Dict[Tuple[str, str], str] = {
+            (gist_id, name): file_record.get("sha256")
+            for gist_id, gist_record in manifest.gists.items()
+            for name, file_record in gist_record.get("files", {}).items()
+        }
+        reindexed: int = 0
+        dropped: int = 0
+        with self.__connection:
+            for key, (file_id, _) in indexed_files.items():
+                if key not in backed_up_files:
+                    self.__drop(file_id)
+                    dropped += 1
+            for key, sha256 in backed_up_files.items():
+                if key in indexed_files:
+                    file_id, indexed_sha256 = indexed_files[key]
+                    if indexed_sha256 == sha256:
+                        continue
+                    self.__drop(file_id)
+                self.__index(key[0], key[1], sha256)
+                reindexed += 1
+        return reindexed, dropped
+
+    def __drop(self, file_id: int) -> None:
+        self.__connection.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+        self.__connection.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def __index(self, gist_id: str, name: str, sha256: str) -> None:
+        file_id: int = self.__connection.execute(
+            "INSERT INTO files (gist_id, name, sha256) VALUES (?, ?, ?)",
+            (gist_id, name, sha256),
+        ).lastrowid  # type: ignore
+        try:
+            self.__connection.executemany(
+                "INSERT OR IGNORE INTO postings VALUES (?, ?, ?)",
+                self.__postings(file_id, os.path.join(self.backup_dir, gist_id, name)),
+            )
+        except (OSError, UnicodeDecodeError):
+            # binary or vanished file,its kept(with its hash) so that its not retried on every update
+            self.__connection.execute(
+                "DELETE FROM postings WHERE file_id = ?", (file_id,)
+            )
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Look up the lines containing the words of a query.
+
+        Lines containing more of the query's words rank higher,ties are broken by
+        the rarity(inverse document frequency) of the matched words.
+
+        Args:
+            query: words to look for.
+            limit: maximum number of results.
+
+        Returns:
+            ranked results,each containing `gist_id`,`file`,`line`,`text` and `score`.
+        """
+        tokens: List[str] = sorted(set(self.tokenize(query)))
+        if not tokens:
+            return []
+        token_placeholders: str = ", ".join("?" * len(tokens))
+        file_count: int = self.__connection.execute(
+            "SELECT COUNT(*) FROM files"
+        ).fetchone()[0]
+        weights: List[Tuple[str, float]] = [
+            (token, math.log(1 + file_count / document_frequency))
+            for token, document_frequency in self.__connection.execute(
+                "SELECT token, COUNT(DISTINCT file_id) FROM postings "
+                f"WHERE token IN ({token_placeholders}) GROUP BY token",
+                tokens,
+            )
+        ]
+        if not weights:
+            return []
+        weight_rows: str = ", ".join("(?, ?)" for _ in weights)
+        rows: List[Tuple[str, str, int, int, float]] = self.__connection.execute(
+            f"WITH weights (token, weight) AS (VALUES {weight_rows}) "
+            "SELECT f.gist_id, f.name, p.line, COUNT(*) AS matched, SUM(w.weight) AS score "
+            "FROM postings p JOIN weights w ON p.token = w.token "
+            "JOIN files f ON f.id = p.file_id "
+            "GROUP BY p.file_id, p.line "
+            "ORDER BY matched DESC, score DESC, f.gist_id, f.name, p.line LIMIT ?",
+            [value for weight in weights for value in weight] + [limit],
+        ).fetchall()
+        return [
+            {
+                "gist_id": gist_id,
+                "file": name,
+                "line": line_no,
+                "text": self.__line(gist_id, name, line_no),
+                "score": round(score, 3),
+            }
+            for gist_id, name, line_no, _, score in rows
+        ]
+
+    def __line(self, gist_id: str, name: str, line_no: int) -> str:
+        try:
+            with open(
+                os.path.join(self.backup_dir, gist_id, name), "r", encoding="utf-8"
+            ) as r_obj:
+                for current_line_no, line in enumerate(r_obj, start=1):
+                    if current_line_no == line_no:
+                        return line.strip()
+        except (OSError, UnicodeDecodeError):
+            pass
+        return ""
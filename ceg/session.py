@@ -0,0 +1,199 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Pooled http session for ceg """
+
+import copy
+import requests
+from urllib.parse import urlparse
+from .retry import RetryPolicy
+from .ratelimit import RateLimitGovernor
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from typing import Dict, Optional, Any
+
+__all__ = ("CegSession",)
+
+
+class CegSession:
+    """Pooled,persistent http session.
+
+    Wraps a requests.Session mounted with a connection pooling
+    adapter so that every api call and raw file download made
+    during the lifetime of the object reuses already established
+    TCP/TLS connections instead of doing a fresh handshake.
+
+    Attributes:
+        pool_connections: number of per-host connection pools to cache.
+        pool_maxsize: maximum number of connections kept alive per host.
+        pool_block: boolean indicating whether to block once a host's pool is exhausted,
+                    effectively turning pool_maxsize into a hard per-host limit.
+        keep_alive: boolean indicating whether connections are kept alive between requests.
+        session: the underlying requests.Session object.
+        governor: rate limit governor pacing(and pausing) all the api requests sent over the session.
+        retry_policy: retry policy for transient failures.
+    """
+
+    GOVERNED_HOSTS: tuple = ("api.github.com",)
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        governor: Optional[RateLimitGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """Inits CegSession with pool configuration"""
+        self.pool_connections: int = pool_connections
+        self.pool_maxsize: int = pool_maxsize
+        self.pool_block: bool = pool_block
+        self.keep_alive: bool = keep_alive
+        self.governor: RateLimitGovernor = (
+            governor if governor is not None else RateLimitGovernor()
+        )
+        self.retry_policy: RetryPolicy = (
+            retry_policy if retry_policy is not None else RetryPolicy()
+        )
+        self.session: requests.Session = requests.Session()
+        adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers.update({"Connection": "close"})
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> requests.models.Response:
+        """Sends a request over the pooled session.
+
+        Requests to the api are governed by the rate limit governor,a rate limited
+        response is transparently retried once the governor's pause is over.transient
+        failures(dropped connections,timeouts and 5xx responses) are retried as per
+        the retry policy.
+
+        Args:
+            method: http verb,i.e get,post,patch or delete.
+            url: url for the request.
+            headers: optional header for the request.
+            **kwargs: any other keyword argument accepted by requests.Session.request().
+
+        Returns:
+            Returns the http response.
+        """
+        attempt: int = 0
+        while True:
+            try:
+                response: requests.models.Response = self.__governed_request(
+                    method, url, headers, **kwargs
+                )
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as exception:
+                if not self.retry_policy.should_retry(
+                    method, attempt, reached_server=self.__reached_server(exception)
+                ):
+                    raise
+                self.retry_policy.sleep(attempt)
+            else:
+                if response.status_code not in self.retry_policy.retry_statuses or (
+                    not self.retry_policy.should_retry(method, attempt)
+                ):
+                    return response
+                response.close()
+                self.retry_policy.sleep(attempt, response.headers.get("Retry-After"))
+            attempt += 1
+
+    @staticmethod
+    def __reached_server(exception: Exception) -> bool:
+        """Figure out whether a failed request could have reached the server."""
+        if isinstance(exception, requests.exceptions.ConnectTimeout):
+            return False
+        reason: Any = getattr(exception.args[0], "reason", None) if exception.args else None
+        return not isinstance(reason, NewConnectionError)
+
+    def __governed_request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> requests.models.Response:
+        """Sends a single request,governed by the rate limit governor if its an api request."""
+        if urlparse(url).netloc not in self.GOVERNED_HOSTS:
+            return self.session.request(method, url, headers=headers, **kwargs)
+        pauses: int = 0
+        while True:
+            self.governor.wait()
+            response: requests.models.Response = self.session.request(
+                method, url, headers=headers, **kwargs
+            )
+            self.governor.update(response.headers)
+            if (
+                pauses >= self.governor.max_pauses
+                or self.governor.pause_for(
+                    response.status_code,
+                    response.headers,
+                    response.text if response.status_code in (403, 429) else "",
+                )
+                is None
+            ):
+                return response
+            pauses += 1
+            response.close()
+
+    def with_governor(self, governor: RateLimitGovernor) -> "CegSession":
+        """Return a session sharing the pooled connections(and retry policy) of this one,paced by another governor.
+
+        A governor tracks the budget of a single credential,so requests sent with other credentials
+        over the same pool need a governor of their own.closing either session closes the shared
+        connections.
+
+        Args:
+            governor: rate limit governor of the returned session.
+
+        Returns:
+            CegSession sharing the underlying requests.Session.
+        """
+        governed_session: CegSession = copy.copy(self)
+        governed_session.governor = governor
+        return governed_session
+
+    def close(self) -> None:
+        """Close all the pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "CegSession":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
@@ -0,0 +1,265 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Content-addressed backup snapshots """
+
+import os
+import json
+import time
+import uuid
+import shutil
+import hashlib
+import threading
+from .exceptions import CegExceptions
+from typing import Dict, List, Iterable, Optional, Set, Tuple, Any
+
+__all__ = ("SnapshotStore", "SnapshotGistHandler")
+
+
+class SnapshotStore:
+    """Deduplicated store of backup snapshots.
+
+    Every file content is stored once under `objects/`,keyed by its sha256 hash,
+    and every snapshot is a manifest under `snapshots/` referencing the contents
+    of all the files of all the gists at the time of the snapshot.a new snapshot
+    reuses the entries of the previous one for the gists that didn't change since,
+    so storage and writes only grow with changed content.snapshots are restored
+    as a tree of hardlinks to the objects and pruned according to a retention
+    policy,dropping the objects no longer referenced.
+
+    Attributes:
+        root: root directory of the store.
+        objects_dir: directory containing the file contents.
+        snapshots_dir: directory containing the snapshot manifests.
+    """
+
+    VERSION: int = 1
+
+    def __init__(self, root: str) -> None:
+        """Inits SnapshotStore and creates its directories,if missing"""
+        self.root: str = root
+        self.objects_dir: str = os.path.join(root, "objects")
+        self.snapshots_dir: str = os.path.join(root, "snapshots")
+        self.__tmp_dir: str = os.path.join(self.objects_dir, "tmp")
+        os.makedirs(self.__tmp_dir, exist_ok=True)
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+
+    def object_path(self, file_hash: str) -> str:
+        """Return path of the object holding a content."""
+        return os.path.join(self.objects_dir, file_hash[:2], file_hash)
+
+    def store(self, chunks: Iterable[bytes]) -> Tuple[int, str]:
+        """Store a content,unless its already stored.
+
+        Args:
+            chunks: iterable of binary chunks.
+
+        Returns:
+            A tuple containing size and sha256 hash of the content.
+        """
+        file_size: int = 0
+        hash_obj = hashlib.sha256()
+        part_path: str = os.path.join(self.__tmp_dir, f"{uuid.uuid4().hex}.part")
+        try:
+            with open(part_path, "wb") as wr:
+                for chunk in chunks:
+                    wr.write(chunk)
+                    hash_obj.update(chunk)
+                    file_size += len(chunk)
+        except BaseException:
+            os.remove(part_path)
+            raise
+        file_hash: str = hash_obj.hexdigest()
+        object_path: str = self.object_path(file_hash)
+        if os.path.exists(object_path):
+            os.remove(part_path)
+        else:
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            os.chmod(part_path, 0o444)
+            os.replace(part_path, object_path)
+        return file_size, file_hash
+
+    def snapshots(self) -> List[str]:
+        """Return ids of all the snapshots,oldest first."""
+        return sorted(
+            file_name[: -len(".json")]
+            for file_name in os.listdir(self.snapshots_dir)
+            if file_name.endswith(".json")
+        )
+
+    def load(self, snapshot_id: str) -> Dict[str, Dict[str, Any]]:
+        """Return the gists of a snapshot.
+
+        Raises:
+            ResourceNotFound: raised if there's no such snapshot.
+        """
+        try:
+            with open(
+                os.path.join(self.snapshots_dir, snapshot_id + ".json"),
+                "r",
+                encoding="utf-8",
+            ) as r_obj:
+                return json.load(r_obj)["gists"]
+        except FileNotFoundError:
+            raise CegExceptions.ResourceNotFound(
+                f"Snapshot '{snapshot_id}' not found!"
+            )
+
+    def latest(self) -> Dict[str, Dict[str, Any]]:
+        """Return the gists of the latest snapshot,empty if there's none."""
+        snapshots: List[str] = self.snapshots()
+        return self.load(snapshots[-1]) if snapshots else {}
+
+    def commit(self, gists: Dict[str, Dict[str, Any]]) -> str:
+        """Record a new snapshot.
+
+        Args:
+            gists: mapping of gist-id to its `updated_at` timestamp and files(name to size and sha256 hash).
+
+        Returns:
+            id of the snapshot.
+        """
+        timestamp: str = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        snapshot_id: str = timestamp
+        suffix: int = 1
+        while os.path.exists(os.path.join(self.snapshots_dir, snapshot_id + ".json")):
+            snapshot_id = f"{timestamp}-{suffix}"
+            suffix += 1
+        snapshot_path: str = os.path.join(self.snapshots_dir, snapshot_id + ".json")
+        with open(snapshot_path + ".tmp", "w", encoding="utf-8") as w_obj:
+            json.dump({"version": self.VERSION, "gists": gists}, w_obj, indent=1)
+        os.replace(snapshot_path + ".tmp", snapshot_path)
+        return snapshot_id
+
+    def restore(self, snapshot_id: str, target_dir: str) -> None:
+        """Materialize a snapshot as a directory per gist.
+
+        Files are hardlinked to their objects(or copied,where hardlinks aren't supported),
+        so restoring costs no additional storage.
+
+        Args:
+            snapshot_id: id of the snapshot.
+            target_dir: directory to restore to,which must not exist.
+        """
+        gists: Dict[str, Dict[str, Any]] = self.load(snapshot_id)
+        os.makedirs(target_dir)
+        for gist_id, gist in gists.items():
+            os.makedirs(os.path.join(target_dir, gist_id))
+            for file_name, file_record in gist["files"].items():
+                object_path: str = self.object_path(file_record["sha256"])
+                file_path: str = os.path.join(target_dir, gist_id, file_name)
+                try:
+                    os.link(object_path, file_path)
+                except OSError:
+                    shutil.copyfile(object_path, file_path)
+
+    def prune(
+        self, keep_last: Optional[int] = None, keep_daily: Optional[int] = None
+    ) -> List[str]:
+        """Drop the snapshots outside a retention policy and the objects no longer referenced.
+
+        Args:
+            keep_last: (Optional) keep the given number of most recent snapshots.
+            keep_daily: (Optional) keep the most recent snapshot of each of the given number of most recent days.
+
+        Returns:
+            ids of the dropped snapshots.
+
+        Raises:
+            InsufficientSubArguments: raised if no retention policy was given.
+        """
+        if keep_last is None and keep_daily is None:
+            raise CegExceptions.InsufficientSubArguments(
+                "--keep-last and/or --keep-daily missing!"
+            )
+        snapshots: List[str] = self.snapshots()
+        kept: Set[str] = set(snapshots[-keep_last:] if keep_last else ())
+        if keep_daily:
+            latest_of_day: Dict[str, str] = {}
+            for snapshot_id in snapshots:
+                latest_of_day[snapshot_id[:8]] = snapshot_id
+            kept.update(
+                latest_of_day[day] for day in sorted(latest_of_day)[-keep_daily:]
+            )
+        dropped: List[str] = [
+            snapshot_id for snapshot_id in snapshots if snapshot_id not in kept
+        ]
+        for snapshot_id in dropped:
+            os.remove(os.path.join(self.snapshots_dir, snapshot_id + ".json"))
+        self.collect_garbage()
+        return dropped
+
+    def collect_garbage(self) -> int:
+        """Remove the objects not referenced by any snapshot(and leftover partial objects).
+
+        Returns:
+            number of removed objects.
+        """
+        referenced: Set[str] = {
+            file_record["sha256"]
+            for snapshot_id in self.snapshots()
+            for gist in self.load(snapshot_id).values()
+            for file_record in gist["files"].values()
+        }
+        removed: int = 0
+        for dir_path, _, file_names in os.walk(self.objects_dir):
+            for file_name in file_names:
+                if file_name not in referenced:
+                    os.remove(os.path.join(dir_path, file_name))
+                    removed += 1
+        return removed
+
+
+class SnapshotGistHandler:
+    """File handler for the files of a single gist of a new snapshot.
+
+    Stands in for `FileHandler` during snapshot backups,recording every stored file.
+
+    Attributes:
+        files: mapping of every stored file name to its size and sha256 hash.
+        return_code: return code,1 marks the gist as failed.
+    """
+
+    def __init__(self, store: SnapshotStore) -> None:
+        """Inits SnapshotGistHandler with the snapshot store"""
+        self.__store: SnapshotStore = store
+        self.__lock: threading.Lock = threading.Lock()
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.return_code: int = 0
+
+    def write_stream(
+        self,
+        file_name: str,
+        chunks: Iterable[bytes],
+        known_hash: Optional[str] = None,
+    ) -> Tuple[int, str]:
+        """Stream binary chunks into the store."""
+        file_size, file_hash = self.__store.store(chunks)
+        with self.__lock:
+            self.files[file_name] = {"size": file_size, "sha256": file_hash}
+        return file_size, file_hash
+
+    def exists(self, file_name: str) -> bool:
+        return False
+
+    def remove(self, file_name: str) -> None:
+        pass
@@ -0,0 +1,257 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Local metadata store of gist listings """
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from .cache import default_cache_dir
+from typing import List, Dict, Optional, Iterable, Tuple, Any
+
+__all__ = ("MetadataStore",)
+
+
+class MetadataStore:
+    """SQLite store of gist metadata.
+
+    Keeps the metadata of every gist of a listing(i.e id,description,visibility,
+    timestamps and name,size and language of every file),so that listings can be
+    answered and filtered locally,even offline.listings are kept per `source`
+    (i.e the endpoint they were fetched from,along with the credential they were
+    fetched with) and every refresh replaces the whole listing of its source.its
+    safe to share between threads.
+
+    Attributes:
+        db_path: path of the database,`:memory:` for a throwaway store.
+    """
+
+    SCHEMA: str = """
+    CREATE TABLE IF NOT EXISTS listings (
+        source TEXT PRIMARY KEY,
+        refreshed_at REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS gists (
+        source TEXT NOT NULL,
+        id TEXT NOT NULL,
+        owner TEXT,
+        description TEXT,
+        public INTEGER NOT NULL,
+        created_at TEXT,
+        updated_at TEXT,
+        html_url TEXT,
+        PRIMARY KEY (source, id)
+    );
+    CREATE TABLE IF NOT EXISTS files (
+        source TEXT NOT NULL,
+        gist_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        size INTEGER,
+        language TEXT,
+        type TEXT,
+        raw_url TEXT,
+        PRIMARY KEY (source, gist_id, name)
+    );
+    CREATE INDEX IF NOT EXISTS gists_updated_at ON gists (source, updated_at);
+    CREATE INDEX IF NOT EXISTS files_language ON files (source, language COLLATE NOCASE);
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        """Inits MetadataStore with path of the database.
+
+        Args:
+            db_path: (Optional) path of the database,defaults to `$XDG_CACHE_HOME/ceg/metadata.sqlite3`.
+        """
+        if db_path is None:
+            db_path = os.path.join(default_cache_dir(), "metadata.sqlite3")
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), mode=0o700, exist_ok=True)
+        self.db_path: str = db_path
+        self.__lock: threading.Lock = threading.Lock()
+        self.__connection: sqlite3.Connection = sqlite3.connect(
+            db_path, check_same_thread=False
+        )
+        self.__connection.row_factory = sqlite3.Row
+        with self.__connection:
+            self.__connection.executescript(self.SCHEMA)
+
+    @staticmethod
+    def source(end_point: str, credential: Optional[str]) -> str:
+        """Derive the source of a listing.
+
+        A listing fetched with a credential includes its secret gists,so its never
+        answered to another credential(or to none).
+
+        Args:
+            end_point: endpoint of the listing.
+            credential: value of the Authorization header,if any.
+
+        Returns:
+            the endpoint,suffixed with a digest of the credential if there's one.
+        """
+        if not credential:
+            return end_point
+        return f"{end_point}#{hashlib.sha256(credential.encode('utf-8')).hexdigest()}"
+
+    def close(self) -> None:
+        """Close the database."""
+        with self.__lock:
+            self.__connection.close()
+
+    def refreshed_at(self, source: str) -> Optional[float]:
+        """Return the epoch time at which the listing of a source was last stored.
+
+        Args:
+            source: source of the listing.
+
+        Returns:
+            epoch time of the last refresh,None if the source was never stored.
+        """
+        with self.__lock:
+            row: Optional[sqlite3.Row] = self.__connection.execute(
+                "SELECT refreshed_at FROM listings WHERE source = ?", (source,)
+            ).fetchone()
+        return None if row is None else row["refreshed_at"]
+
+    def refresh(self, source: str, listing: Iterable[Dict[str, Any]]) -> None:
+        """Replace the stored listing of a source.
+
+        Args:
+            source: source of the listing.
+            listing: json-decoded gists of the listing.
+        """
+        gist_rows: List[Tuple[Any, ...]] = []
+        file_rows: List[Tuple[Any, ...]] = []
+        for gist in listing:
+            gist_rows.append(
+                (
+                    source,
+                    gist["id"],
+                    (gist.get("owner") or {}).get("login"),
+                    gist.get("description"),
+                    bool(gist.get("public")),
+                    gist.get("created_at"),
+                    gist.get("updated_at"),
+                    gist.get("html_url"),
+                )
+            )
+            for file_name, file_hashtable in (gist.get("files") or {}).items():
+                file_rows.append(
+                    (
+                        source,
+                        gist["id"],
+                        file_name,
+                        file_hashtable.get("size"),
+                        file_hashtable.get("language"),
+                        file_hashtable.get("type"),
+                        file_hashtable.get("raw_url"),
+                    )
+                )
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM files WHERE source = ?", (source,))
+            self.__connection.execute("DELETE FROM gists WHERE source = ?", (source,))
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO gists VALUES (?, ?, ?, ?, ?, ?, ?, ?)", gist_rows
+            )
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)", file_rows
+            )
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?)", (source, time.time())
+            )
+
+    def query(
+        self,
+        source: str,
+        language: Optional[str] = None,
+        filename: Optional[str] = None,
+        updated_since: Optional[str] = None,
+        public: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the stored gists of a source matching all the given filters.
+
+        Args:
+            source: source of the listing.
+            language: (Optional) only gists having a file of this language(case insensitive).
+            filename: (Optional) only gists having a file whose name matches this glob pattern.
+            updated_since: (Optional) only gists updated at or after this ISO 8601 date/time.
+            public: (Optional) only public(True) or private(False) gists.
+
+        Returns:
+            gists shaped like the ones of github's listing,most recently updated first.
+        """
+        conditions: List[str] = ["g.source = ?"]
+        parameters: List[Any] = [source]
+        if public is not None:
+            conditions.append("g.public = ?")
+            parameters.append(public)
+        if updated_since is not None:
+            conditions.append("g.updated_at >= ?")
+            parameters.append(updated_since)
+        file_conditions: List[str] = []
+        if language is not None:
+            file_conditions.append("f.language = ? COLLATE NOCASE")
+            parameters.append(language)
+        if filename is not None:
+            file_conditions.append("f.name GLOB ?")
+            parameters.append(filename)
+        if file_conditions:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM files f WHERE f.source = g.source AND f.gist_id = g.id AND "
+                + " AND ".join(file_conditions)
+                + ")"
+            )
+        where_clause: str = " AND ".join(conditions)
+        with self.__lock:
+            gist_rows: List[sqlite3.Row] = self.__connection.execute(
+                f"SELECT * FROM gists g WHERE {where_clause} ORDER BY g.updated_at DESC",
+                parameters,
+            ).fetchall()
+            file_rows: List[sqlite3.Row] = self.__connection.execute(
+                "SELECT * FROM files WHERE source = ? AND gist_id IN "
+                f"(SELECT g.id FROM gists g WHERE {where_clause}) ORDER BY name",
+                [source] + parameters,
+            ).fetchall()
+        gists: Dict[str, Dict[str, Any]] = {
+            row["id"]: {
+                "id": row["id"],
+                "owner": {"login": row["owner"]} if row["owner"] else None,
+                "description": row["description"],
+                "public": bool(row["public"]),
+                "created_at": row["created_at"],
+                "updated_at": row["updated_at"],
+                "html_url": row["html_url"],
+                "files": {},
+            }
+            for row in gist_rows
+        }
+        for row in file_rows:
+            gists[row["gist_id"]]["files"][row["name"]] = {
+                "filename": row["name"],
+                "size": row["size"],
+                "language": row["language"],
+                "type": row["type"],
+                "raw_url": row["raw_url"],
+            }
+        return list(gists.values())
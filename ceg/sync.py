@@ -0,0 +1,175 @@
+# ╔═══╗
+# ║╔═╗║
+# ║║ ╚╝╔══╗╔══╗
+# ║║ ╔╗║╔╗║║╔╗║
+# ║╚═╝║║║═╣║╚╝║
+# ╚═══╝╚══╝╚═╗║
+#          ╔═╝║
+#          ╚══╝
+# ©Justaus3r 2022
+# This file is part of "Ceg",a gist crud utility.
+# Distributed under GPLV3
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" State and planning of directory <-> gist syncs """
+
+import os
+import re
+import json
+import hashlib
+from typing import List, Dict, Optional, Any
+
+__all__ = ("SyncState", "scan_directory", "plan_sync")
+
+PART_FILE_PATTERN: "re.Pattern[str]" = re.compile(r"^\..+\.[0-9a-f]{32}\.part$")
+
+
+class SyncState:
+    """State index of a directory synced with a gist.
+
+    Keeps the mtime,size and sha256 hash of every file as of the last sync(when the
+    directory and gist agreed on it) along with the revision and ETag of the gist,
+    which is used for figuring out what changed on either side since then.
+
+    Attributes:
+        FILE_NAME: name of the state file inside the synced directory.
+        path: path to the state file.
+        gist_id: gist-id of the synced gist.
+        revision: (Optional) revision of the gist as of the last sync,None if it has to be re-checked.
+        etag: (Optional) ETag of the gist as of the last sync,used for a conditional request.
+        files: mapping of file name to its mtime,size and sha256 hash.
+    """
+
+    FILE_NAME: str = ".ceg-sync.json"
+    VERSION: int = 1
+
+    def __init__(self, sync_dir: str, gist_id: str) -> None:
+        """Inits SyncState and loads the state of sync_dir,if it belongs to gist_id"""
+        self.path: str = os.path.join(sync_dir, self.FILE_NAME)
+        self.gist_id: str = gist_id
+        self.revision: Optional[str] = None
+        self.etag: Optional[str] = None
+        self.files: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as r_obj:
+                state: Dict[str, Any] = json.load(r_obj)
+            # a directory previously synced with another gist starts over
+            if state.get("gist_id") == gist_id:
+                self.revision = state.get("revision")
+                self.etag = state.get("etag")
+                self.files = state.get("files", {})
+
+    def save(self) -> None:
+        """Atomically write the state to disk."""
+        tmp_path: str = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as w_obj:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "gist_id": self.gist_id,
+                    "revision": self.revision,
+                    "etag": self.etag,
+                    "files": self.files,
+                },
+                w_obj,
+                indent=1,
+            )
+        os.replace(tmp_path, self.path)
+
+
+def scan_directory(sync_dir: str, known_files: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Return the mtime,size and sha256 hash of every file in a synced directory.
+
+    Files whose mtime and size match their known entry aren't read again.sub-directories,
+    the state file and partially written files are skipped.
+
+    Args:
+        sync_dir: the synced directory.
+        known_files: `files` of the SyncState.
+
+    Returns:
+        mapping of file name to its mtime,size and sha256 hash.
+    """
+    local_files: Dict[str, Dict[str, Any]] = {}
+    for entry in os.scandir(sync_dir):
+        if (
+            not entry.is_file()
+            or entry.name in (SyncState.FILE_NAME, SyncState.FILE_NAME + ".tmp")
+            or PART_FILE_PATTERN.match(entry.name)
+        ):
+            continue
+        stat_result: os.stat_result = entry.stat()
+        known_file: Dict[str, Any] = known_files.get(entry.name, {})
+        if (
+            known_file.get("mtime") == stat_result.st_mtime
+            and known_file.get("size") == stat_result.st_size
+        ):
+            local_files[entry.name] = known_file
+            continue
+        hash_obj = hashlib.sha256()
+        with open(entry.path, "rb") as r_obj:
+            for chunk in iter(lambda: r_obj.read(1024 * 1024), b""):
+                hash_obj.update(chunk)
+        local_files[entry.name] = {
+            "mtime": stat_result.st_mtime,
+            "size": stat_result.st_size,
+            "sha256": hash_obj.hexdigest(),
+        }
+    return local_files
+
+
+def plan_sync(
+    known_files: Dict[str, Dict[str, Any]],
+    local_files: Dict[str, Dict[str, Any]],
+    remote_hashes: Optional[Dict[str, str]],
+) -> Dict[str, List[str]]:
+    """Work out the minimal set of changes bringing a directory and a gist in sync.
+
+    Every file is compared against its state as of the last sync: a file changed on one side
+    only is copied over(or deleted) to the other one,a file changed on both sides is a conflict
+    unless both changed it the same way.
+
+    Args:
+        known_files: `files` of the SyncState.
+        local_files: files of the directory,as returned by `scan_directory`.
+        remote_hashes: mapping of every file of the gist to its sha256 hash,None if the gist
+                       hasn't changed since the last sync.
+
+    Returns:
+        A mapping containing the file names to `upload`,`delete_remote`,`download` and `delete_local`,
+        the `conflicts` and the files changed the same way on both sides(`agreed`).
+    """
+    if remote_hashes is None:
+        remote_hashes = {name: known["sha256"] for name, known in known_files.items()}
+    plan: Dict[str, List[str]] = {
+        "upload": [],
+        "delete_remote": [],
+        "download": [],
+        "delete_local": [],
+        "conflicts": [],
+        "agreed": [],
+    }
+    for file_name in sorted(set(known_files) | set(local_files) | set(remote_hashes)):
+        known_hash: Optional[str] = known_files.get(file_name, {}).get("sha256")
+        local_hash: Optional[str] = local_files.get(file_name, {}).get("sha256")
+        remote_hash: Optional[str] = remote_hashes.get(file_name)
+        if local_hash == known_hash and remote_hash == known_hash:
+            continue
+        if remote_hash == known_hash:
+            plan["upload" if local_hash is not None else "delete_remote"].append(file_name)
+        elif local_hash == known_hash:
+            plan["download" if remote_hash is not None else "delete_local"].append(file_name)
+        elif local_hash == remote_hash:
+            plan["agreed"].append(file_name)
+        else:
+            plan["conflicts"].append(file_name)
+    return plan
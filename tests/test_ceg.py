@@ -3,3 +3,941 @@ from ceg import __version__
 
 def test_version():
     assert __version__ == '0.1.0'
+
+
+def test_api_operations_share_pooled_session():
+    from ceg import CegApi
+
+    with CegApi(secret_key=None, pool_maxsize=4) as cgi:
+        assert cgi.ceg_instance.session is cgi.session
+        adapter = cgi.session.session.get_adapter("https://api.github.com")
+        assert adapter._pool_maxsize == 4
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=b"", links=None, headers=None, url=""):
+        self.url = url
+        self.status_code = status_code
+        self.content = body
+        self.links = links or {}
+        self.headers = headers or {}
+
+    def iter_content(self, chunk_size=1):
+        for offset in range(0, len(self.content), chunk_size):
+            yield self.content[offset : offset + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+
+class FakeSession:
+    """Replays canned responses per url and records every request."""
+
+    def __init__(self, responses):
+        from ceg.ratelimit import RateLimitGovernor
+
+        self.responses = responses
+        self.requests = []
+        self.governor = RateLimitGovernor()
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.requests.append((method, url, kwargs))
+        return self.responses[url]
+
+    def close(self):
+        pass
+
+    def with_governor(self, governor):
+        self.governors = getattr(self, "governors", []) + [governor]
+        return self
+
+
+def make_ceg(session, **kwargs):
+    from ceg.ceg import Ceg
+
+    options = dict(
+        operation="get",
+        arg_value="",
+        is_recursive_operation=False,
+        is_other_user=False,
+        secret_key=None,
+        do_logging=False,
+        gist_no_public=False,
+        gist_desc="",
+        gist_id="",
+        session=session,
+    )
+    options.update(kwargs)
+    return Ceg(**options)
+
+
+def test_iter_gists_follows_link_header():
+    import json
+
+    first = "https://api.github.com/gists"
+    second = "https://api.github.com/gists?per_page=100&page=2"
+    session = FakeSession(
+        {
+            first: FakeResponse(
+                body=json.dumps([{"id": "a"}, {"id": "b"}]).encode(),
+                links={"next": {"url": second}},
+            ),
+            second: FakeResponse(body=json.dumps([{"id": "c"}]).encode()),
+        }
+    )
+    ceg_obj = make_ceg(session)
+    assert [gist["id"] for gist in ceg_obj.iter_gists()] == ["a", "b", "c"]
+    assert session.requests[0][2]["params"] == {"per_page": 100}
+    assert session.requests[1][2]["params"] is None
+
+
+def test_get_reports_failed_gists_without_cancelling_rest(tmp_path, monkeypatch):
+    import json
+    import pytest
+    from ceg.exceptions import CegExceptions
+
+    gists = {
+        "good": {"id": "good", "files": {"a.txt": {"raw_url": "https://raw/good/a.txt"}}},
+        "bad": {"id": "bad", "files": {"b.txt": {"raw_url": "https://raw/bad/b.txt"}}},
+    }
+    session = FakeSession(
+        {
+            "https://api.github.com/gists/missing": FakeResponse(status_code=404),
+            "https://api.github.com/gists/good": FakeResponse(body=json.dumps(gists["good"]).encode()),
+            "https://api.github.com/gists/bad": FakeResponse(body=json.dumps(gists["bad"]).encode()),
+            "https://raw/good/a.txt": FakeResponse(body=b"hello"),
+            "https://raw/bad/b.txt": FakeResponse(status_code=404),
+        }
+    )
+    monkeypatch.chdir(tmp_path)
+    ceg_obj = make_ceg(session, arg_value=["missing", "bad", "good"], max_workers=2)
+    with pytest.raises(CegExceptions.IncompleteOperation) as exc_info:
+        ceg_obj.get()
+    assert set(exc_info.value.failures) == {"missing", "bad"}
+    assert (tmp_path / "good" / "a.txt").read_text() == "hello"
+    assert not (tmp_path / "bad").exists()
+
+
+def test_async_api_against_local_server(tmp_path, monkeypatch):
+    import asyncio
+    import pytest
+    from ceg.retry import RetryPolicy
+
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+    from ceg import AsyncCegApi
+
+    raw_hits = []
+
+    def gist(request, gist_id, truncated=False, files=("a.txt",)):
+        origin = request.url.origin()
+        return {
+            "id": gist_id,
+            "truncated": truncated,
+            "files": {name: {"raw_url": f"{origin}/raw/{gist_id}/{name}"} for name in files},
+        }
+
+    async def listing(request):
+        if request.query.get("page") == "2":
+            return web.json_response([gist(request, "big", truncated=True)])
+        next_url = request.url.with_query({"page": "2"})
+        return web.json_response(
+            [gist(request, "small")], headers={"Link": f'<{next_url}>; rel="next"'}
+        )
+
+    async def single(request):
+        gist_id = request.match_info["id"]
+        files = ("a.txt", "b.txt") if gist_id == "big" else ("a.txt",)
+        return web.json_response(gist(request, gist_id, files=files))
+
+    async def raw(request):
+        raw_hits.append(request.path)
+        # the first download of every file fails transiently
+        if raw_hits.count(request.path) == 1:
+            return web.Response(status=500)
+        return web.Response(body=request.path.encode())
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/gists", listing)
+        app.router.add_get("/gists/{id}", single)
+        app.router.add_get("/raw/{id}/{name}", raw)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncCegApi(None, retry_policy=RetryPolicy(backoff=0)) as cgi:
+                cgi.end_point = f"http://127.0.0.1:{port}/gists"
+                records = await cgi.list()
+                assert [record.id for record in records] == ["small", "big"]
+                assert await cgi.get("small") == "OK!"
+                assert await cgi.backup() == "OK!"
+        finally:
+            await runner.cleanup()
+
+    monkeypatch.chdir(tmp_path)
+    asyncio.run(run())
+    assert (tmp_path / "small" / "a.txt").read_text() == "/raw/small/a.txt"
+    backup_dir = tmp_path / "GIST-BACKUP"
+    assert (backup_dir / "small" / "a.txt").read_text() == "/raw/small/a.txt"
+    # the truncated gist is completed before its files are downloaded
+    assert (backup_dir / "big" / "b.txt").read_text() == "/raw/big/b.txt"
+    # nothing but the complete files is left behind
+    assert sorted(path.name for path in (backup_dir / "big").iterdir()) == ["a.txt", "b.txt"]
+
+
+def test_incremental_backup_only_touches_changed_gists(tmp_path, monkeypatch):
+    import json
+
+    def listing_session(listing, raw):
+        responses = {
+            "https://api.github.com/gists": FakeResponse(body=json.dumps(listing).encode())
+        }
+        responses.update({url: FakeResponse(body=body) for url, body in raw.items()})
+        return FakeSession(responses)
+
+    def gist(gist_id, updated_at, *files):
+        return {
+            "id": gist_id,
+            "updated_at": updated_at,
+            "files": {name: {"raw_url": f"https://raw/{gist_id}/{name}"} for name in files},
+        }
+
+    monkeypatch.chdir(tmp_path)
+    session = listing_session(
+        [gist("keep", "1", "k.txt"), gist("edit", "1", "e.txt", "old.txt"), gist("gone", "1", "g.txt")],
+        {
+            "https://raw/keep/k.txt": b"k",
+            "https://raw/edit/e.txt": b"e1",
+            "https://raw/edit/old.txt": b"o",
+            "https://raw/gone/g.txt": b"g",
+        },
+    )
+    make_ceg(session, is_recursive_operation=True).backup()
+
+    session = listing_session(
+        [gist("keep", "1", "k.txt"), gist("edit", "2", "e.txt"), gist("new", "1", "n.txt")],
+        {"https://raw/edit/e.txt": b"e2", "https://raw/new/n.txt": b"n"},
+    )
+    ceg_obj = make_ceg(session, is_recursive_operation=True)
+    ceg_obj.incremental = True
+    ceg_obj.backup()
+
+    backup_dir = tmp_path / "GIST-BACKUP"
+    downloaded = {url for _, url, _ in session.requests if url.startswith("https://raw")}
+    assert downloaded == {"https://raw/edit/e.txt", "https://raw/new/n.txt"}
+    assert (backup_dir / "edit" / "e.txt").read_text() == "e2"
+    assert not (backup_dir / "edit" / "old.txt").exists()
+    assert (backup_dir / ".removed" / "gone" / "g.txt").exists()
+    manifest = json.loads((backup_dir / ".ceg-manifest.json").read_text())["gists"]
+    assert set(manifest) == {"keep", "edit", "new"}
+
+
+def test_listing_is_requested_conditionally(tmp_path):
+    import json
+    from ceg.cache import HttpCache
+
+    url = "https://api.github.com/gists"
+    body = json.dumps([{"id": "a"}]).encode()
+    session = FakeSession({url: FakeResponse(body=body, headers={"ETag": '"v1"'})})
+    ceg_obj = make_ceg(session, http_cache=HttpCache(str(tmp_path)))
+    assert [gist["id"] for gist in ceg_obj.iter_gists()] == ["a"]
+
+    session.responses[url] = FakeResponse(status_code=304)
+    sent_headers = []
+    request = session.request
+    session.request = lambda method, url, headers=None, **kwargs: (
+        sent_headers.append(headers) or request(method, url, headers, **kwargs)
+    )
+    assert [gist["id"] for gist in ceg_obj.iter_gists()] == ["a"]
+    assert sent_headers[0]["If-None-Match"] == '"v1"'
+
+
+def test_http_cache_is_bounded_and_optional(tmp_path, monkeypatch):
+    import os
+    from ceg import CegApi
+    from ceg.cache import HttpCache
+
+    http_cache = HttpCache(str(tmp_path), max_entries=2)
+    for mtime, url in enumerate(("https://a", "https://b")):
+        key = http_cache.key(url, None, None)
+        http_cache.store(key, FakeResponse(body=b"[]", headers={"ETag": url}, url=url))
+        os.utime(os.path.join(http_cache.cache_dir, key + ".json"), (mtime, mtime))
+    # the hit on a makes b the least recently used entry
+    assert http_cache.cached_response(http_cache.key("https://a", None, None)) is not None
+    http_cache.store(
+        http_cache.key("https://c", None, None),
+        FakeResponse(body=b"[]", headers={"ETag": "c"}, url="https://c"),
+    )
+    assert http_cache.validators(http_cache.key("https://b", None, None)) == {}
+    assert http_cache.validators(http_cache.key("https://a", None, None))
+    assert len(os.listdir(http_cache.cache_dir)) == 2
+
+    # an unwritable cache directory leaves the cache out instead of failing
+    monkeypatch.setenv("XDG_CACHE_HOME", "/proc/nonexistent/c")
+    with CegApi("x") as cgi:
+        assert cgi.ceg_instance.http_cache is None
+        assert cgi.metadata_store is None
+
+
+def test_write_stream_is_binary_safe(tmp_path):
+    import hashlib
+    from ceg.misc import FileHandler
+
+    content = bytes(range(256)) * 1000
+    file_handler = FileHandler(str(tmp_path / "gist"))
+    size, digest = file_handler.write_stream(
+        "blob.bin", (content[i : i + 4096] for i in range(0, len(content), 4096))
+    )
+    assert (size, digest) == (len(content), hashlib.sha256(content).hexdigest())
+    assert (tmp_path / "gist" / "blob.bin").read_bytes() == content
+    assert [path.name for path in (tmp_path / "gist").iterdir()] == ["blob.bin"]
+
+
+def test_truncated_gist_is_completed_before_download(tmp_path, monkeypatch):
+    import json
+
+    listing = [{"id": "big", "truncated": True, "files": {"a.txt": {"raw_url": "https://raw/a"}}}]
+    complete = {
+        "id": "big",
+        "truncated": False,
+        "files": {
+            "a.txt": {"raw_url": "https://raw/a"},
+            "b.txt": {"raw_url": "https://raw/b", "truncated": True},
+        },
+    }
+    session = FakeSession(
+        {
+            "https://api.github.com/gists": FakeResponse(body=json.dumps(listing).encode()),
+            "https://api.github.com/gists/big": FakeResponse(body=json.dumps(complete).encode()),
+            "https://raw/a": FakeResponse(body=b"a"),
+            "https://raw/b": FakeResponse(body=b"b" * 100000),
+        }
+    )
+    monkeypatch.chdir(tmp_path)
+    make_ceg(session, is_recursive_operation=True).get()
+    assert sorted(path.name for path in (tmp_path / "big").iterdir()) == ["a.txt", "b.txt"]
+    assert (tmp_path / "big" / "b.txt").stat().st_size == 100000
+
+
+def test_rate_limit_governor_paces_and_pauses():
+    from ceg.ratelimit import RateLimitGovernor
+
+    now = [1000.0]
+    governor = RateLimitGovernor(clock=lambda: now[0])
+    governor.update({"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "4600"})
+    assert governor.reserve() == 0.0
+
+    governor.update({"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": "1040"})
+    assert governor.reserve() == 0.0
+    # the remaining 3 requests are spread over the rest of the window
+    assert governor.reserve() == 10.0
+
+    assert governor.pause_for(403, {}, "Not allowed") is None
+    assert governor.pause_for(403, {"Retry-After": "30"}) == 30.0
+    assert governor.state()["paused_until"] == 1030.0
+    assert governor.pause_for(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "99999"}) is None
+
+
+def test_rate_limit_governor_scales_pacing_to_anonymous_limit():
+    from ceg.ratelimit import RateLimitGovernor
+
+    now = [1000.0]
+    governor = RateLimitGovernor(clock=lambda: now[0])
+    governor.update({"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "59", "X-RateLimit-Reset": "4600"})
+    assert [governor.reserve() for _ in range(4)] == [0.0] * 4
+
+    # only the last tenth of the budget is spread over the rest of the window
+    governor.update({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "4600"})
+    assert [governor.reserve() for _ in range(2)] == [0.0, 720.0]
+
+
+def test_session_retries_idempotent_requests_only():
+    from ceg.retry import RetryPolicy
+    from ceg.session import CegSession
+
+    session = CegSession(retry_policy=RetryPolicy(retries=2, backoff=0))
+    replies = []
+    session.session.request = lambda method, url, **kwargs: FakeResponse(replies.pop(0))
+
+    replies[:] = [503, 502, 200]
+    assert session.request("get", "https://raw.example/a").status_code == 200
+    replies[:] = [503, 503, 503, 200]
+    assert session.request("delete", "https://raw.example/a").status_code == 503
+    replies[:] = [503, 200]
+    assert session.request("post", "https://raw.example/a").status_code == 503
+
+
+def test_bulk_delete_reports_outcome_per_gist():
+    from ceg.exceptions import CegExceptions
+
+    session = FakeSession(
+        {
+            "https://api.github.com/gists/a": FakeResponse(status_code=204),
+            "https://api.github.com/gists/b": FakeResponse(status_code=404),
+            "https://api.github.com/gists/c": FakeResponse(status_code=204),
+        }
+    )
+    ceg_obj = make_ceg(session, operation="delete", arg_value=("a", "b", "c"))
+    outcomes = ceg_obj.delete(raise_on_failure=False)
+    assert list(outcomes) == ["a", "b", "c"]
+    assert outcomes["a"] == outcomes["c"] == "OK!.No Response Recieved."
+    assert isinstance(outcomes["b"], CegExceptions.ResourceNotFound)
+    assert ceg_obj.end_point == "https://api.github.com/gists"
+
+
+def test_post_bulk_creates_a_gist_per_entry(tmp_path):
+    import json
+
+    for name in ("one", "two"):
+        (tmp_path / "reports" / name).mkdir(parents=True)
+        (tmp_path / "reports" / name / f"{name}.md").write_text(name)
+    (tmp_path / "reports" / "empty").mkdir()
+
+    created = []
+
+    class CreatingSession(FakeSession):
+        def request(self, method, url, headers=None, **kwargs):
+            created.append(json.loads(kwargs["data"]))
+            name = created[-1]["description"]
+            return FakeResponse(status_code=201, body=json.dumps({"html_url": f"https://gist/{name}"}).encode())
+
+    ceg_obj = make_ceg(CreatingSession({}), operation="post", arg_value=str(tmp_path / "reports"))
+    outcomes = ceg_obj.post_bulk(raise_on_failure=False)
+    assert outcomes["one"] == "https://gist/one"
+    assert outcomes["two"] == "https://gist/two"
+    assert isinstance(outcomes["empty"], Exception)
+    assert sorted(gist["files"]["one.md"]["content"] for gist in created if "one.md" in gist["files"]) == ["one"]
+
+
+def test_heavy_dependencies_are_imported_lazily():
+    import os
+    import sys
+    import subprocess
+
+    script = (
+        "import sys\n"
+        "sys.argv = ['ceg', '--version']\n"
+        "from ceg.cli import ceg_cli\n"
+        "try:\n"
+        "    ceg_cli()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "from ceg import CegApi\n"
+        "from ceg.ceg import Ceg\n"
+        "from ceg.logger import Logger\n"
+        "Logger(send_log=False)\n"
+        "print(sorted(m for m in ('requests', 'rich', 'aiohttp') if m in sys.modules))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+    ).stdout
+    assert output.splitlines()[-1] == "[]"
+
+
+def test_get_fetches_inquired_gists_directly(tmp_path, monkeypatch):
+    import json
+
+    gist = {
+        "id": "one",
+        "files": {"a.txt": {"raw_url": "https://raw/a", "content": "inline", "truncated": False}},
+    }
+    session = FakeSession(
+        {"https://api.github.com/gists/one": FakeResponse(body=json.dumps(gist).encode())}
+    )
+    monkeypatch.chdir(tmp_path)
+    make_ceg(session, arg_value=["one"]).get()
+    assert [url for _, url, _ in session.requests] == ["https://api.github.com/gists/one"]
+    assert (tmp_path / "one" / "a.txt").read_text() == "inline"
+
+
+def test_api_get_and_backup_return_status_even_when_cached(tmp_path, monkeypatch):
+    import json
+    from ceg import CegApi
+
+    gist = {"id": "one", "files": {"a.txt": {"content": "inline", "truncated": False}}}
+    monkeypatch.chdir(tmp_path)
+    with CegApi(secret_key=None, use_http_cache=False, use_metadata_store=False) as cgi:
+        cgi.session = FakeSession(
+            {
+                "https://api.github.com/gists": FakeResponse(body=json.dumps([gist]).encode()),
+                "https://api.github.com/gists/one": FakeResponse(body=json.dumps(gist).encode()),
+            }
+        )
+        # the second calls are answered from the metadata cache
+        for attempt in ("first", "second"):
+            (tmp_path / attempt).mkdir()
+            monkeypatch.chdir(tmp_path / attempt)
+            assert cgi.get("one") == "OK!"
+        assert cgi.backup(backup_dir="first") == "OK!"
+        assert cgi.backup(backup_dir="second") == "OK!"
+        assert len(cgi.session.requests) == 2
+
+
+def test_metadata_cache_evicts_and_invalidates_on_writes():
+    import json
+    from ceg.cache import MetadataCache
+
+    now = [0.0]
+    cache = MetadataCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.put("gist", "a", 1)
+    cache.put("gist", "b", 2)
+    cache.get("gist", "a")
+    cache.put("gist", "c", 3)
+    assert cache.get("gist", "b") is None and cache.get("gist", "a") == 1
+    now[0] = 10.0
+    assert cache.get("gist", "a") is None
+
+    url = "https://api.github.com/gists/one"
+    session = FakeSession(
+        {url: FakeResponse(body=json.dumps({"id": "one", "files": {}}).encode())}
+    )
+    ceg_obj = make_ceg(session, metadata_cache=MetadataCache())
+    ceg_obj.fetch_gist("one")
+    ceg_obj.fetch_gist("one")
+    assert len(session.requests) == 1
+    session.responses["https://api.github.com/gists/one"] = FakeResponse(status_code=204)
+    ceg_obj.arg_val = ["one"]
+    ceg_obj.delete()
+    session.responses[url] = FakeResponse(body=json.dumps({"id": "one", "files": {}}).encode())
+    ceg_obj.fetch_gist("one")
+    assert [method for method, _, _ in session.requests] == ["get", "delete", "get"]
+
+
+def test_metadata_store_filters_listing_offline():
+    import json
+    from ceg.store import MetadataStore
+
+    def gist(gist_id, public, updated_at, **files):
+        return {
+            "id": gist_id,
+            "public": public,
+            "updated_at": updated_at,
+            "files": {name: {"size": 1, "language": language} for name, language in files.items()},
+        }
+
+    listing = [
+        gist("py", True, "2022-09-01T00:00:00Z", **{"a.py": "Python", "README.md": "Markdown"}),
+        gist("md", False, "2022-07-01T00:00:00Z", **{"notes.md": "Markdown"}),
+    ]
+    url = "https://api.github.com/gists"
+    session = FakeSession({url: FakeResponse(body=json.dumps(listing).encode())})
+    store = MetadataStore(":memory:")
+    ceg_obj = make_ceg(session, metadata_store=store)
+    ceg_obj.list_filters = {"language": "python"}
+    assert [record.id for record in ceg_obj.list()] == ["py"]
+
+    ceg_obj.session = FakeSession({})
+    ceg_obj.offline = True
+    ceg_obj.list_filters = {"filename": "*.md", "public": False}
+    assert [record.id for record in ceg_obj.list()] == ["md"]
+    source = MetadataStore.source(url, ceg_obj.header["Authorization"])
+    assert [gist["id"] for gist in store.query(source, updated_since="2022-08")] == ["py"]
+    assert sorted(store.query(source)[0]["files"]) == ["README.md", "a.py"]
+
+
+def test_metadata_store_keeps_listings_per_credential():
+    import json
+    import pytest
+    from ceg.exceptions import CegExceptions
+    from ceg.store import MetadataStore
+
+    url = "https://api.github.com/gists"
+    store = MetadataStore(":memory:")
+    for secret_key in ("alice", "bob"):
+        listing = [{"id": f"{secret_key}-secret", "public": False, "files": {}}]
+        session = FakeSession({url: FakeResponse(body=json.dumps(listing).encode())})
+        make_ceg(session, secret_key=secret_key, metadata_store=store).list()
+
+    def offline_listing(secret_key):
+        ceg_obj = make_ceg(FakeSession({}), secret_key=secret_key, metadata_store=store)
+        ceg_obj.offline = True
+        return [record.id for record in ceg_obj.list()]
+
+    assert offline_listing("alice") == ["alice-secret"]
+    assert offline_listing("bob") == ["bob-secret"]
+    with pytest.raises(CegExceptions.ResourceNotFound):
+        offline_listing(None)
+
+
+def test_search_index_ranks_lines_and_updates_incrementally(tmp_path):
+    import hashlib
+    from ceg.manifest import BackupManifest
+    from ceg.search import SearchIndex
+
+    def backup_file(manifest, gist_id, name, content):
+        (tmp_path / gist_id).mkdir(exist_ok=True)
+        (tmp_path / gist_id / name).write_bytes(content)
+        manifest.gists.setdefault(gist_id, {"files": {}})["files"][name] = {
+            "sha256": hashlib.sha256(content).hexdigest()
+        }
+
+    manifest = BackupManifest(str(tmp_path))
+    backup_file(manifest, "a", "retry.py", b"import time\n# retry with backoff\nretry()\n")
+    backup_file(manifest, "b", "notes.md", b"no backoff here\n")
+    backup_file(manifest, "b", "blob.bin", b"\xff\xfe\x00")
+    with SearchIndex(str(tmp_path)) as search_index:
+        assert search_index.update(manifest) == (3, 0)
+        results = search_index.search("Retry BACKOFF")
+        assert [(r["gist_id"], r["file"], r["line"]) for r in results] == [
+            ("a", "retry.py", 2),
+            ("a", "retry.py", 3),
+            ("b", "notes.md", 1),
+        ]
+        assert results[0]["text"] == "# retry with backoff"
+
+        manifest.gists.pop("b")
+        assert search_index.update(manifest) == (0, 2)
+        assert [r["gist_id"] for r in search_index.search("backoff")] == ["a"]
+
+
+def test_search_index_is_built_on_first_search(tmp_path, monkeypatch):
+    import json
+
+    listing = [{"id": "a", "files": {"retry.py": {"raw_url": "https://raw/a/retry.py"}}}]
+    session = FakeSession(
+        {
+            "https://api.github.com/gists": FakeResponse(body=json.dumps(listing).encode()),
+            "https://raw/a/retry.py": FakeResponse(body=b"# retry with backoff\n"),
+        }
+    )
+    monkeypatch.chdir(tmp_path)
+    make_ceg(session, is_recursive_operation=True).backup()
+    assert not (tmp_path / "GIST-BACKUP" / ".ceg-index.sqlite3").exists()
+
+    results = make_ceg(session, arg_value="backoff").search()
+    assert [(r["gist_id"], r["file"], r["line"]) for r in results] == [("a", "retry.py", 1)]
+    assert (tmp_path / "GIST-BACKUP" / ".ceg-index.sqlite3").exists()
+
+
+def test_archive_backup_streams_gists_into_single_tarball(tmp_path, monkeypatch):
+    import json
+    import tarfile
+    import pytest
+    from ceg.exceptions import CegExceptions
+
+    listing = [
+        {"id": "a", "updated_at": "1", "files": {"x.bin": {"raw_url": "https://raw/a/x"}}},
+        {"id": "b", "updated_at": "2", "files": {"y.txt": {"raw_url": "https://raw/b/y"}}},
+    ]
+    session = FakeSession(
+        {
+            "https://api.github.com/gists": FakeResponse(body=json.dumps(listing).encode()),
+            "https://raw/a/x": FakeResponse(body=bytes(range(256)) * 100),
+            "https://raw/b/y": FakeResponse(status_code=404),
+        }
+    )
+    monkeypatch.chdir(tmp_path)
+    ceg_obj = make_ceg(session, is_recursive_operation=True)
+    ceg_obj.archive_format = "xz"
+    with pytest.raises(CegExceptions.IncompleteOperation):
+        ceg_obj.backup()
+    (archive_path,) = tmp_path.glob("GIST-BACKUP-*.tar.xz")
+    with tarfile.open(archive_path) as archive:
+        assert archive.extractfile("a/x.bin").read() == bytes(range(256)) * 100
+        index = json.load(archive.extractfile(".ceg-manifest.json"))
+    assert list(index["gists"]) == ["a"]
+    assert index["gists"]["a"]["files"]["x.bin"]["size"] == 25600
+    assert json.loads((tmp_path / (archive_path.name + ".index.json")).read_text()) == index
+    assert not (tmp_path / "GIST-BACKUP").exists()
+
+
+def test_snapshot_backups_share_unchanged_content(tmp_path, monkeypatch):
+    import json
+    from ceg.snapshot import SnapshotStore
+
+    def snapshot(listing, raw):
+        responses = {
+            "https://api.github.com/gists": FakeResponse(body=json.dumps(listing).encode())
+        }
+        responses.update({url: FakeResponse(body=body) for url, body in raw.items()})
+        session = FakeSession(responses)
+        ceg_obj = make_ceg(session, is_recursive_operation=True)
+        ceg_obj.snapshot_dir = str(tmp_path / "snaps")
+        ceg_obj.backup()
+        return [url for _, url, _ in session.requests]
+
+    def gist(gist_id, updated_at, name):
+        return {"id": gist_id, "updated_at": updated_at, "files": {name: {"raw_url": f"https://raw/{gist_id}/{updated_at}"}}}
+
+    monkeypatch.chdir(tmp_path)
+    snapshot([gist("a", "1", "a.txt"), gist("b", "1", "b.txt")], {"https://raw/a/1": b"same", "https://raw/b/1": b"old"})
+    requested = snapshot(
+        [gist("a", "1", "a.txt"), gist("b", "2", "b.txt")], {"https://raw/b/2": b"same"}
+    )
+    assert requested == ["https://api.github.com/gists", "https://raw/b/2"]
+
+    store = SnapshotStore(str(tmp_path / "snaps"))
+    first, second = store.snapshots()
+    assert store.load(second)["a"] == store.load(first)["a"]
+    objects = [path for path in (tmp_path / "snaps" / "objects").rglob("*") if path.is_file()]
+    assert len(objects) == 2  # "same" is stored once
+    store.restore(second, str(tmp_path / "restored"))
+    assert (tmp_path / "restored" / "b" / "b.txt").read_bytes() == b"same"
+
+    assert store.prune(keep_last=1) == [first]
+    objects = [path for path in (tmp_path / "snaps" / "objects").rglob("*") if path.is_file()]
+    assert len(objects) == 1
+
+
+def test_list_returns_slotted_records(tmp_path):
+    import json
+
+    listing = [
+        {
+            "id": "a",
+            "public": True,
+            "description": "note: keys: values",
+            "files": {"a.py": {"size": 3, "language": "Python", "raw_url": "https://raw/a"}},
+        }
+    ]
+    session = FakeSession(
+        {"https://api.github.com/gists": FakeResponse(body=json.dumps(listing).encode())}
+    )
+    (record,) = make_ceg(session).list()
+    assert record.description == "note: keys: values"
+    assert record.file_names == ["a.py"] and record.files[0].language == "Python"
+    assert not hasattr(record, "__dict__")
+    assert record.to_dict()["files"][0]["size"] == 3
+
+
+def test_list_streams_records_as_pages_arrive():
+    import io
+    import json
+
+    first = "https://api.github.com/gists"
+    second = "https://api.github.com/gists?per_page=100&page=2"
+    session = FakeSession(
+        {
+            first: FakeResponse(
+                body=json.dumps([{"id": "a", "description": "tab\there", "files": {}}]).encode(),
+                links={"next": {"url": second}},
+            ),
+            second: FakeResponse(
+                body=json.dumps([{"id": "b", "public": True, "files": {"x": {}, "y": {}}}]).encode()
+            ),
+        }
+    )
+
+    class Stream(io.StringIO):
+        flushed_after = []
+
+        def flush(self):
+            Stream.flushed_after.append(len(session.requests))
+
+    ceg_obj = make_ceg(session, arg_value="self")
+    ceg_obj.output_format = "ndjson"
+    ceg_obj.output_stream = Stream()
+    ceg_obj.list()
+    lines = ceg_obj.output_stream.getvalue().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["a", "b"]
+    assert Stream.flushed_after == [1, 2]
+
+    ceg_obj.output_format = "tsv"
+    ceg_obj.output_stream = io.StringIO()
+    ceg_obj.list()
+    rows = ceg_obj.output_stream.getvalue().splitlines()
+    assert rows[1].split("\t")[:3] == ["a", "false", "tab\\there"]
+    assert rows[2] == "b\ttrue\t\t\t\t\tx,y"
+
+    ceg_obj.output_format = "json"
+    ceg_obj.output_stream = io.StringIO()
+    ceg_obj.list()
+    assert [gist["id"] for gist in json.loads(ceg_obj.output_stream.getvalue())] == ["a", "b"]
+
+
+def test_api_calls_keep_per_call_state_across_threads():
+    import json
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from ceg import CegApi
+
+    barrier = threading.Barrier(2)
+
+    class OverlappingSession(FakeSession):
+        def request(self, method, url, headers=None, **kwargs):
+            barrier.wait(timeout=5)
+            return super().request(method, url, headers=headers, **kwargs)
+
+    def listing(gist_id):
+        return FakeResponse(body=json.dumps([{"id": gist_id, "files": {}}]).encode())
+
+    with CegApi(
+        secret_key=None, use_http_cache=False, use_metadata_store=False, metadata_cache_size=0
+    ) as cgi:
+        cgi.session = OverlappingSession(
+            {
+                "https://api.github.com/gists": listing("own"),
+                "https://api.github.com/users/bob/gists": listing("bobs"),
+            }
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            own = executor.submit(cgi.list)
+            others = executor.submit(cgi.list_other, "bob")
+            assert [record.id for record in own.result()] == ["own"]
+            assert [record.id for record in others.result()] == ["bobs"]
+        assert cgi.ceg_instance.end_point == "https://api.github.com/gists"
+
+
+def test_backup_accounts_writes_every_account_to_its_own_root(tmp_path, monkeypatch):
+    import os
+    import json
+    from ceg.exceptions import CegExceptions
+
+    def listing(gist_id):
+        raw_url = f"https://raw/{gist_id}"
+        return FakeResponse(
+            body=json.dumps(
+                [{"id": gist_id, "updated_at": "t1", "files": {"a.txt": {"raw_url": raw_url}}}]
+            ).encode()
+        )
+
+    session = FakeSession(
+        {
+            "https://api.github.com/users/alice/gists": listing("g1"),
+            "https://api.github.com/user": FakeResponse(body=b'{"login": "bob"}'),
+            "https://api.github.com/gists": listing("g2"),
+            "https://raw/g1": FakeResponse(body=b"alice"),
+            "https://raw/g2": FakeResponse(body=b"bob"),
+            "https://api.github.com/users/ghost/gists": FakeResponse(status_code=404),
+        }
+    )
+    accounts_file = tmp_path / "accounts.txt"
+    accounts_file.write_text("token:abcd  # bob\nuser:Alice\n")
+    monkeypatch.chdir(tmp_path)
+    ceg_obj = make_ceg(
+        session, operation="backup_accounts", arg_value=["alice", f"@{accounts_file}", "ghost"]
+    )
+    ceg_obj.backup_dir = str(tmp_path / "mirror")
+    summaries = ceg_obj.backup_accounts(raise_on_failure=False)
+    assert os.getcwd() == str(tmp_path)
+    assert (tmp_path / "mirror" / "alice" / "g1" / "a.txt").read_bytes() == b"alice"
+    assert (tmp_path / "mirror" / "bob" / "g2" / "a.txt").read_bytes() == b"bob"
+    assert summaries["bob"]["gists"] == 1 and summaries["bob"]["error"] is None
+    assert isinstance(summaries["ghost"]["error"], CegExceptions.ResourceNotFound)
+    assert all("abcd" not in str(summary) for summary in summaries.values())
+    # only the token account is paced by a governor of its own
+    assert len(session.governors) == 1
+
+
+def test_session_with_governor_shares_pooled_connections():
+    from ceg.session import CegSession
+    from ceg.ratelimit import RateLimitGovernor
+
+    with CegSession() as session:
+        governor = RateLimitGovernor()
+        governed_session = session.with_governor(governor)
+        assert governed_session.session is session.session
+        assert governed_session.governor is governor and session.governor is not governor
+
+
+def test_patch_only_sends_changed_files(tmp_path):
+    import json
+
+    remote_gist = {
+        "id": "abc",
+        "description": "notes",
+        "files": {
+            "same.txt": {"size": 4, "content": "same"},
+            "changed.txt": {"size": 3, "content": "old"},
+            "large.txt": {"size": 5, "truncated": True, "raw_url": "https://raw/large"},
+            "gone.txt": {"size": 1, "content": "x"},
+        },
+    }
+    session = FakeSession(
+        {
+            "https://api.github.com/gists/abc": FakeResponse(body=json.dumps(remote_gist).encode()),
+            "https://raw/large": FakeResponse(body=b"large"),
+        }
+    )
+    for name, content in (("same.txt", "same"), ("changed.txt", "new!"), ("large.txt", "large")):
+        (tmp_path / name).write_text(content)
+
+    def patch(*files, description=None):
+        session.requests.clear()
+        ceg_obj = make_ceg(
+            session,
+            operation="patch",
+            arg_value=[str(tmp_path / file) for file in files],
+            gist_id="abc",
+            gist_desc=description,
+        )
+        ceg_obj.patch()
+        return [json.loads(kwargs["data"]) for method, _, kwargs in session.requests if method == "patch"]
+
+    (payload,) = patch("same.txt", "changed.txt", "large.txt", "gone.txt->", "same.txt->kept.txt")
+    assert payload == {
+        "files": {
+            "changed.txt": {"content": "new!"},
+            "gone.txt": None,
+            "same.txt": {"filename": "kept.txt"},
+        }
+    }
+    assert patch("same.txt", "large.txt", description="notes") == []
+
+
+def test_sync_transfers_changes_both_ways_and_detects_conflicts(tmp_path):
+    import json
+    import pytest
+    from ceg.exceptions import CegExceptions
+
+    gist_url = "https://api.github.com/gists/abc"
+
+    def gist(revision, **files):
+        return {
+            "id": "abc",
+            "history": [{"version": revision}],
+            "files": {name: {"size": len(content), "content": content} for name, content in files.items()},
+        }
+
+    class GistSession(FakeSession):
+        def request(self, method, url, headers=None, **kwargs):
+            if method == "patch":
+                self.requests.append((method, url, kwargs))
+                return FakeResponse(body=json.dumps(gist("r2")).encode())
+            return super().request(method, url, headers=headers, **kwargs)
+
+    session = GistSession(
+        {gist_url: FakeResponse(body=json.dumps(gist("r1", **{"a.txt": "remote a", "c.txt": "same"})).encode(), headers={"ETag": '"e1"'})}
+    )
+    (tmp_path / "b.txt").write_text("local b")
+    (tmp_path / "c.txt").write_text("same")
+
+    def sync():
+        session.requests.clear()
+        return make_ceg(session, operation="sync", arg_value=[str(tmp_path), "abc"]).sync()
+
+    outcome = sync()
+    assert (outcome["download"], outcome["upload"], outcome["agreed"]) == (["a.txt"], ["b.txt"], ["c.txt"])
+    assert (tmp_path / "a.txt").read_text() == "remote a"
+    assert json.loads(session.requests[-1][2]["data"]) == {"files": {"b.txt": {"content": "local b"}}}
+
+    # nothing changed on either side,only the gist is requested(which is unchanged)
+    session.responses[gist_url] = FakeResponse(
+        body=json.dumps(gist("r2", **{"a.txt": "remote a", "b.txt": "local b", "c.txt": "same"})).encode(),
+        headers={"ETag": '"e2"'},
+    )
+    sync()
+    session.responses[gist_url] = FakeResponse(status_code=304)
+    assert not any(sync()[action] for action in ("upload", "download", "conflicts"))
+    assert len(session.requests) == 1
+
+    (tmp_path / "a.txt").write_text("local edit")
+    (tmp_path / "c.txt").unlink()
+    session.responses[gist_url] = FakeResponse(
+        body=json.dumps(gist("r3", **{"a.txt": "remote edit", "b.txt": "local b", "c.txt": "same"})).encode()
+    )
+    with pytest.raises(CegExceptions.SyncConflict) as conflict:
+        sync()
+    assert conflict.value.conflicts == ["a.txt"]
+    assert (tmp_path / "a.txt").read_text() == "local edit"
+    assert json.loads(session.requests[-1][2]["data"]) == {"files": {"c.txt": None}}